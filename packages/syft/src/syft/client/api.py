@@ -4,9 +4,14 @@ from __future__ import annotations
 # stdlib
 from collections import OrderedDict
 from collections.abc import Callable
+import hashlib
+import hmac
 import inspect
 from inspect import Parameter
 from inspect import signature
+import itertools
+import threading
+import time
 import types
 from typing import Any
 from typing import TYPE_CHECKING
@@ -15,12 +20,17 @@ from typing import get_args
 from typing import get_origin
 
 # third party
+from cachetools import LRUCache
 from nacl.exceptions import BadSignatureError
+from nacl.public import Box
+from nacl.public import PrivateKey
+from nacl.public import PublicKey
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import TypeAdapter
 
 # relative
+from .. import __version__
 from ..abstract_server import AbstractServer
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..protocol.data_protocol import get_data_protocol
@@ -82,6 +92,14 @@ IPYNB_BACKGROUND_METHODS = {
 
 IPYNB_BACKGROUND_PREFIXES = ["_ipy", "_repr", "__ipython", "__pydantic"]
 
+# Number of API schemas kept per process, by ETag, and of endpoint sets, by
+# (server, role, protocol, warnings enabled)
+API_SCHEMA_CACHE_SIZE = 128
+
+_api_schema_cache: LRUCache = LRUCache(maxsize=API_SCHEMA_CACHE_SIZE)
+_role_endpoints_cache: LRUCache = LRUCache(maxsize=API_SCHEMA_CACHE_SIZE)
+_api_cache_lock = threading.Lock()
+
 
 @exclude_from_traceback
 def post_process_result(
@@ -235,6 +253,41 @@ class SignedSyftAPICall(SyftObject):
         return True
 
 
+def api_session_mac(mac_key: bytes, counter: int, serialized_message: bytes) -> bytes:
+    mac = hmac.new(mac_key, counter.to_bytes(8, "big"), hashlib.sha256)
+    mac.update(serialized_message)
+    return mac.digest()
+
+
+@serializable(
+    attrs=["credentials", "session_token", "counter", "mac", "serialized_message"]
+)
+class SessionSyftAPICall(SyftObject):
+    __canonical_name__ = "SessionSyftAPICall"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    # the call is checked by the server, only it can read the session token
+    credentials: SyftVerifyKey
+    session_token: bytes
+    counter: int
+    mac: bytes
+    serialized_message: bytes
+    cached_deseralized_message: SyftAPICall | None = None
+
+    @property
+    def message(self) -> SyftAPICall:
+        # from deserialize we might not have this attr because __init__ is skipped
+        if not hasattr(self, "cached_deseralized_message"):
+            self.cached_deseralized_message = None
+
+        if self.cached_deseralized_message is None:
+            self.cached_deseralized_message = _deserialize(
+                blob=self.serialized_message, from_bytes=True
+            )
+
+        return self.cached_deseralized_message
+
+
 @serializable()
 class SyftAPICall(SyftObject):
     # version
@@ -280,6 +333,63 @@ class SyftAPIData(SyftBaseObject):
         )
 
 
+# share of the ttl of a session after which the client renews it
+API_SESSION_RENEW_AFTER = 0.9
+
+
+class APISession:
+    """
+    A short-lived session with a server. Calls are authenticated with an HMAC
+    keyed by the session key instead of an Ed25519 signature, the counter of each
+    call protects against replays.
+    """
+
+    def __init__(self, token: bytes, mac_key: bytes, ttl: int) -> None:
+        self.token = token
+        self.mac_key = mac_key
+        self.renew_at = time.time() + ttl * API_SESSION_RENEW_AFTER
+        self._counter = itertools.count(1)
+
+    @property
+    def expired(self) -> bool:
+        return time.time() > self.renew_at
+
+    def sign(
+        self, api_call: SyftAPICall, credentials: SyftVerifyKey
+    ) -> SessionSyftAPICall:
+        serialized_message = _serialize(api_call, to_bytes=True)
+        counter = next(self._counter)
+        return SessionSyftAPICall(
+            credentials=credentials,
+            session_token=self.token,
+            counter=counter,
+            mac=api_session_mac(self.mac_key, counter, serialized_message),
+            serialized_message=serialized_message,
+        )
+
+
+class APISessionRegistry:
+    __api_session_registry__: dict[tuple, APISession] = {}
+
+    @classmethod
+    def set_session_for(
+        cls, server_uid: UID, user_verify_key: SyftVerifyKey, session: APISession
+    ) -> None:
+        cls.__api_session_registry__[(server_uid, user_verify_key)] = session
+
+    @classmethod
+    def session_for(
+        cls, server_uid: UID, user_verify_key: SyftVerifyKey
+    ) -> APISession | None:
+        return cls.__api_session_registry__.get((server_uid, user_verify_key))
+
+    @classmethod
+    def remove_session_for(
+        cls, server_uid: UID, user_verify_key: SyftVerifyKey
+    ) -> None:
+        cls.__api_session_registry__.pop((server_uid, user_verify_key), None)
+
+
 class RemoteFunction(SyftObject):
     __canonical_name__ = "RemoteFunction"
     __version__ = SYFT_OBJECT_VERSION_1
@@ -933,22 +1043,88 @@ class SyftAPI(SyftObject):
         communication_protocol: PROTOCOL_TYPE,
         user_verify_key: SyftVerifyKey | None = None,
     ) -> SyftAPI:
-        # relative
-        from ..service.api.api_service import APIService
-
-        # TODO: Maybe there is a possibility of merging ServiceConfig and APIEndpoint
-        from ..service.code.user_code_service import UserCodeService
-
         # find user role by verify_key
         # TODO: we should probably not allow empty verify keys but instead make user always register
         role = server.get_role_for_credentials(user_verify_key)
+        endpoints, lib_endpoints = SyftAPI._endpoints_for_role(
+            server, role, communication_protocol, user_verify_key
+        )
+        user_endpoints = SyftAPI._endpoints_for_user(server, user_verify_key)
+
+        return SyftAPI(
+            server_name=server.name,
+            server_uid=server.id,
+            endpoints={**endpoints, **user_endpoints},
+            lib_endpoints=dict(lib_endpoints),
+            __user_role=role,
+            communication_protocol=communication_protocol,
+        )
+
+    @staticmethod
+    def schema_for_user(
+        server: AbstractServer,
+        communication_protocol: PROTOCOL_TYPE,
+        user_verify_key: SyftVerifyKey | None = None,
+    ) -> tuple[str, bytes]:
+        """
+        The serialized API of a user and its ETag. The ETag changes with the role of
+        the user, the protocol, and the user code and custom API endpoints.
+        """
+        role = server.get_role_for_credentials(user_verify_key)
+        user_endpoints = SyftAPI._endpoints_for_user(server, user_verify_key)
+
+        schema_key = (
+            __version__,
+            server.id,
+            server.name,
+            server.current_protocol,
+            server.enable_warnings,
+            role,
+            communication_protocol,
+        )
+        schema_hash = hashlib.sha256(repr(schema_key).encode())
+        schema_hash.update(_serialize(user_endpoints, to_bytes=True))
+        etag = schema_hash.hexdigest()
+
+        with _api_cache_lock:
+            content = _api_schema_cache.get(etag)
+        if content is None:
+            endpoints, lib_endpoints = SyftAPI._endpoints_for_role(
+                server, role, communication_protocol, user_verify_key
+            )
+            api = SyftAPI(
+                server_name=server.name,
+                server_uid=server.id,
+                endpoints={**endpoints, **user_endpoints},
+                lib_endpoints=lib_endpoints,
+                __user_role=role,
+                communication_protocol=communication_protocol,
+            )
+            content = _serialize(api, to_bytes=True)
+            with _api_cache_lock:
+                _api_schema_cache[etag] = content
+        return etag, content
+
+    @staticmethod
+    def _endpoints_for_role(
+        server: AbstractServer,
+        role: ServiceRole,
+        communication_protocol: PROTOCOL_TYPE,
+        user_verify_key: SyftVerifyKey | None = None,
+    ) -> tuple[dict[str, APIEndpoint], dict[str, LibEndpoint]]:
+        """Service and lib endpoints of `role`, built once per server and protocol."""
+        cache_key = (server.id, role, communication_protocol, server.enable_warnings)
+        with _api_cache_lock:
+            cached = _role_endpoints_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         _user_service_config_registry = UserServiceConfigRegistry.from_role(role)
+        # lib permissions do not depend on the user yet, see `LibConfig.has_permission`
         _user_lib_config_registry = UserLibConfigRegistry.from_user(user_verify_key)
         endpoints: dict[str, APIEndpoint] = {}
         lib_endpoints: dict[str, LibEndpoint] = {}
-        warning_context = WarningContext(
-            server=server, role=role, credentials=user_verify_key
-        )
+        warning_context = WarningContext(server=server, role=role)
 
         # If server uses a higher protocol version than client, then
         # signatures needs to be downgraded.
@@ -1013,6 +1189,23 @@ class SyftAPI(SyftObject):
             )
             lib_endpoints[path] = endpoint
 
+        with _api_cache_lock:
+            _role_endpoints_cache[cache_key] = endpoints, lib_endpoints
+        return endpoints, lib_endpoints
+
+    @staticmethod
+    def _endpoints_for_user(
+        server: AbstractServer, user_verify_key: SyftVerifyKey | None
+    ) -> dict[str, APIEndpoint]:
+        """User code and custom API endpoints, these are read for every request."""
+        # relative
+        from ..service.api.api_service import APIService
+
+        # TODO: Maybe there is a possibility of merging ServiceConfig and APIEndpoint
+        from ..service.code.user_code_service import UserCodeService
+
+        endpoints: dict[str, APIEndpoint] = {}
+
         # 🟡 TODO 35: fix root context
         context = AuthedServiceContext(server=server, credentials=user_verify_key)
         method = server.get_method_with_context(
@@ -1055,21 +1248,68 @@ class SyftAPI(SyftObject):
             )
             endpoints[path] = endpoint
 
-        return SyftAPI(
-            server_name=server.name,
-            server_uid=server.id,
-            endpoints=endpoints,
-            lib_endpoints=lib_endpoints,
-            __user_role=role,
-            communication_protocol=communication_protocol,
-        )
+        return endpoints
 
     @property
     def user_role(self) -> ServiceRole:
         return self.__user_role
 
+    def start_session(self) -> None:
+        """
+        Authenticate the following calls with a short-lived session key instead of
+        signing each of them. The session is renewed before it expires.
+        """
+        self._start_session()
+
+    def end_session(self) -> None:
+        """Sign each call again."""
+        APISessionRegistry.remove_session_for(
+            self.server_uid, self.signing_key.verify_key
+        )
+
+    def _start_session(self) -> APISession:
+        if self.connection is None:
+            raise SyftException(public_message="API connection is None")
+        # the server in front of a proxied server checks calls before forwarding them
+        if getattr(self.connection, "proxy_target_uid", None) is not None:
+            raise SyftException(
+                public_message="API sessions are not supported for proxied connections"
+            )
+
+        private_key = PrivateKey.generate()
+        api_call = SyftAPICall(
+            server_uid=self.server_uid,
+            path="api_session",
+            args=[],
+            kwargs={"public_key": bytes(private_key.public_key)},
+        )
+        signed_result = self.connection.make_call(
+            api_call.sign(credentials=self.signing_key)
+        )
+        result = debox_signed_syftapicall_response(signed_result=signed_result).unwrap()
+        result = post_process_result(result)
+
+        mac_key = Box(private_key, PublicKey(result["public_key"])).shared_key()
+        session = APISession(token=result["token"], mac_key=mac_key, ttl=result["ttl"])
+        APISessionRegistry.set_session_for(
+            self.server_uid, self.signing_key.verify_key, session
+        )
+        return session
+
+    def _sign_call(
+        self, api_call: SyftAPICall
+    ) -> SignedSyftAPICall | SessionSyftAPICall:
+        session = APISessionRegistry.session_for(
+            self.server_uid, self.signing_key.verify_key
+        )
+        if session is None:
+            return api_call.sign(credentials=self.signing_key)
+        if session.expired:
+            session = self._start_session()
+        return session.sign(api_call, credentials=self.signing_key.verify_key)
+
     def make_call(self, api_call: SyftAPICall, cache_result: bool = True) -> Any:
-        signed_call = api_call.sign(credentials=self.signing_key)
+        signed_call = self._sign_call(api_call)
         if self.connection is not None:
             signed_result = self.connection.make_call(signed_call)
         else:
@@ -1085,6 +1325,31 @@ class SyftAPI(SyftObject):
         self.update_api(result)
         return result
 
+    def make_calls(self, api_calls: list[SyftAPICall]) -> list[Any]:
+        """
+        Make `api_calls` in one round trip to the server. The results are in the
+        order of the calls, a failed call returns a `SyftError`.
+        """
+        signed_calls = [self._sign_call(api_call) for api_call in api_calls]
+        if self.connection is not None:
+            signed_results = self.connection.make_calls(signed_calls)
+        else:
+            raise SyftException(public_message="API connection is None")
+
+        results = []
+        for signed_result in signed_results:
+            result = debox_signed_syftapicall_response(
+                signed_result=signed_result
+            ).unwrap()
+            if isinstance(result, SyftResponseMessage):
+                for warning in result.client_warnings:
+                    prompt_warning_message(
+                        message=warning,
+                    )
+            self.update_api(result)
+            results.append(result)
+        return results
+
     def update_api(self, api_call_result: Any) -> None:
         # TODO: hacky stuff with typing and imports to prevent circular imports
         if result_needs_api_update(api_call_result):
@@ -8,8 +8,11 @@ from collections.abc import Generator
 from collections.abc import Iterable
 from enum import Enum
 from getpass import getpass
+import hashlib
 import json
 import logging
+import os
+from pathlib import Path
 import traceback
 from typing import Any
 from typing import TYPE_CHECKING
@@ -55,6 +58,7 @@ from ..types.result import as_result
 from ..types.server_url import ServerURL
 from ..types.syft_object import SYFT_OBJECT_VERSION_1
 from ..types.uid import UID
+from ..util.util import get_root_data_path
 from ..util.util import prompt_warning_message
 from ..util.util import thread_ident
 from ..util.util import verify_tls
@@ -87,6 +91,33 @@ def upgrade_tls(url: ServerURL, response: Response) -> ServerURL:
     return url
 
 
+def api_cache_path(url: str, params: dict[str, Any]) -> Path:
+    key = f"{url}?{sorted(params.items())}"
+    return (
+        get_root_data_path() / API_CACHE_DIR / hashlib.sha256(key.encode()).hexdigest()
+    )
+
+
+def read_api_cache(path: Path) -> tuple[str, bytes] | None:
+    """The ETag and the content of a cached API, or None if there is none."""
+    try:
+        etag, content = path.read_bytes().split(b"\n", 1)
+    except (OSError, ValueError):
+        return None
+    return etag.decode(), content
+
+
+def write_api_cache(path: Path, etag: str, content: bytes) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # other processes of the same user may read the cache while it is written
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(etag.encode() + b"\n" + content)
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.debug(f"Could not cache the API in {path}: {e}")
+
+
 def forward_message_to_proxy(
     make_call: Callable,
     proxy_target_uid: UID,
@@ -122,6 +153,10 @@ DEFAULT_SYFT_UI_PORT = 80
 DEFAULT_SYFT_UI_ADDRESS = f"http://localhost:{DEFAULT_SYFT_UI_PORT}"
 INTERNAL_PROXY_TO_RATHOLE = "http://proxy:80/rtunnel/"
 
+# The last API received from each server, by user, is kept in this directory of
+# the syft data path
+API_CACHE_DIR = "api_cache"
+
 
 class Routes(Enum):
     ROUTE_METADATA = f"{API_PATH}/metadata"
@@ -129,6 +164,7 @@ class Routes(Enum):
     ROUTE_LOGIN = f"{API_PATH}/login"
     ROUTE_REGISTER = f"{API_PATH}/register"
     ROUTE_API_CALL = f"{API_PATH}/api_call"
+    ROUTE_API_CALL_BATCH = f"{API_PATH}/api_call_batch"
     ROUTE_BLOB_STORE = "/blob"
     ROUTE_FORGOT_PASSWORD = f"{API_PATH}/forgot_password"
     ROUTE_RESET_PASSWORD = f"{API_PATH}/reset_password"
@@ -322,6 +358,48 @@ class HTTPConnection(ServerConnection):
 
         return response.content
 
+    def _make_get_api(self, params: dict[str, Any]) -> bytes:
+        """
+        GET the serialized API. The last API of each user is kept on disk and
+        reused while the server's ETag for it does not change.
+        """
+        url = self.url
+
+        if self.rtunnel_token:
+            self.headers = {} if self.headers is None else self.headers
+            url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
+            self.headers["Host"] = self.url.host_or_ip
+
+        url = url.with_path(self.routes.ROUTE_API.value)
+
+        cache_path = api_cache_path(str(self.url), params)
+        cached = read_api_cache(cache_path)
+        headers = dict(self.headers or {})
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        response = self.session.get(
+            str(url),
+            headers=headers,
+            verify=verify_tls(),
+            proxies={},
+            params=params,
+        )
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+        if response.status_code != 200:
+            raise requests.ConnectionError(
+                f"Failed to fetch {url}. Response returned with code {response.status_code}"
+            )
+
+        # upgrade to tls if available
+        self.url = upgrade_tls(self.url, response)
+
+        etag = response.headers.get("ETag")
+        if etag is not None:
+            write_api_cache(cache_path, etag, response.content)
+        return response.content
+
     def stream_data(self, credentials: SyftSigningKey) -> Response:
         url = self.url.with_path(self.routes.STREAM.value)
         response = self.session.get(
@@ -365,7 +443,7 @@ class HTTPConnection(ServerConnection):
                 credentials=credentials,
             )
         else:
-            content = self._make_get(self.routes.ROUTE_API.value, params=params)
+            content = self._make_get_api(params=params)
             obj = _deserialize(content, from_bytes=True)
         obj.connection = self
         obj.signing_key = credentials
@@ -449,21 +527,22 @@ class HTTPConnection(ServerConnection):
             response = post_process_result(response, unwrap_on_success=False)
         return response
 
-    def make_call(self, signed_call: SignedSyftAPICall) -> Any:
-        msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
-
+    def _post_api_call(self, path: str, msg_bytes: bytes) -> Any:
         if self.rtunnel_token:
             api_url = ServerURL.from_url(INTERNAL_PROXY_TO_RATHOLE)
-            api_url = api_url.with_path(self.routes.ROUTE_API_CALL.value)
             self.headers = {} if self.headers is None else self.headers
             self.headers["Host"] = self.url.host_or_ip
         else:
-            api_url = self.api_url
+            api_url = self.url
+        api_url = api_url.with_path(path)
 
-        response = requests.post(  # nosec
-            url=api_url,
+        # the pooled session keeps the connection alive between calls
+        response = self.session.post(
+            str(api_url),
             data=msg_bytes,
             headers=self.headers,
+            verify=verify_tls(),
+            proxies={},
         )
 
         if response.status_code != 200:
@@ -474,6 +553,14 @@ class HTTPConnection(ServerConnection):
         result = _deserialize(response.content, from_bytes=True)
         return result
 
+    def make_call(self, signed_call: SignedSyftAPICall) -> Any:
+        msg_bytes: bytes = _serialize(obj=signed_call, to_bytes=True)
+        return self._post_api_call(self.routes.ROUTE_API_CALL.value, msg_bytes)
+
+    def make_calls(self, signed_calls: list[SignedSyftAPICall]) -> list[Any]:
+        msg_bytes: bytes = _serialize(obj=signed_calls, to_bytes=True)
+        return self._post_api_call(self.routes.ROUTE_API_CALL_BATCH.value, msg_bytes)
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}: {self.url}"
 
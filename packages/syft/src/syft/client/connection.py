@@ -16,6 +16,13 @@ class ServerConnection(SyftObject):
     def get_cache_key(self) -> str:
         raise NotImplementedError
 
+    def make_call(self, signed_call: Any) -> Any:
+        raise NotImplementedError
+
+    def make_calls(self, signed_calls: list) -> list[Any]:
+        # connections without a batch route make the calls one by one
+        return [self.make_call(signed_call) for signed_call in signed_calls]
+
     def __repr__(self) -> str:
         return f"<{type(self).__name__}"
 
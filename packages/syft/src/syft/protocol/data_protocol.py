@@ -1,5 +1,6 @@
 # stdlib
 from collections import defaultdict
+from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import MutableMapping
 from collections.abc import MutableSequence
@@ -29,6 +30,7 @@ from ..service.response import SyftSuccess
 from ..types.dicttuple import DictTuple
 from ..types.errors import SyftException
 from ..types.syft_object import SyftBaseObject
+from ..types.syft_object import SyftMigrationRegistry
 from ..types.syft_object_registry import SyftObjectRegistry
 
 PROTOCOL_STATE_FILENAME = "protocol_version.json"
@@ -110,6 +112,9 @@ class DataProtocol:
         self.state = self.build_state()
         self.diff, self.current = self.diff_state(self.state)
         self.protocol_support = self.calculate_supported_protocols()
+        # derived from the history, computed on first use
+        self._object_versions_for_protocol: dict[str, dict[str, int]] = {}
+        self._migration_chains: dict[tuple[type, int], Callable] = {}
 
     @staticmethod
     def _calculate_object_hash(klass: type[SyftBaseObject]) -> str:
@@ -507,6 +512,52 @@ with same __canonical_name__ and bump the __version__ number. {cls.model_fields}
     def get_object_versions(self, protocol: int | str) -> list:
         return self.protocol_history[str(protocol)]["object_versions"]
 
+    def get_latest_object_versions(self, protocol: PROTOCOL_TYPE) -> dict[str, int]:
+        """Latest version of each object in `protocol`, by canonical name."""
+        protocol = str(protocol)
+        if protocol not in self._object_versions_for_protocol:
+            protocol_state = self.build_state(stop_key=protocol)
+            self._object_versions_for_protocol[protocol] = {
+                canonical_name: max(int(version) for version in versions)
+                for canonical_name, versions in protocol_state.items()
+                if versions
+            }
+        return self._object_versions_for_protocol[protocol]
+
+    def get_migration_chain(
+        self, type_from: type[SyftBaseObject], version_to: int
+    ) -> Callable:
+        """
+        A function migrating objects of `type_from` to `version_to` one version at a
+        time, the migrations are looked up once per type and version.
+        """
+        key = (type_from, version_to)
+        if key not in self._migration_chains:
+            canonical_name = type_from.__canonical_name__
+            current_version = int(type_from.__version__)
+            if current_version > version_to:  # downgrade
+                versions = range(current_version - 1, version_to - 1, -1)
+            else:  # upgrade
+                versions = range(current_version + 1, version_to + 1)
+
+            migrations = []
+            klass = type_from
+            for version in versions:
+                migrations.append(
+                    SyftMigrationRegistry.get_migration_for_version(
+                        type_from=klass, version_to=version
+                    )
+                )
+                klass = SyftObjectRegistry.get_serde_class(canonical_name, version)
+
+            def migration_chain(obj: SyftBaseObject) -> SyftBaseObject:
+                for migration in migrations:
+                    obj = migration(obj, None)
+                return obj
+
+            self._migration_chains[key] = migration_chain
+        return self._migration_chains[key]
+
     @property
     def has_dev(self) -> bool:
         if "dev" in self.protocol_history.keys():
@@ -549,7 +600,9 @@ def check_or_stage_protocol() -> SyftSuccess:
     return data_protocol.check_or_stage_protocol()
 
 
-def debox_arg_and_migrate(arg: Any, protocol_state: dict) -> Any:
+def debox_arg_and_migrate(
+    arg: Any, object_versions: dict[str, int], data_protocol: DataProtocol
+) -> Any:
     """Debox the argument based on whether it is iterable or single entity."""
     constructor = None
     extra_args = []
@@ -578,14 +631,12 @@ def debox_arg_and_migrate(arg: Any, protocol_state: dict) -> Any:
     for key in iterable_keys:
         _object = arg[key]
         if isinstance(_object, SyftBaseObject):
-            current_version = int(_object.__version__)
-            migrate_to_version = int(max(protocol_state[_object.__canonical_name__]))
-            if current_version > migrate_to_version:  # downgrade
-                versions = range(current_version - 1, migrate_to_version - 1, -1)
-            else:  # upgrade
-                versions = range(current_version + 1, migrate_to_version + 1)
-            for version in versions:
-                _object = _object.migrate_to(version)
+            migrate_to_version = object_versions[_object.__canonical_name__]
+            if int(_object.__version__) != migrate_to_version:
+                migration_chain = data_protocol.get_migration_chain(
+                    type(_object), migrate_to_version
+                )
+                _object = migration_chain(_object)
         arg[key] = _object
 
     wrapped_arg = arg[0] if single_entity else arg
@@ -619,21 +670,23 @@ def migrate_args_and_kwargs(
     if to_protocol == data_protocol.latest_version:
         return args, kwargs
 
-    protocol_state = data_protocol.build_state(stop_key=str(to_protocol))
+    object_versions = data_protocol.get_latest_object_versions(to_protocol)
 
     migrated_kwargs, migrated_args = {}, []
 
     for param_name, param_val in kwargs.items():
         migrated_val = debox_arg_and_migrate(
             arg=param_val,
-            protocol_state=protocol_state,
+            object_versions=object_versions,
+            data_protocol=data_protocol,
         )
         migrated_kwargs[param_name] = migrated_val
 
     for arg in args:
         migrated_val = debox_arg_and_migrate(
             arg=arg,
-            protocol_state=protocol_state,
+            object_versions=object_versions,
+            data_protocol=data_protocol,
         )
         migrated_args.append(migrated_val)
 
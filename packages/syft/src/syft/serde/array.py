@@ -4,8 +4,10 @@ from numpy import frombuffer
 
 # relative
 from ..types.syft_object import SYFT_OBJECT_VERSION_1
+from ..types.syft_object import SYFT_OBJECT_VERSION_2
 from .arrow import numpy_deserialize
 from .arrow import numpy_serialize
+from .arrow import numpy_serialize_v1
 from .recursive import recursive_serde_register
 
 SUPPORTED_BOOL_TYPES = [np.bool_]
@@ -34,14 +36,23 @@ DTYPE_REFACTOR = {
     np.dtype("uint64"): np.int64,
 }
 
+# version 1 encodes string arrays as one uint64 per utf-8 byte, kept for reading
 recursive_serde_register(
     np.ndarray,
-    serialize=numpy_serialize,
+    serialize=numpy_serialize_v1,
     deserialize=numpy_deserialize,
     canonical_name="numpy_ndarray",
     version=SYFT_OBJECT_VERSION_1,
 )
 
+recursive_serde_register(
+    np.ndarray,
+    serialize=numpy_serialize,
+    deserialize=numpy_deserialize,
+    canonical_name="numpy_ndarray",
+    version=SYFT_OBJECT_VERSION_2,
+)
+
 recursive_serde_register(
     np._globals._NoValueType,
     canonical_name="numpy_no_value",
@@ -8,9 +8,15 @@ import pyarrow as pa
 # relative
 from ..util.experimental_flags import ApacheArrowCompression
 from ..util.experimental_flags import flags
+from .buffers import OutOfBandBuffer
+from .buffers import out_of_band_enabled
+from .buffers import read_buffer
+from .buffers import write_buffer
 from .deserialize import _deserialize
 from .serialize import _serialize
 
+STRING_ARRAY_CODEC = "arrow_large_string"
+
 
 def arrow_serialize(obj: np.ndarray) -> bytes:
     # inner function to make sure variables go out of scope after this
@@ -34,7 +40,7 @@ def arrow_serialize(obj: np.ndarray) -> bytes:
 
 
 def arrow_deserialize(
-    numpy_bytes: bytes, decompressed_size: int, dtype: str
+    numpy_bytes: bytes | bytearray, decompressed_size: int, dtype: str
 ) -> np.ndarray:
     original_dtype = np.dtype(dtype)
     if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.NONE:
@@ -113,17 +119,100 @@ def arraytonumpyutf8(string_list: str | np.ndarray) -> bytes:
     return cast(bytes, _serialize(output_array, to_bytes=True))
 
 
+def arrow_ipc_compression() -> str | None:
+    # arrow IPC only supports zstd and lz4 frame compression
+    if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.ZSTD:
+        return "zstd"
+    if flags.APACHE_ARROW_COMPRESSION is ApacheArrowCompression.LZ4:
+        return "lz4"
+    return None
+
+
+def string_array_serialize(obj: np.ndarray) -> bytes:
+    """Encodes a string NumpyArray as an Arrow large_string array.
+
+    The Arrow layout is a buffer of utf-8 bytes plus an int64 offsets buffer,
+    both encoded and decoded in C rather than per element in Python.
+
+    Args:
+        obj (np.ndarray): string NumpyArray to be encoded
+
+    Returns:
+        bytes: serialized tuple of the codec name, Arrow IPC stream and shape
+    """
+    # numpy converts to 32-bit offset strings only, chunking above 2GB
+    values = pa.array(np.ascontiguousarray(obj).reshape(-1)).cast(pa.large_string())
+    table = pa.table({"values": values})
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=arrow_ipc_compression())
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    buffer = sink.getvalue()
+
+    data = write_buffer(buffer) if out_of_band_enabled() else buffer.to_pybytes()
+    return cast(bytes, _serialize((STRING_ARRAY_CODEC, data, obj.shape), to_bytes=True))
+
+
+def string_array_deserialize(
+    data: bytes | OutOfBandBuffer, shape: tuple[int, ...]
+) -> np.ndarray:
+    """Decodes an Arrow large_string encoded array to string NumpyArray.
+
+    Args:
+        data (bytes | OutOfBandBuffer): Arrow IPC stream
+        shape (tuple[int, ...]): shape of the original array
+
+    Returns:
+        np.ndarray: decoded NumpyArray.
+    """
+    buffer = read_buffer(data) if isinstance(data, OutOfBandBuffer) else data
+    with pa.ipc.open_stream(pa.py_buffer(buffer)) as reader:
+        values = reader.read_all().column("values")
+    return np.array(values.to_numpy(zero_copy_only=False), dtype=np.str_).reshape(shape)
+
+
+def numpy_out_of_band_serialize(obj: np.ndarray) -> bytes:
+    contiguous = np.ascontiguousarray(obj)
+    ref = write_buffer(
+        contiguous.reshape(-1).view(np.uint8),
+        dtype=contiguous.dtype.str,
+        shape=contiguous.shape,
+    )
+    return cast(bytes, _serialize(ref, to_bytes=True))
+
+
+def numpy_out_of_band_deserialize(ref: OutOfBandBuffer) -> np.ndarray:
+    buffer = read_buffer(ref)
+    np_array = np.frombuffer(buffer, dtype=np.dtype(ref.dtype)).reshape(ref.shape)
+    if not np_array.flags.writeable:
+        # immutable source buffer (e.g. bytes), keep the array writeable
+        np_array = np_array.copy()
+    return np_array
+
+
 def numpy_serialize(obj: np.ndarray) -> bytes:
-    if obj.dtype.type != np.str_:
-        return arrow_serialize(obj)
+    if obj.dtype.type == np.str_:
+        return string_array_serialize(obj)
+    elif out_of_band_enabled() and not obj.dtype.hasobject:
+        return numpy_out_of_band_serialize(obj)
     else:
+        return arrow_serialize(obj)
+
+
+def numpy_serialize_v1(obj: np.ndarray) -> bytes:
+    if obj.dtype.type == np.str_:
         return arraytonumpyutf8(obj)
+    return numpy_serialize(obj)
 
 
-def numpy_deserialize(buf: bytes) -> np.ndarray:
+def numpy_deserialize(buf: bytes | bytearray | memoryview) -> np.ndarray:
     deser = _deserialize(buf, from_bytes=True)
-    if isinstance(deser, tuple):
+    if isinstance(deser, tuple) and deser[0] == STRING_ARRAY_CODEC:
+        return string_array_deserialize(*deser[1:])
+    elif isinstance(deser, tuple):
         return arrow_deserialize(*deser)
+    elif isinstance(deser, OutOfBandBuffer):
+        return numpy_out_of_band_deserialize(deser)
     elif isinstance(deser, np.ndarray):
         return numpyutf8toarray(deser)
     else:
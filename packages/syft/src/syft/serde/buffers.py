@@ -0,0 +1,235 @@
+# stdlib
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import io
+import struct
+from typing import Any
+from typing import BinaryIO
+
+# relative
+from .serializable import serializable
+from .util import read_exactly
+
+# Out-of-band buffers, in the spirit of pickle protocol 5.
+#
+# When a `buffer_callback` is passed to `serialize`, serializers of large array
+# types (np.ndarray, pd.DataFrame, pa.Table) hand their raw memory to the
+# callback and only write a small `OutOfBandBuffer` descriptor into the capnp
+# message. `deserialize(..., buffers=...)` resolves the descriptors against the
+# same list of buffers, wrapping them without copying where possible.
+#
+# The framed layout bundles the message and its buffers into one blob:
+#
+#   MAGIC | n_frames (uint64) | n_frames * frame length (uint64) | frames
+#
+# where every frame starts at a FRAME_ALIGNMENT byte boundary, so numeric
+# arrays can be viewed in place.
+
+FRAMED_MAGIC = b"SYFTOOB1"
+FRAME_ALIGNMENT = 64
+
+_buffer_callback: ContextVar[Callable[[Any], None] | None] = ContextVar(
+    "_buffer_callback", default=None
+)
+_buffer_count: ContextVar[list[int] | None] = ContextVar("_buffer_count", default=None)
+_buffers: ContextVar[list[Any] | None] = ContextVar("_buffers", default=None)
+
+
+@serializable(
+    attrs=["index", "dtype", "shape"],
+    canonical_name="OutOfBandBuffer",
+    version=1,
+)
+class OutOfBandBuffer:
+    """Reference to a raw buffer that was transferred outside the capnp message."""
+
+    index: int
+    dtype: str | None
+    shape: tuple[int, ...] | None
+
+    def __init__(
+        self,
+        index: int,
+        dtype: str | None = None,
+        shape: tuple[int, ...] | None = None,
+    ) -> None:
+        self.index = index
+        self.dtype = dtype
+        self.shape = shape
+
+
+@contextmanager
+def buffer_callback_context(buffer_callback: Callable[[Any], None]) -> Iterator:
+    callback_token = _buffer_callback.set(buffer_callback)
+    count_token = _buffer_count.set([0])
+    try:
+        yield
+    finally:
+        _buffer_callback.reset(callback_token)
+        _buffer_count.reset(count_token)
+
+
+@contextmanager
+def buffers_context(buffers: list[Any]) -> Iterator:
+    token = _buffers.set(list(buffers))
+    try:
+        yield
+    finally:
+        _buffers.reset(token)
+
+
+def out_of_band_enabled() -> bool:
+    return _buffer_callback.get() is not None
+
+
+def write_buffer(
+    buffer: Any, dtype: str | None = None, shape: tuple[int, ...] | None = None
+) -> OutOfBandBuffer:
+    """Hand `buffer` to the active buffer callback and return its descriptor."""
+    buffer_callback = _buffer_callback.get()
+    count = _buffer_count.get()
+    if buffer_callback is None or count is None:
+        raise ValueError("No buffer_callback set, cannot write out-of-band buffer")
+    index = count[0]
+    count[0] += 1
+    buffer_callback(buffer)
+    return OutOfBandBuffer(index=index, dtype=dtype, shape=shape)
+
+
+def read_buffer(ref: OutOfBandBuffer) -> memoryview:
+    buffers = _buffers.get()
+    if buffers is None:
+        raise ValueError(
+            f"Out-of-band buffer {ref.index} referenced, but no buffers were passed"
+            " to deserialize"
+        )
+    if ref.index >= len(buffers):
+        raise ValueError(
+            f"Out-of-band buffer {ref.index} referenced, but only {len(buffers)}"
+            " buffers were passed to deserialize"
+        )
+    return memoryview(buffers[ref.index])
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // FRAME_ALIGNMENT) * FRAME_ALIGNMENT
+
+
+class FramedStream(io.BufferedIOBase):
+    """Read-only file-like view over a list of frames, laid out as a framed blob.
+
+    Frames are never concatenated in memory, reads copy straight out of the
+    frame buffers.
+    """
+
+    def __init__(self, frames: list[Any]) -> None:
+        frames = [memoryview(frame).cast("B") for frame in frames]
+        lengths = [frame.nbytes for frame in frames]
+        header = FRAMED_MAGIC + struct.pack(
+            f"<{len(lengths) + 1}Q", len(lengths), *lengths
+        )
+
+        # (offset, view) of every segment, padding included
+        self._segments: list[tuple[int, memoryview]] = [(0, memoryview(header))]
+        offset = len(header)
+        for frame in frames:
+            start = _aligned(offset)
+            if start > offset:
+                self._segments.append((offset, memoryview(bytes(start - offset))))
+            self._segments.append((start, frame))
+            offset = start + frame.nbytes
+        self.size = offset
+        self._position = 0
+        self._segment = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def _iter_views(self, size: int | None) -> Iterator[memoryview]:
+        remaining = self.size - self._position
+        size = remaining if size is None or size < 0 else min(size, remaining)
+        while size > 0:
+            start, segment = self._segments[self._segment]
+            segment_offset = self._position - start
+            n = min(size, segment.nbytes - segment_offset)
+            yield segment[segment_offset : segment_offset + n]
+            size -= n
+            self._position += n
+            if segment_offset + n == segment.nbytes:
+                self._segment += 1
+
+    def read(self, size: int | None = -1) -> bytes:
+        return b"".join(self._iter_views(size))
+
+    def read1(self, size: int | None = -1) -> bytes:
+        return self.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        out = memoryview(buffer).cast("B")
+        written = 0
+        for view in self._iter_views(out.nbytes):
+            out[written : written + view.nbytes] = view
+            written += view.nbytes
+        return written
+
+
+def serialize_framed(obj: Any) -> FramedStream:
+    # relative
+    from .serialize import _serialize
+
+    buffers: list[Any] = []
+    message = _serialize(obj, to_bytes=True, buffer_callback=buffers.append)
+    return FramedStream([message, *buffers])
+
+
+def is_framed(blob: bytes | bytearray | memoryview) -> bool:
+    return blob[: len(FRAMED_MAGIC)] == FRAMED_MAGIC
+
+
+def split_frames(blob: bytes | bytearray | memoryview) -> list[memoryview]:
+    view = memoryview(blob).cast("B")
+    offset = len(FRAMED_MAGIC)
+    (n_frames,) = struct.unpack_from("<Q", view, offset)
+    offset += 8
+    lengths = struct.unpack_from(f"<{n_frames}Q", view, offset)
+    offset += 8 * n_frames
+
+    frames = []
+    for length in lengths:
+        start = _aligned(offset)
+        frames.append(view[start : start + length])
+        offset = start + length
+    return frames
+
+
+def deserialize_framed(blob: bytes | bytearray | memoryview) -> Any:
+    # relative
+    from .deserialize import _deserialize
+
+    message, *buffers = split_frames(blob)
+    return _deserialize(message, from_bytes=True, buffers=buffers)
+
+
+def deserialize_framed_from_file(fp: BinaryIO) -> Any:
+    """Read a framed blob whose magic prefix was already consumed from `fp`.
+
+    Every frame is read into its own writeable buffer.
+    """
+    # relative
+    from .deserialize import _deserialize
+
+    (n_frames,) = struct.unpack("<Q", read_exactly(fp, 8))
+    lengths = struct.unpack(f"<{n_frames}Q", read_exactly(fp, 8 * n_frames))
+    offset = len(FRAMED_MAGIC) + 8 + 8 * n_frames
+
+    frames = []
+    for length in lengths:
+        start = _aligned(offset)
+        read_exactly(fp, start - offset)
+        frames.append(read_exactly(fp, length))
+        offset = start + length
+
+    message, *buffers = frames
+    return _deserialize(message, from_bytes=True, buffers=buffers)
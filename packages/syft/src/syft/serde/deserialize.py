@@ -1,21 +1,55 @@
 # stdlib
 from typing import Any
+from typing import BinaryIO
 
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
 
 
 def _deserialize(
-    blob: Any,
+    blob: Any = None,
     from_proto: bool = True,
     from_bytes: bool = False,
+    buffers: list[Any] | None = None,
+    from_file: BinaryIO | None = None,
+    trusted: bool = False,
 ) -> Any:
     # relative
+    from .buffers import buffers_context
+    from .buffers import deserialize_framed
+    from .buffers import deserialize_framed_from_file
+    from .buffers import is_framed
     from .recursive import rs_bytes2object
     from .recursive import rs_proto2object
+    from .recursive import rs_segments2object
+    from .recursive import trusted_deserialization
+    from .util import read_exactly
+    from .util import read_proto_segments
+
+    if trusted:
+        with trusted_deserialization():
+            return _deserialize(
+                blob,
+                from_proto=from_proto,
+                from_bytes=from_bytes,
+                buffers=buffers,
+                from_file=from_file,
+            )
+
+    if buffers is not None:
+        with buffers_context(buffers):
+            return _deserialize(
+                blob, from_proto=from_proto, from_bytes=from_bytes, from_file=from_file
+            )
+
+    if from_file is not None:
+        first_word = read_exactly(from_file, 8)
+        if is_framed(first_word):
+            return deserialize_framed_from_file(from_file)
+        return rs_segments2object(read_proto_segments(from_file, first_word))
 
     if (
-        (from_bytes and not isinstance(blob, bytes))
+        (from_bytes and not isinstance(blob, bytes | bytearray | memoryview))
         or (
             from_proto
             and not from_bytes
@@ -26,6 +60,8 @@ def _deserialize(
         raise TypeError("Wrong deserialization format.")
 
     if from_bytes:
+        if is_framed(blob):
+            return deserialize_framed(blob)
         return rs_bytes2object(blob)
 
     if from_proto:
@@ -0,0 +1,118 @@
+# stdlib
+from collections.abc import Callable
+from hashlib import sha256
+from types import FunctionType
+from types import NoneType
+from typing import Any
+import weakref
+
+# relative
+from ..types.syft_object_registry import SyftObjectRegistry
+from .serialize import _serialize
+
+# Content hashes of SyftHashableObjects, Merkle style: the hash of an object
+# covers its canonical name, version and the hashes of its hashed fields, and
+# the hash of a hashable field is the (cached) content hash of that object.
+#
+# Hashes are cached per instance, keyed by id() and dropped when the object is
+# garbage collected. Setting an attribute invalidates the cache of the object,
+# parents revalidate against the current hashes of their hashable children.
+# In place mutations of containers (eg. list.append) are not tracked.
+
+# id(obj) -> (digest, [(child, digest of child), ...]), None if invalidated
+_content_hashes: dict[int, tuple[bytes, list[tuple[Any, bytes]]] | None] = {}
+
+_PRIMITIVE_ENCODERS: dict[type, Callable[[Any], bytes]] = {
+    str: lambda value: value.encode("utf-8"),
+    bytes: lambda value: value,
+    bool: lambda value: b"1" if value else b"0",
+    int: lambda value: str(value).encode(),
+    float: lambda value: repr(value).encode(),
+    NoneType: lambda value: b"",
+}
+
+
+def _is_hashable_object(value: Any) -> bool:
+    return hasattr(type(value), "__sha256__")
+
+
+def invalidate_content_hash(obj: Any) -> None:
+    obj_id = id(obj)
+    if obj_id in _content_hashes:
+        _content_hashes[obj_id] = None
+
+
+def _cache(obj: Any, digest: bytes, children: list[tuple[Any, bytes]]) -> None:
+    obj_id = id(obj)
+    if obj_id not in _content_hashes:
+        try:
+            weakref.finalize(obj, _content_hashes.pop, obj_id, None)
+        except TypeError:
+            # not weak referenceable, can't tell when the id is reused
+            return
+    _content_hashes[obj_id] = (digest, children)
+
+
+def content_hash(obj: Any) -> bytes:
+    """sha256 content hash of a SyftHashableObject, computed once per instance."""
+    cacheable = getattr(type(obj), "__cache_content_hash__", False)
+    if cacheable:
+        entry = _content_hashes.get(id(obj))
+        if entry is not None:
+            digest, children = entry
+            if all(content_hash(child) == d for child, d in children):
+                return digest
+
+    children: list[tuple[Any, bytes]] = []
+    digest = _object_digest(obj, children)
+    if cacheable:
+        _cache(obj, digest, children)
+    return digest
+
+
+def _object_digest(obj: Any, children: list[tuple[Any, bytes]]) -> bytes:
+    canonical_name, version = SyftObjectRegistry.get_canonical_name_version(obj)
+    serde_properties = SyftObjectRegistry.get_serde_properties(canonical_name, version)
+    nonrecursive, serde_plan = serde_properties[0], serde_properties[10]
+    if nonrecursive:
+        return sha256(_serialize(obj, to_bytes=True, for_hashing=True)).digest()
+
+    hasher = sha256(f"{canonical_name}\0{version}".encode())
+    encoders = serde_plan.encoders
+    for attr_name in serde_plan.encode_fields(obj, for_hashing=True):
+        value = getattr(obj, attr_name)
+        if attr_name in encoders:
+            value = encoders[attr_name](value)
+        if isinstance(value, FunctionType):
+            continue
+        hasher.update(attr_name.encode() + b"\0")
+        hasher.update(_value_digest(value, children))
+    return hasher.digest()
+
+
+def _value_digest(value: Any, children: list[tuple[Any, bytes]]) -> bytes:
+    value_type = type(value)
+
+    encoder = _PRIMITIVE_ENCODERS.get(value_type)
+    if encoder is not None:
+        return sha256(value_type.__name__.encode() + b"\0" + encoder(value)).digest()
+
+    if _is_hashable_object(value):
+        digest = content_hash(value)
+        children.append((value, digest))
+        return digest
+
+    if value_type is list or value_type is tuple:
+        hasher = sha256(value_type.__name__.encode())
+        for item in value:
+            hasher.update(_value_digest(item, children))
+        return hasher.digest()
+
+    if value_type is dict:
+        hasher = sha256(b"dict")
+        for key, item in value.items():
+            hasher.update(_value_digest(key, children))
+            hasher.update(_value_digest(item, children))
+        return hasher.digest()
+
+    return sha256(_serialize(value, to_bytes=True, for_hashing=True)).digest()
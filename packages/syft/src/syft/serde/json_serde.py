@@ -57,6 +57,29 @@ class JSONSerde(Generic[T]):
 
 JSON_SERDE_REGISTRY: dict[type[T], JSONSerde[T]] = {}
 
+# Codecs are compiled once per annotation (and per pydantic class) into a tree of
+# closures, so the annotation is only inspected the first time it is seen.
+JsonEncoder = Callable[[Any], Json]
+JsonDecoder = Callable[[Json], Any]
+
+_JSON_PRIMITIVE_TYPES = {str, int, float, bool, type(None)}
+
+# (annotation, validate) -> encoder
+_ENCODERS: dict[tuple[Any, bool], JsonEncoder] = {}
+# annotation -> decoder
+_DECODERS: dict[Any, JsonDecoder] = {}
+# (pydantic class, validate) -> encoder
+_MODEL_ENCODERS: dict[tuple[type, bool], JsonEncoder] = {}
+# pydantic class -> decoder
+_MODEL_DECODERS: dict[type, Callable[[dict[str, Json]], pydantic.BaseModel]] = {}
+
+
+def _clear_codecs() -> None:
+    _ENCODERS.clear()
+    _DECODERS.clear()
+    _MODEL_ENCODERS.clear()
+    _MODEL_DECODERS.clear()
+
 
 def register_json_serde(
     type_: type[T],
@@ -77,6 +100,8 @@ def register_json_serde(
         serialize_fn=serialize,
         deserialize_fn=deserialize,
     )
+    # compiled codecs may have resolved this type differently
+    _clear_codecs()
 
 
 # Standard JSON primitives
@@ -158,33 +183,11 @@ def _annotation_issubclass(annotation: Any, cls: type) -> bool:
         return False
 
 
-def _serialize_pydantic_to_json(obj: pydantic.BaseModel) -> dict[str, Json]:
-    canonical_name, version = SyftObjectRegistry.get_canonical_name_version(obj)
-    serde_attributes = SyftObjectRegistry.get_serde_properties(canonical_name, version)
-    exclude_attrs = serde_attributes[4]
-
-    result: dict[str, Json] = {
-        JSON_CANONICAL_NAME_FIELD: canonical_name,
-        JSON_VERSION_FIELD: version,
-    }
-
-    all_exclude_attrs = set(exclude_attrs) | DEFAULT_EXCLUDE_ATTRS
-
-    for key, type_ in obj.model_fields.items():
-        if key in all_exclude_attrs:
-            continue
-        result[key] = serialize_json(getattr(obj, key), type_.annotation)
-
-    result = _add_searchable_and_unique_attrs(obj, result, raise_errors=False)
-
-    return result
-
-
 def get_property_return_type(obj: Any, attr_name: str) -> Any:
     """
-    Get the return type annotation of a @property.
+    Get the return type annotation of a @property, for an object or its class.
     """
-    cls = type(obj)
+    cls = obj if isinstance(obj, type) else type(obj)
     attr = getattr(cls, attr_name, None)
 
     if isinstance(attr, property):
@@ -193,67 +196,6 @@ def get_property_return_type(obj: Any, attr_name: str) -> Any:
     return None
 
 
-def _add_searchable_and_unique_attrs(
-    obj: pydantic.BaseModel, obj_dict: dict[str, Json], raise_errors: bool = True
-) -> dict[str, Json]:
-    """
-    Add searchable attrs and unique attrs to the serialized object dict, if they are not already present.
-    Needed for adding non-field attributes (like @property)
-
-    Args:
-        obj (pydantic.BaseModel): Object to serialize.
-        obj_dict (dict[str, Json]): Serialized object dict. Should contain the object's fields.
-        raise_errors (bool, optional): Raise errors if an attribute cannot be accessed.
-            If False, the attribute will be skipped. Defaults to True.
-
-    Raises:
-        Exception: Any exception raised when accessing an attribute.
-
-    Returns:
-        dict[str, Json]: Serialized object dict including searchable attributes.
-    """
-    searchable_attrs: list[str] = getattr(obj, "__attr_searchable__", [])
-    unique_attrs: list[str] = getattr(obj, "__attr_unique__", [])
-
-    attrs_to_add = set(searchable_attrs) | set(unique_attrs)
-    for attr in attrs_to_add:
-        if attr not in obj_dict:
-            try:
-                value = getattr(obj, attr)
-            except Exception as e:
-                if raise_errors:
-                    raise e
-                else:
-                    continue
-            property_annotation = get_property_return_type(obj, attr)
-            obj_dict[attr] = serialize_json(
-                value, validate=False, annotation=property_annotation
-            )
-
-    return obj_dict
-
-
-def _deserialize_pydantic_from_json(
-    obj_dict: dict[str, Json],
-) -> pydantic.BaseModel:
-    try:
-        canonical_name = obj_dict[JSON_CANONICAL_NAME_FIELD]
-        version = obj_dict[JSON_VERSION_FIELD]
-        obj_type = SyftObjectRegistry.get_serde_class(canonical_name, version)
-
-        result = {}
-        for key, type_ in obj_type.model_fields.items():
-            if key not in obj_dict:
-                continue
-            result[key] = deserialize_json(obj_dict[key], type_.annotation)
-
-        return obj_type.model_validate(result)
-    except Exception as e:
-        print(f"Failed to deserialize Pydantic model: {e}")
-        print(json.dumps(obj_dict, indent=2))
-        raise ValueError(f"Failed to deserialize Pydantic model: {e}")
-
-
 def _is_serializable_iterable(annotation: Any) -> bool:
     # we can only serialize typed iterables without Union/Any
     # NOTE optional is allowed
@@ -273,24 +215,6 @@ def _is_serializable_iterable(annotation: Any) -> bool:
     )
 
 
-def _serialize_iterable_to_json(value: Any, annotation: Any) -> Json:
-    # No need to validate in recursive calls
-    return [serialize_json(v, validate=False) for v in value]
-
-
-def _deserialize_iterable_from_json(value: Json, annotation: Any) -> Any:
-    if not isinstance(value, list):
-        raise ValueError(f"Cannot deserialize {type(value)} to {annotation}")
-
-    annotation = _unwrap_type_annotation(annotation)
-
-    if not _is_serializable_iterable(annotation):
-        raise ValueError(f"Cannot deserialize {annotation} from JSON")
-
-    inner_type = _unwrap_type_annotation(get_args(annotation)[0])
-    return [deserialize_json(v, inner_type) for v in value]
-
-
 def _is_serializable_mapping(annotation: Any) -> bool:
     """
     Mapping is serializable if:
@@ -317,33 +241,275 @@ def _is_serializable_mapping(annotation: Any) -> bool:
     )
 
 
-def _serialize_mapping_to_json(value: Any, annotation: Any) -> Json:
-    _, value_type = get_args(annotation)
-    # No need to validate in recursive calls
-    return {k: serialize_json(v, value_type, validate=False) for k, v in value.items()}
+def _serialize_to_json_bytes(obj: Any) -> str:
+    obj_bytes = sy.serialize(obj, to_bytes=True)
+    return base64.b64encode(obj_bytes).decode("utf-8")
 
 
-def _deserialize_mapping_from_json(value: Json, annotation: Any) -> Any:
-    if not isinstance(value, dict):
-        raise ValueError(f"Cannot deserialize {type(value)} to {annotation}")
+def _deserialize_from_json_bytes(obj: str) -> Any:
+    obj_bytes = base64.b64decode(obj)
+    return sy.deserialize(obj_bytes, from_bytes=True)
 
-    annotation = _unwrap_type_annotation(annotation)
 
-    if not _is_serializable_mapping(annotation):
-        raise ValueError(f"Cannot deserialize {annotation} from JSON")
+def _get_codec(cache: dict, key: Any, compile_fn: Callable[[], Any]) -> Any:
+    try:
+        return cache[key]
+    except KeyError:
+        codec = cache[key] = compile_fn()
+        return codec
+    except TypeError:
+        # unhashable annotation, eg. Annotated with unhashable metadata
+        return compile_fn()
 
-    _, value_type = get_args(annotation)
-    return {k: deserialize_json(v, value_type) for k, v in value.items()}
 
+def _get_encoder(annotation: Any, validate: bool) -> JsonEncoder:
+    return _get_codec(
+        _ENCODERS,
+        (annotation, validate),
+        lambda: _compile_encoder(annotation, validate),
+    )
 
-def _serialize_to_json_bytes(obj: Any) -> str:
-    obj_bytes = sy.serialize(obj, to_bytes=True)
-    return base64.b64encode(obj_bytes).decode("utf-8")
 
+def _get_decoder(annotation: Any) -> JsonDecoder:
+    return _get_codec(_DECODERS, annotation, lambda: _compile_decoder(annotation))
 
-def _deserialize_from_json_bytes(obj: str) -> Any:
-    obj_bytes = base64.b64decode(obj)
-    return sy.deserialize(obj_bytes, from_bytes=True)
+
+def _encode_by_type(value: Any, validate: bool) -> Json:
+    return _get_encoder(type(value), validate)(value)
+
+
+def _checked_encoder(encode: JsonEncoder) -> JsonEncoder:
+    # Results of the other encoders are valid JSON by construction, so only the
+    # leaves returned by registered serializers need to be checked.
+    def encode_checked(value: Any) -> Json:
+        result = encode(value)
+        if type(result) not in _JSON_PRIMITIVE_TYPES:
+            _validate_json(result)
+        return result
+
+    return encode_checked
+
+
+def _unwrap_codec_annotation(annotation: Any) -> Any:
+    # Remove None type from annotation if it is present.
+    if annotation is type(None):
+        # only None values are serialized with this annotation
+        return annotation
+    return _unwrap_type_annotation(annotation)
+
+
+def _compile_encoder(annotation: Any, validate: bool) -> JsonEncoder:
+    annotation = _unwrap_codec_annotation(annotation)
+
+    encode: JsonEncoder
+    if annotation in JSON_SERDE_REGISTRY:
+        encode = JSON_SERDE_REGISTRY[annotation].serialize_fn
+        if validate:
+            encode = _checked_encoder(encode)
+    elif _annotation_issubclass(annotation, pydantic.BaseModel):
+
+        def encode(value: Any) -> Json:
+            return _get_model_encoder(type(value), validate)(value)
+
+    elif _annotation_issubclass(annotation, Enum):
+        enum_type = annotation
+
+        def encode(value: Any) -> Json:
+            # the name of another enum would not decode back to this annotation
+            if validate and not isinstance(value, enum_type):
+                raise TypeError(f"Expected {enum_type.__name__}, got {value!r}")
+            return value.name
+
+    # JSON recursive types
+    # only strictly annotated iterables and mappings are supported
+    # example: list[int] is supported, but not list[int | str]
+    elif _is_serializable_iterable(annotation):
+
+        def encode(value: Any) -> Json:
+            return [_encode_by_type(v, validate) for v in value]
+
+    elif _is_serializable_mapping(annotation):
+        _, value_type = get_args(annotation)
+        encode_value = _get_encoder(value_type, validate)
+
+        def encode(value: Any) -> Json:
+            return {k: encode_value(v) for k, v in value.items()}
+
+    else:
+        encode = _serialize_to_json_bytes
+
+    def encode_optional(value: Any) -> Json:
+        if value is None:
+            return None
+        return encode(value)
+
+    return encode_optional
+
+
+def _compile_decoder(annotation: Any) -> JsonDecoder:
+    annotation = _unwrap_codec_annotation(annotation)
+
+    decode: JsonDecoder
+    if annotation in JSON_SERDE_REGISTRY:
+        decode = JSON_SERDE_REGISTRY[annotation].deserialize_fn
+    elif _annotation_issubclass(annotation, pydantic.BaseModel):
+        decode = _deserialize_pydantic_from_json  # type: ignore
+    elif _annotation_issubclass(annotation, Enum):
+
+        def decode(value: Json) -> Any:
+            return annotation[value]
+
+    else:
+        decode = _compile_collection_decoder(annotation)
+
+    def decode_optional(value: Json) -> Any:
+        if (
+            isinstance(value, dict)
+            and JSON_CANONICAL_NAME_FIELD in value
+            and JSON_VERSION_FIELD in value
+        ):
+            return _deserialize_pydantic_from_json(value)
+        if value is None:
+            return None
+        return decode(value)
+
+    return decode_optional
+
+
+def _compile_collection_decoder(annotation: Any) -> JsonDecoder:
+    decode_list: JsonDecoder | None = None
+    if _is_serializable_iterable(annotation):
+        decode_item = _get_decoder(_unwrap_type_annotation(get_args(annotation)[0]))
+
+        def decode_list(value: Json) -> Any:
+            return [decode_item(v) for v in value]  # type: ignore
+
+    decode_dict: JsonDecoder | None = None
+    if _is_serializable_mapping(annotation):
+        _, value_type = get_args(annotation)
+        decode_value = _get_decoder(value_type)
+
+        def decode_dict(value: Json) -> Any:
+            return {k: decode_value(v) for k, v in value.items()}  # type: ignore
+
+    def decode(value: Json) -> Any:
+        if isinstance(value, list):
+            if decode_list is None:
+                raise ValueError(f"Cannot deserialize {annotation} from JSON")
+            return decode_list(value)
+        elif isinstance(value, dict):
+            if decode_dict is None:
+                raise ValueError(f"Cannot deserialize {annotation} from JSON")
+            return decode_dict(value)
+        elif isinstance(value, str):
+            return _deserialize_from_json_bytes(value)
+        else:
+            raise ValueError(f"Cannot deserialize {value} to {annotation}")
+
+    return decode
+
+
+def _get_model_encoder(cls: type, validate: bool) -> JsonEncoder:
+    return _get_codec(
+        _MODEL_ENCODERS,
+        (cls, validate),
+        lambda: _compile_model_encoder(cls, validate),
+    )
+
+
+def _compile_model_encoder(
+    cls: type[pydantic.BaseModel], validate: bool
+) -> JsonEncoder:
+    try:
+        canonical_name, version = SyftObjectRegistry.get_identifier_for_type(cls)
+    except KeyError:
+        raise ValueError(
+            f"Could not find canonical name for '{cls.__module__}.{cls.__name__}'"
+        )
+    serde_attributes = SyftObjectRegistry.get_serde_properties(canonical_name, version)
+    exclude_attrs = serde_attributes[4]
+    all_exclude_attrs = set(exclude_attrs) | DEFAULT_EXCLUDE_ATTRS
+
+    # fields are always validated, like the fields of any nested model
+    field_encoders = [
+        (key, _get_encoder(field_info.annotation, True))
+        for key, field_info in cls.model_fields.items()
+        if key not in all_exclude_attrs
+    ]
+
+    # Add searchable attrs and unique attrs to the serialized object dict, if they
+    # are not already present. Needed for adding non-field attributes (like @property)
+    searchable_attrs: list[str] = getattr(cls, "__attr_searchable__", [])
+    unique_attrs: list[str] = getattr(cls, "__attr_unique__", [])
+    field_keys = {key for key, _ in field_encoders}
+    extra_encoders: list[tuple[str, JsonEncoder]] = []
+    for attr in sorted(set(searchable_attrs) | set(unique_attrs)):
+        if attr in field_keys:
+            continue
+        property_annotation = get_property_return_type(cls, attr)
+        if property_annotation is None:
+            extra_encoders.append(
+                (attr, lambda value: _encode_by_type(value, validate))
+            )
+        else:
+            extra_encoders.append((attr, _get_encoder(property_annotation, validate)))
+
+    def encode_model(obj: pydantic.BaseModel) -> dict[str, Json]:
+        result: dict[str, Json] = {
+            JSON_CANONICAL_NAME_FIELD: canonical_name,
+            JSON_VERSION_FIELD: version,
+        }
+        for key, encode_field in field_encoders:
+            result[key] = encode_field(getattr(obj, key))
+        for attr, encode_attr in extra_encoders:
+            # attributes that cannot be accessed are skipped
+            try:
+                value = getattr(obj, attr)
+            except Exception:
+                continue
+            result[attr] = encode_attr(value)
+        return result
+
+    return encode_model
+
+
+def _get_model_decoder(
+    cls: type[pydantic.BaseModel],
+) -> Callable[[dict[str, Json]], pydantic.BaseModel]:
+    return _get_codec(_MODEL_DECODERS, cls, lambda: _compile_model_decoder(cls))
+
+
+def _compile_model_decoder(
+    cls: type[pydantic.BaseModel],
+) -> Callable[[dict[str, Json]], pydantic.BaseModel]:
+    field_decoders = [
+        (key, _get_decoder(field_info.annotation))
+        for key, field_info in cls.model_fields.items()
+    ]
+
+    def decode_model(obj_dict: dict[str, Json]) -> pydantic.BaseModel:
+        result = {
+            key: decode_field(obj_dict[key])
+            for key, decode_field in field_decoders
+            if key in obj_dict
+        }
+        return cls.model_validate(result)
+
+    return decode_model
+
+
+def _deserialize_pydantic_from_json(
+    obj_dict: dict[str, Json],
+) -> pydantic.BaseModel:
+    try:
+        canonical_name = obj_dict[JSON_CANONICAL_NAME_FIELD]
+        version = obj_dict[JSON_VERSION_FIELD]
+        obj_type = SyftObjectRegistry.get_serde_class(canonical_name, version)  # type: ignore
+        return _get_model_decoder(obj_type)(obj_dict)
+    except Exception as e:
+        print(f"Failed to deserialize Pydantic model: {e}")
+        print(json.dumps(obj_dict, indent=2))
+        raise ValueError(f"Failed to deserialize Pydantic model: {e}")
 
 
 def serialize_json(value: Any, annotation: Any = None, validate: bool = True) -> Json:
@@ -365,6 +531,10 @@ def serialize_json(value: Any, annotation: Any = None, validate: bool = True) ->
     4. Mapping serialization, if the annotation is a strictly typed mapping with string keys.
     5. Serialize the object to bytes and encode it as base64.
 
+    The serializer for an annotation is compiled on first use and cached. With
+    `validate`, the values returned by registered serializers are checked to be
+    JSON-serializable.
+
     Args:
         value (Any): Value to serialize.
         annotation (Any, optional): Type annotation for the value. Defaults to None.
@@ -372,36 +542,13 @@ def serialize_json(value: Any, annotation: Any = None, validate: bool = True) ->
     Returns:
         Json: JSON-serializable object.
     """
-    if annotation is None:
-        annotation = type(value)
-
     if value is None:
         return None
 
-    # Remove None type from annotation if it is present.
-    annotation = _unwrap_type_annotation(annotation)
-
-    if annotation in JSON_SERDE_REGISTRY:
-        result = JSON_SERDE_REGISTRY[annotation].serialize(value)
-    elif _annotation_issubclass(annotation, pydantic.BaseModel):
-        result = _serialize_pydantic_to_json(value)
-    elif _annotation_issubclass(annotation, Enum):
-        result = value.name
-
-    # JSON recursive types
-    # only strictly annotated iterables and mappings are supported
-    # example: list[int] is supported, but not list[int | str]
-    elif _is_serializable_iterable(annotation):
-        result = _serialize_iterable_to_json(value, annotation)
-    elif _is_serializable_mapping(annotation):
-        result = _serialize_mapping_to_json(value, annotation)
-    else:
-        result = _serialize_to_json_bytes(value)
-
-    if validate:
-        _validate_json(result)
+    if annotation is None:
+        annotation = type(value)
 
-    return result
+    return _get_encoder(annotation, validate)(value)
 
 
 def deserialize_json(value: Json, annotation: Any = None) -> Any:
@@ -425,26 +572,10 @@ def deserialize_json(value: Json, annotation: Any = None) -> Any:
     if value is None:
         return None
 
-    # Remove None type from annotation if it is present.
     if annotation is None:
         raise ValueError("Annotation is required for deserialization")
 
-    annotation = _unwrap_type_annotation(annotation)
-
-    if annotation in JSON_SERDE_REGISTRY:
-        return JSON_SERDE_REGISTRY[annotation].deserialize(value)
-    elif _annotation_issubclass(annotation, pydantic.BaseModel):
-        return _deserialize_pydantic_from_json(value)
-    elif _annotation_issubclass(annotation, Enum):
-        return annotation[value]
-    elif isinstance(value, list):
-        return _deserialize_iterable_from_json(value, annotation)
-    elif isinstance(value, dict):
-        return _deserialize_mapping_from_json(value, annotation)
-    elif isinstance(value, str):
-        return _deserialize_from_json_bytes(value)
-    else:
-        raise ValueError(f"Cannot deserialize {value} to {annotation}")
+    return _get_decoder(annotation)(value)
 
 
 def is_json_primitive(value: Any) -> bool:
@@ -1,23 +1,26 @@
 # stdlib
 from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
 from enum import EnumMeta
 import os
 import tempfile
 import types
 from typing import Any
+from typing import BinaryIO
 
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
 from pydantic import BaseModel
 
-# syft absolute
-import syft as sy
-
 # relative
 from ..types.syft_object_registry import SyftObjectRegistry
+from ..util.experimental_flags import flags
 from .capnp import get_capnp_schema
 from .util import compatible_with_large_file_writes_capnp
+from .util import write_proto
 
 TYPE_BANK = {}  # type: ignore
 SYFT_CLASSES_MISSING_CANONICAL_NAME = []
@@ -27,6 +30,14 @@ recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde
 SPOOLED_FILE_MAX_SIZE_SERDE = 50 * (1024**2)  # 50MB
 DEFAULT_EXCLUDE_ATTRS: set[str] = {"syft_pre_hooks__", "syft_post_hooks__"}
 
+MAX_TRAVERSAL_LIMIT = 2**64 - 1
+# inline nested messages are as deep as the object tree they encode
+MAX_NESTING_LIMIT = 2**31 - 1
+
+_trusted_deserialization: ContextVar[bool] = ContextVar(
+    "_trusted_deserialization", default=False
+)
+
 
 def get_types(cls: type, keys: list[str] | None = None) -> list[type] | None:
     if keys is None:
@@ -135,6 +146,153 @@ def skip_unregistered_class(
     return False
 
 
+@contextmanager
+def trusted_deserialization() -> Iterator:
+    """Deserialize data produced by this deployment without pydantic validation.
+
+    Only use this for data that never crossed a trust boundary, eg. messages
+    between the server and its workers.
+    """
+    token = _trusted_deserialization.set(True)
+    try:
+        yield
+    finally:
+        _trusted_deserialization.reset(token)
+
+
+def _setattr_constructor(cls: type) -> Callable[[dict[str, Any]], Any]:
+    def construct(kwargs: dict[str, Any]) -> Any:
+        obj = cls.__new__(cls)  # type: ignore
+        for attr_name, attr_value in kwargs.items():
+            setattr(obj, attr_name, attr_value)
+        return obj
+
+    return construct
+
+
+def _compile_constructor(cls: type) -> Callable[[dict[str, Any]], Any]:
+    if hasattr(cls, "serde_constructor"):
+        return cls.serde_constructor
+
+    if issubclass(cls, Enum):
+        setattr_construct = _setattr_constructor(cls)
+
+        def construct_enum(kwargs: dict[str, Any]) -> Any:
+            if "value" in kwargs:
+                return cls.__new__(cls, kwargs["value"])
+            return setattr_construct(kwargs)
+
+        return construct_enum
+
+    if issubclass(cls, BaseModel):
+        # if we skip the __new__ flow of BaseModel we get the error
+        # AttributeError: object has no attribute '__fields_set__'
+        return lambda kwargs: cls(**kwargs)
+
+    return _setattr_constructor(cls)
+
+
+def _can_model_construct(cls: type, fields: tuple[str, ...] | None) -> bool:
+    """True if `model_construct` builds the same object as `cls(**kwargs)` for
+    valid input, ie. the class adds no __init__ logic or validators of its own."""
+    # relative
+    from ..types.syft_object import SyftObject
+
+    if not issubclass(cls, BaseModel) or hasattr(cls, "serde_constructor"):
+        return False
+    if fields is None or not set(fields).issubset(cls.model_fields):
+        return False
+    if cls.__init__ not in (BaseModel.__init__, SyftObject.__init__):
+        return False
+
+    def _unbound(decorator: Any) -> Any:
+        return getattr(decorator.func, "__func__", decorator.func)
+
+    decorators = cls.__pydantic_decorators__
+    base_validators = SyftObject.__pydantic_decorators__.model_validators
+    return (
+        not decorators.field_validators
+        and not decorators.validators
+        and not decorators.root_validators
+        and all(
+            name in base_validators
+            and _unbound(validator) is _unbound(base_validators[name])
+            for name, validator in decorators.model_validators.items()
+        )
+    )
+
+
+class SerdePlan:
+    """Encode/decode plan of a recursive serde class.
+
+    Compiled once in `recursive_serde_register`, so `rs_object2proto` and
+    `rs_proto2object` don't recompute the field list, overrides and
+    constructor for every object.
+    """
+
+    def __init__(
+        self,
+        cls: type,
+        attributes: set[str] | None,
+        exclude_attrs: list[str],
+        serde_overrides: dict[str, Any],
+        hash_exclude_attrs: list[str],
+    ) -> None:
+        self.cls = cls
+        # None means the fields are taken from the __dict__ of every object
+        self.fields = tuple(sorted(attributes)) if attributes is not None else None
+        self.exclude_attrs = frozenset(exclude_attrs)
+        self.hash_exclude_attrs = tuple(hash_exclude_attrs)
+        self.encoders = {name: t[0] for name, t in serde_overrides.items()}
+        self.decoders = {name: t[1] for name, t in serde_overrides.items()}
+        self.constructor = _compile_constructor(cls)
+        self._hash_fields: tuple[str, ...] | None = None
+        self._trusted_constructor: Callable[[dict[str, Any]], Any] | None = None
+
+    def _hash_exclude_set(self) -> set[str]:
+        # relative
+        from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+
+        return set(self.hash_exclude_attrs).union(DYNAMIC_SYFT_ATTRIBUTES)
+
+    def encode_fields(self, obj: Any, for_hashing: bool) -> tuple[str, ...]:
+        if self.fields is None:
+            fields = set(obj.__dict__.keys()) - self.exclude_attrs
+            if for_hashing:
+                fields -= self._hash_exclude_set()
+            return tuple(sorted(fields))
+        if not for_hashing:
+            return self.fields
+        if self._hash_fields is None:
+            # computed lazily, DYNAMIC_SYFT_ATTRIBUTES can't be imported while
+            # the syft object classes are registered
+            hash_exclude = self._hash_exclude_set()
+            self._hash_fields = tuple(f for f in self.fields if f not in hash_exclude)
+        return self._hash_fields
+
+    def construct(self, kwargs: dict[str, Any]) -> Any:
+        if not _trusted_deserialization.get():
+            return self.constructor(kwargs)
+        if self._trusted_constructor is None:
+            self._trusted_constructor = self._compile_trusted_constructor()
+        return self._trusted_constructor(kwargs)
+
+    def _compile_trusted_constructor(self) -> Callable[[dict[str, Any]], Any]:
+        cls = self.cls
+        if not _can_model_construct(cls, self.fields):
+            return self.constructor
+
+        has_post_init = hasattr(cls, "__post_init__")
+
+        def construct(kwargs: dict[str, Any]) -> Any:
+            obj = cls.model_construct(**kwargs)  # type: ignore
+            if has_post_init:
+                obj.__post_init__()
+            return obj
+
+        return construct
+
+
 def recursive_serde_register(
     cls: object | type,
     serialize: Callable | None = None,
@@ -203,6 +361,9 @@ def recursive_serde_register(
     attributes = set(attribute_list) if attribute_list else None
     attribute_types = get_types(cls, attributes)
     serde_overrides = getattr(cls, "__serde_overrides__", {})
+    serde_plan = SerdePlan(
+        cls, attributes, exclude_attrs, serde_overrides, hash_exclude_attrs
+    )
 
     # without fqn duplicate class names overwrite
     serde_attributes = (
@@ -216,6 +377,7 @@ def recursive_serde_register(
         cls,
         attribute_types,
         version,
+        serde_plan,
     )
 
     SyftObjectRegistry.register_cls(canonical_name, version, serde_attributes)
@@ -227,6 +389,23 @@ def recursive_serde_register(
             SyftObjectRegistry.register_cls(alias_canonical_name, 1, serde_attributes)
 
 
+CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
+
+
+def _chunk_file(
+    file: BinaryIO,
+    size_of_data: int,
+    field_name: str | int,
+    builder: _DynamicStructBuilder,
+) -> None:
+    list_size = size_of_data // CHUNK_SIZE + 1
+    data_lst = builder.init(field_name, list_size)
+    for idx in range(list_size):
+        bytes_to_read = min(CHUNK_SIZE, size_of_data)
+        data_lst[idx] = file.read(bytes_to_read)
+        size_of_data -= CHUNK_SIZE
+
+
 def chunk_bytes(
     field_obj: Any,
     ser_func: Callable,
@@ -241,16 +420,8 @@ def chunk_bytes(
             tmp_file.write(data)
             tmp_file.seek(0)
             del data
-
-            CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
-            list_size = size_of_data // CHUNK_SIZE + 1
-            data_lst = builder.init(field_name, list_size)
-            for idx in range(list_size):
-                bytes_to_read = min(CHUNK_SIZE, size_of_data)
-                data_lst[idx] = tmp_file.read(bytes_to_read)
-                size_of_data -= CHUNK_SIZE
+            _chunk_file(tmp_file, size_of_data, field_name, builder)
     else:
-        CHUNK_SIZE = int(5.12e8)  # capnp max for a List(Data) field
         list_size = len(data) // CHUNK_SIZE + 1
         data_lst = builder.init(field_name, list_size)
         END_INDEX = CHUNK_SIZE
@@ -260,25 +431,82 @@ def chunk_bytes(
             data_lst[idx] = data[START_INDEX:END_INDEX]
 
 
-def combine_bytes(capnp_list: list[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
-    return bytes_value
+def chunk_serialized(
+    field_obj: Any,
+    field_name: str | int,
+    builder: _DynamicStructBuilder,
+    for_hashing: bool = False,
+) -> None:
+    """Serialize `field_obj` into a chunked List(Data) field.
+
+    Unlike `chunk_bytes` over `_serialize(..., to_bytes=True)`, large messages
+    are streamed to the temporary file without being flattened to bytes first.
+    """
+    proto = rs_object2proto(field_obj, for_hashing=for_hashing)
+    if compatible_with_large_file_writes_capnp(proto):
+        with tempfile.TemporaryFile() as tmp_file:
+            write_proto(proto, tmp_file)
+            del proto
+            size_of_data = tmp_file.seek(0, os.SEEK_END)
+            tmp_file.seek(0)
+            _chunk_file(tmp_file, size_of_data, field_name, builder)
+    else:
+        chunk_bytes(proto, lambda x: x.to_bytes(), field_name, builder)
+
+
+def combine_bytes(capnp_list: list[bytes]) -> bytes | bytearray:
+    """Reassemble a value that `chunk_bytes` split over a capnp List(Data).
+
+    A single chunk is returned as is, without an extra copy. Multiple chunks are
+    copied once into a preallocated buffer, so peak memory stays at the size
+    of the value plus one chunk instead of growing with every concatenation.
+    """
+    n_chunks = len(capnp_list)
+    if n_chunks == 0:
+        return b""
+    if n_chunks == 1:
+        return capnp_list[0]
+
+    # chunk_bytes cuts every chunk but the last at the same size
+    chunk_size = len(capnp_list[0])
+    last = capnp_list[n_chunks - 1]
+    buffer = bytearray(chunk_size * (n_chunks - 1) + len(last))
+    with memoryview(buffer) as view:
+        for idx in range(n_chunks - 1):
+            start = idx * chunk_size
+            view[start : start + chunk_size] = capnp_list[idx]
+        view[chunk_size * (n_chunks - 1) :] = last
+    return buffer
+
+
+def rs_object2proto(
+    self: Any, for_hashing: bool = False, inline_nested: bool | None = None
+) -> _DynamicStructBuilder:
+    # hashes must stay stable across peers, so hashing always uses the blob layout
+    if inline_nested is None:
+        inline_nested = flags.INLINE_NESTED_SERDE and not for_hashing
+    msg = recursive_scheme.new_message()
+    _fill_proto(self, msg, for_hashing=for_hashing, inline_nested=inline_nested)
+    return msg
 
 
-def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
-    # relative
-    from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+def _fill_proto(
+    self: Any,
+    msg: _DynamicStructBuilder,
+    for_hashing: bool = False,
+    inline_nested: bool = False,
+) -> None:
+    """Write `self` into an existing RecursiveSerde builder.
 
+    With `inline_nested`, fields are written as child RecursiveSerde structs
+    of the same message (`fieldsProto`) so an object tree is encoded in a single
+    pass, instead of serializing every field to bytes and copying those bytes
+    into `fieldsData` at each level of nesting.
+    """
     is_type = False
     if isinstance(self, type):
         is_type = True
 
-    msg = recursive_scheme.new_message()
-
     # todo: rewrite and make sure every object has a canonical name and version
     canonical_name, version = SyftObjectRegistry.get_canonical_name_version(self)
 
@@ -295,13 +523,14 @@ def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuild
         nonrecursive,
         serialize,
         _,
-        attribute_list,
-        exclude_attrs_list,
-        serde_overrides,
-        hash_exclude_attrs,
         _,
         _,
         _,
+        _,
+        _,
+        _,
+        _,
+        serde_plan,
     ) = SyftObjectRegistry.get_serde_properties(canonical_name, version)
 
     if nonrecursive or is_type:
@@ -310,58 +539,61 @@ def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuild
                 f"Cant serialize {type(self)} nonrecursive without serialize."
             )
         chunk_bytes(self, serialize, "nonrecursiveBlob", msg)
-        return msg
+        return
 
-    if attribute_list is None:
-        attribute_list = self.__dict__.keys()
+    attribute_list = serde_plan.encode_fields(self, for_hashing)
+    encoders = serde_plan.encoders
 
-    hash_exclude_attrs_set = (
-        set(hash_exclude_attrs).union(set(DYNAMIC_SYFT_ATTRIBUTES))
-        if for_hashing
-        else set()
-    )
-    attribute_list = (
-        set(attribute_list) - set(exclude_attrs_list) - hash_exclude_attrs_set
-    )
-
-    msg.init("fieldsName", len(attribute_list))
-    msg.init("fieldsData", len(attribute_list))
+    fields_name = msg.init("fieldsName", len(attribute_list))
+    if inline_nested:
+        fields_proto = msg.init("fieldsProto", len(attribute_list))
+    else:
+        fields_data = msg.init("fieldsData", len(attribute_list))
 
-    for idx, attr_name in enumerate(sorted(attribute_list)):
-        if not hasattr(self, attr_name):
+    for idx, attr_name in enumerate(attribute_list):
+        try:
+            field_obj = getattr(self, attr_name)
+        except AttributeError:
             raise ValueError(
                 f"{attr_name} on {type(self)} does not exist, serialization aborted!"
-            )
-
-        field_obj = getattr(self, attr_name)
-        transforms = serde_overrides.get(attr_name, None)
+            ) from None
 
-        if transforms is not None:
-            field_obj = transforms[0](field_obj)
+        if attr_name in encoders:
+            field_obj = encoders[attr_name](field_obj)
 
         if isinstance(field_obj, types.FunctionType):
             continue
 
-        msg.fieldsName[idx] = attr_name
-        chunk_bytes(
-            field_obj,
-            lambda x: sy.serialize(x, to_bytes=True, for_hashing=for_hashing),
-            idx,
-            msg.fieldsData,
-        )
-
-    return msg
-
+        fields_name[idx] = attr_name
+        if inline_nested:
+            _fill_proto(
+                field_obj,
+                fields_proto[idx],
+                for_hashing=for_hashing,
+                inline_nested=inline_nested,
+            )
+        else:
+            chunk_serialized(field_obj, idx, fields_data, for_hashing=for_hashing)
 
-def rs_bytes2object(blob: bytes) -> Any:
-    MAX_TRAVERSAL_LIMIT = 2**64 - 1
 
+def rs_bytes2object(blob: bytes | bytearray | memoryview) -> Any:
     with recursive_scheme.from_bytes(
-        blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
+        blob,
+        traversal_limit_in_words=MAX_TRAVERSAL_LIMIT,
+        nesting_limit=MAX_NESTING_LIMIT,
     ) as msg:
         return rs_proto2object(msg)
 
 
+def rs_segments2object(segments: list) -> Any:
+    msg = recursive_scheme.from_segments(
+        segments,
+        traversal_limit_in_words=MAX_TRAVERSAL_LIMIT,
+        nesting_limit=MAX_NESTING_LIMIT,
+    )
+    return rs_proto2object(msg)
+
+
 def map_fqns_for_backward_compatibility(fqn: str) -> str:
     """for backwards compatibility with 0.8.6. Sometimes classes where moved to another file. Which is
     exactly why we are implementing it differently"""
@@ -376,11 +608,6 @@ def map_fqns_for_backward_compatibility(fqn: str) -> str:
 
 
 def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
-    # relative
-    from .deserialize import _deserialize
-
-    class_type: type | Any = type(None)
-
     canonical_name = proto.canonicalName
     version = getattr(proto, "version", -1)
 
@@ -407,15 +634,14 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
         deserialize,
         _,
         _,
-        serde_overrides,
         _,
-        cls,
+        _,
+        _,
         _,
         version,
+        serde_plan,
     ) = SyftObjectRegistry.get_serde_properties(canonical_name, version)
 
-    class_type = cls
-
     if nonrecursive:
         if deserialize is None:
             raise Exception(
@@ -425,42 +651,25 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
         return deserialize(combine_bytes(proto.nonrecursiveBlob))
 
     kwargs = {}
+    decoders = serde_plan.decoders
 
-    for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData):
-        if attr_name != "":
-            attr_bytes = combine_bytes(attr_bytes_list)
-            attr_value = _deserialize(attr_bytes, from_bytes=True)
-            transforms = serde_overrides.get(attr_name, None)
+    fields_proto = proto.fieldsProto
+    inline_nested = len(fields_proto) > 0
+    fields_value = fields_proto if inline_nested else proto.fieldsData
 
-            if transforms is not None:
-                attr_value = transforms[1](attr_value)
+    for attr_name, attr_field in zip(proto.fieldsName, fields_value):
+        if attr_name != "":
+            if inline_nested:
+                attr_value = rs_proto2object(attr_field)
+            else:
+                # nested fields are plain messages, never framed
+                attr_value = rs_bytes2object(combine_bytes(attr_field))
+
+            if attr_name in decoders:
+                attr_value = decoders[attr_name](attr_value)
             kwargs[attr_name] = attr_value
 
-    if hasattr(class_type, "serde_constructor"):
-        return class_type.serde_constructor(kwargs)
-
-    if issubclass(class_type, Enum) and "value" in kwargs:
-        obj = class_type.__new__(class_type, kwargs["value"])
-    elif issubclass(class_type, BaseModel):
-        # if we skip the __new__ flow of BaseModel we get the error
-        # AttributeError: object has no attribute '__fields_set__'
-
-        # if "syft.user" in proto.fullyQualifiedName:
-        #     # weird issues with pydantic and ForwardRef on user classes being inited
-        #     # with custom state args / kwargs
-        #     obj = class_type()
-        #     for attr_name, attr_value in kwargs.items():
-        #         setattr(obj, attr_name, attr_value)
-        # else:
-        #     obj = class_type(**kwargs)
-        obj = class_type(**kwargs)
-
-    else:
-        obj = class_type.__new__(class_type)  # type: ignore
-        for attr_name, attr_value in kwargs.items():
-            setattr(obj, attr_name, attr_value)
-
-    return obj
+    return serde_plan.construct(kwargs)
 
 
 # how else do you import a relative file to execute it?
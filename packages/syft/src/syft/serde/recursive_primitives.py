@@ -237,7 +237,8 @@ recursive_serde_register(
 recursive_serde_register(
     bytes,
     serialize=lambda x: x,
-    deserialize=lambda x: x,
+    # multi-chunk values are reassembled into a bytearray
+    deserialize=lambda x: x if isinstance(x, bytes) else bytes(x),
     canonical_name="bytes",
     version=1,
 )
@@ -1,9 +1,12 @@
 # stdlib
+from collections.abc import Callable
 import tempfile
 from typing import Any
+from typing import BinaryIO
 
 # relative
 from .util import compatible_with_large_file_writes_capnp
+from .util import write_proto
 
 
 def _serialize(
@@ -11,11 +14,29 @@ def _serialize(
     to_proto: bool = True,
     to_bytes: bool = False,
     for_hashing: bool = False,
+    buffer_callback: Callable[[Any], None] | None = None,
+    to_file: BinaryIO | None = None,
 ) -> Any:
     # relative
+    from .buffers import buffer_callback_context
     from .recursive import rs_object2proto
 
+    if buffer_callback is not None:
+        with buffer_callback_context(buffer_callback):
+            return _serialize(
+                obj,
+                to_proto=to_proto,
+                to_bytes=to_bytes,
+                for_hashing=for_hashing,
+                to_file=to_file,
+            )
+
     proto = rs_object2proto(obj, for_hashing=for_hashing)
+    if to_file is not None:
+        # stream the segments to the sink, without flattening them into bytes
+        write_proto(proto, to_file)
+        return None
+
     if to_bytes:
         if compatible_with_large_file_writes_capnp(proto):
             with tempfile.TemporaryFile() as tmp_file:
@@ -26,6 +26,10 @@ from ..types.syft_metaclass import EmptyType
 from ..types.syft_metaclass import PartialModelMetaclass
 from .array import numpy_deserialize
 from .array import numpy_serialize
+from .buffers import OutOfBandBuffer
+from .buffers import out_of_band_enabled
+from .buffers import read_buffer
+from .buffers import write_buffer
 from .deserialize import _deserialize as deserialize
 from .recursive_primitives import _serialize_kv_pairs
 from .recursive_primitives import deserialize_kv
@@ -35,6 +39,8 @@ from .recursive_primitives import recursive_serde_register_type
 from .recursive_primitives import serialize_type
 from .serialize import _serialize as serialize
 
+PARQUET_MAGIC = b"PAR1"
+
 recursive_serde_register(
     SigningKey,
     serialize=lambda x: bytes(x),
@@ -58,8 +64,36 @@ recursive_serde_register(
 recursive_serde_register(cls=TypeError, canonical_name="TypeError", version=1)
 
 
+def arrow_table_to_ipc(table: pa.Table) -> pa.Buffer:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def arrow_table_from_ipc(buf: bytes | bytearray | memoryview) -> pa.Table:
+    # py_buffer wraps buf without copying it
+    with pa.ipc.open_stream(pa.py_buffer(buf)) as reader:
+        return reader.read_all()
+
+
+def serialize_arrow_table(table: pa.Table) -> bytes:
+    if out_of_band_enabled():
+        return serialize(write_buffer(arrow_table_to_ipc(table)), to_bytes=True)
+    return serialize(arrow_table_to_ipc(table).to_pybytes(), to_bytes=True)
+
+
+def deserialize_arrow_table(buf: bytes | bytearray | memoryview) -> pa.Table:
+    deser = deserialize(buf, from_bytes=True)
+    if isinstance(deser, OutOfBandBuffer):
+        return arrow_table_from_ipc(read_buffer(deser))
+    return arrow_table_from_ipc(deser)
+
+
 def serialize_dataframe(df: DataFrame) -> bytes:
     table = pa.Table.from_pandas(df)
+    if out_of_band_enabled():
+        return serialize(write_buffer(arrow_table_to_ipc(table)), to_bytes=True)
     sink = pa.BufferOutputStream()
     # 🟡 TODO 37: Should we warn about this?
     parquet_args = {
@@ -72,7 +106,11 @@ def serialize_dataframe(df: DataFrame) -> bytes:
     return numpy_bytes
 
 
-def deserialize_dataframe(buf: bytes) -> DataFrame:
+def deserialize_dataframe(buf: bytes | bytearray | memoryview) -> DataFrame:
+    if buf[:4] != PARQUET_MAGIC:
+        ref = deserialize(buf, from_bytes=True)
+        return arrow_table_from_ipc(read_buffer(ref)).to_pandas()
+    # BufferReader wraps the reassembled buffer without copying it
     reader = pa.BufferReader(buf)
     numpy_bytes = reader.read_buffer()
     result = pq.read_table(numpy_bytes)
@@ -80,6 +118,14 @@ def deserialize_dataframe(buf: bytes) -> DataFrame:
     return df
 
 
+recursive_serde_register(
+    pa.Table,
+    serialize=serialize_arrow_table,
+    deserialize=deserialize_arrow_table,
+    canonical_name="arrow_table",
+    version=1,
+)
+
 # pandas
 recursive_serde_register(
     DataFrame,
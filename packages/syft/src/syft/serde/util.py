@@ -1,5 +1,9 @@
 # stdlib
+import io
+import struct
 from sys import platform
+from typing import Any
+from typing import BinaryIO
 
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
@@ -16,3 +20,62 @@ def compatible_with_large_file_writes_capnp(thing: _DynamicStructBuilder | int)
         return False
     else:
         return get_size(thing) > 50000000  # roughly 0.5GB
+
+
+def _is_os_file(fp: Any) -> bool:
+    # SpooledTemporaryFile and friends roll over to disk when fileno is called
+    return isinstance(fp, io.FileIO | io.BufferedWriter | io.BufferedRandom)
+
+
+def write_proto(proto: _DynamicStructBuilder, fp: BinaryIO) -> None:
+    """Write a capnp message in the standard stream framing to a file-like."""
+    if _is_os_file(fp):
+        # capnp writes the segments straight to the file descriptor
+        fp.flush()
+        proto.write(fp)
+        return
+
+    segments = proto.to_segments()
+    n_segments = len(segments)
+    table = struct.pack(
+        f"<{n_segments + 1}I",
+        n_segments - 1,
+        *(len(segment) // 8 for segment in segments),
+    )
+    if n_segments % 2 == 0:
+        # the segment table is padded to a whole word
+        table += b"\x00" * 4
+    fp.write(table)
+    for idx in range(n_segments):
+        fp.write(segments[idx])
+        segments[idx] = b""
+
+
+def read_exactly(fp: BinaryIO, size: int) -> bytearray:
+    buffer = bytearray(size)
+    with memoryview(buffer) as view:
+        offset = 0
+        while offset < size:
+            n = fp.readinto(view[offset:])  # type: ignore[attr-defined]
+            if not n:
+                raise EOFError(
+                    f"Unexpected end of stream, read {offset} of {size} bytes"
+                )
+            offset += n
+    return buffer
+
+
+def read_proto_segments(fp: BinaryIO, first_word: bytes | None = None) -> list:
+    """Read the segments of a capnp message in stream framing from a file-like.
+
+    `first_word` holds the first 8 bytes of the message if they were already
+    consumed from the stream.
+    """
+    head = first_word if first_word is not None else read_exactly(fp, 8)
+    n_segments = struct.unpack_from("<I", head)[0] + 1
+    # the first word holds the segment count and the first segment size, the
+    # rest of the table is padded to a whole word
+    padding = 4 if n_segments % 2 == 0 else 0
+    table = bytes(head[4:]) + bytes(read_exactly(fp, 4 * (n_segments - 1) + padding))
+    sizes = struct.unpack_from(f"<{n_segments}I", table)
+    return [read_exactly(fp, size * 8) for size in sizes]
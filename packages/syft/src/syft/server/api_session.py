@@ -0,0 +1,140 @@
+# stdlib
+import hashlib
+import hmac
+import struct
+import threading
+import time
+from typing import Any
+
+# third party
+from nacl.exceptions import CryptoError
+from nacl.public import Box
+from nacl.public import PrivateKey
+from nacl.public import PublicKey
+from nacl.secret import SecretBox
+
+# relative
+from ..client.api import SessionSyftAPICall
+from ..client.api import api_session_mac
+from ..types.errors import SyftException
+from .credentials import SyftSigningKey
+from .credentials import SyftVerifyKey
+
+# how far behind the highest counter of a session a call may arrive,
+# calls made from several threads are not received in order
+API_SESSION_REPLAY_WINDOW = 1024
+API_SESSION_MAX_COUNTER = 2**64
+
+_TOKEN_EXPIRY = struct.Struct(">d")
+_KEY_SIZE = 32
+
+
+class _ReplayWindow:
+    __slots__ = ("highest", "seen", "expires_at")
+
+    def __init__(self, expires_at: float) -> None:
+        self.highest = 0
+        self.seen: set[int] = set()
+        self.expires_at = expires_at
+
+    def add(self, counter: int) -> bool:
+        if counter <= self.highest - API_SESSION_REPLAY_WINDOW or counter in self.seen:
+            return False
+
+        self.seen.add(counter)
+        self.highest = max(self.highest, counter)
+        if len(self.seen) > 2 * API_SESSION_REPLAY_WINDOW:
+            lowest = self.highest - API_SESSION_REPLAY_WINDOW
+            self.seen = {c for c in self.seen if c > lowest}
+        return True
+
+
+class APISessionManager:
+    """
+    Issues and checks the tokens of API sessions.
+
+    A session is started with a signed call that carries an ephemeral X25519
+    public key of the client. Both sides derive the MAC key of the session from
+    the key exchange, later calls are authenticated with an HMAC over a counter
+    and the serialized call instead of an Ed25519 signature.
+
+    The token holds the verify key of the user, the MAC key and the expiry of the
+    session, encrypted with a key derived from the signing key of the server.
+    It can be checked by any process of the server without shared state, only
+    replay protection is kept per process.
+    """
+
+    def __init__(self, signing_key: SyftSigningKey, ttl: int) -> None:
+        self.ttl = ttl
+        secret = hashlib.sha256(
+            b"syft-api-session" + bytes(signing_key.signing_key)
+        ).digest()
+        self._box = SecretBox(secret)
+        self._windows: dict[bytes, _ReplayWindow] = {}
+        self._lock = threading.Lock()
+        self._next_prune = time.time() + ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def create(self, credentials: SyftVerifyKey, public_key: bytes) -> dict[str, Any]:
+        if not self.enabled:
+            raise SyftException(
+                public_message="API sessions are disabled on this server"
+            )
+
+        try:
+            client_public_key = PublicKey(public_key)
+        except (TypeError, ValueError):
+            raise SyftException(public_message="Invalid API session public key")
+
+        private_key = PrivateKey.generate()
+        mac_key = Box(private_key, client_public_key).shared_key()
+        expires_at = time.time() + self.ttl
+        token = self._box.encrypt(
+            bytes(credentials.verify_key) + mac_key + _TOKEN_EXPIRY.pack(expires_at)
+        )
+        return {
+            "token": bytes(token),
+            "public_key": bytes(private_key.public_key),
+            "ttl": self.ttl,
+        }
+
+    def is_valid(self, api_call: SessionSyftAPICall) -> bool:
+        if not self.enabled or not 0 < api_call.counter < API_SESSION_MAX_COUNTER:
+            return False
+
+        try:
+            payload = self._box.decrypt(api_call.session_token)
+        except CryptoError:
+            return False
+
+        verify_key = payload[:_KEY_SIZE]
+        mac_key = payload[_KEY_SIZE : 2 * _KEY_SIZE]
+        (expires_at,) = _TOKEN_EXPIRY.unpack(payload[2 * _KEY_SIZE :])
+
+        if time.time() > expires_at:
+            return False
+        if not hmac.compare_digest(verify_key, bytes(api_call.credentials.verify_key)):
+            return False
+
+        mac = api_session_mac(mac_key, api_call.counter, api_call.serialized_message)
+        if not hmac.compare_digest(mac, api_call.mac):
+            return False
+
+        return self._add_counter(api_call.session_token, api_call.counter, expires_at)
+
+    def _add_counter(self, token: bytes, counter: int, expires_at: float) -> bool:
+        with self._lock:
+            now = time.time()
+            if now > self._next_prune:
+                self._windows = {
+                    k: w for k, w in self._windows.items() if w.expires_at > now
+                }
+                self._next_prune = now + self.ttl
+
+            window = self._windows.get(token)
+            if window is None:
+                window = self._windows[token] = _ReplayWindow(expires_at)
+            return window.add(counter)
@@ -56,6 +56,11 @@ def get_enable_warnings() -> bool:
     return str_to_bool(get_env("ENABLE_WARNINGS", "False"))
 
 
+def get_api_session_ttl() -> int:
+    # 0 disables API sessions, each call has to be signed
+    return int(get_env("API_SESSION_TTL_SEC", 900))
+
+
 def get_container_host() -> str | None:
     return get_env("CONTAINER_HOST")
 
@@ -2,8 +2,11 @@
 import base64
 import binascii
 from collections.abc import AsyncGenerator
+from collections.abc import Generator
 import logging
+import tempfile
 from typing import Annotated
+from typing import Any
 
 # third party
 from fastapi import APIRouter
@@ -22,6 +25,7 @@ from ..abstract_server import AbstractServer
 from ..client.connection import ServerConnection
 from ..protocol.data_protocol import PROTOCOL_TYPE
 from ..serde.deserialize import _deserialize as deserialize
+from ..serde.recursive import SPOOLED_FILE_MAX_SIZE_SERDE
 from ..serde.serialize import _serialize as serialize
 from ..service.context import ServerServiceContext
 from ..service.context import UnauthedServiceContext
@@ -30,6 +34,7 @@ from ..service.response import SyftError
 from ..service.user.user import UserCreate
 from ..service.user.user import UserPrivateKey
 from ..service.user.user_service import UserService
+from ..types.blob_storage import DEFAULT_CHUNK_SIZE
 from ..types.errors import SyftException
 from ..types.uid import UID
 from .credentials import SyftVerifyKey
@@ -39,6 +44,33 @@ from .worker import Worker
 logger = logging.getLogger(__name__)
 
 
+def serialized_response(obj: Any) -> Response:
+    """Serialize `obj` into a response without holding the whole payload in memory.
+
+    The message is streamed into a spooled file, small payloads are returned
+    directly and large ones are streamed back to the client from disk.
+    """
+    tmp_file = tempfile.SpooledTemporaryFile(max_size=SPOOLED_FILE_MAX_SIZE_SERDE)
+    serialize(obj, to_file=tmp_file)
+    size = tmp_file.tell()
+    tmp_file.seek(0)
+
+    if size <= SPOOLED_FILE_MAX_SIZE_SERDE:
+        with tmp_file:
+            return Response(tmp_file.read(), media_type="application/octet-stream")
+
+    def iter_file() -> Generator[bytes, None, None]:
+        with tmp_file:
+            while chunk := tmp_file.read(DEFAULT_CHUNK_SIZE):
+                yield chunk
+
+    return StreamingResponse(
+        iter_file(),
+        headers={"Content-Length": str(size)},
+        media_type="application/octet-stream",
+    )
+
+
 def make_routes(worker: Worker) -> APIRouter:
     router = APIRouter()
 
@@ -133,14 +165,16 @@ def make_routes(worker: Worker) -> APIRouter:
         )
 
     def handle_syft_new_api(
-        user_verify_key: SyftVerifyKey, communication_protocol: PROTOCOL_TYPE
+        user_verify_key: SyftVerifyKey,
+        communication_protocol: PROTOCOL_TYPE,
+        if_none_match: str | None = None,
     ) -> Response:
-        return Response(
-            serialize(
-                worker.get_api(user_verify_key, communication_protocol), to_bytes=True
-            ),
-            media_type="application/octet-stream",
-        )
+        etag, content = worker.get_api_schema(user_verify_key, communication_protocol)
+        headers = {"ETag": f'"{etag}"'}
+        # the client already has this version of the API
+        if if_none_match == headers["ETag"]:
+            return Response(status_code=304, headers=headers)
+        return Response(content, media_type="application/octet-stream", headers=headers)
 
     # get the SyftAPI object
     @router.get("/api")
@@ -148,15 +182,16 @@ def make_routes(worker: Worker) -> APIRouter:
         request: Request, verify_key: str, communication_protocol: PROTOCOL_TYPE
     ) -> Response:
         user_verify_key: SyftVerifyKey = SyftVerifyKey.from_string(verify_key)
-        return handle_syft_new_api(user_verify_key, communication_protocol)
+        return handle_syft_new_api(
+            user_verify_key,
+            communication_protocol,
+            if_none_match=request.headers.get("If-None-Match"),
+        )
 
     def handle_new_api_call(data: bytes) -> Response:
         obj_msg = deserialize(blob=data, from_bytes=True)
         result = worker.handle_api_call(api_call=obj_msg)
-        return Response(
-            serialize(result, to_bytes=True),
-            media_type="application/octet-stream",
-        )
+        return serialized_response(result)
 
     # make a request to the SyftAPI
     @router.post("/api_call")
@@ -165,6 +200,18 @@ def make_routes(worker: Worker) -> APIRouter:
     ) -> Response:
         return handle_new_api_call(data)
 
+    def handle_new_api_call_batch(data: bytes) -> Response:
+        obj_msgs = deserialize(blob=data, from_bytes=True)
+        results = worker.handle_api_calls(api_calls=obj_msgs)
+        return serialized_response(results)
+
+    # make several requests to the SyftAPI in one round trip
+    @router.post("/api_call_batch")
+    def syft_new_api_call_batch(
+        request: Request, data: Annotated[bytes, Depends(get_body)]
+    ) -> Response:
+        return handle_new_api_call_batch(data)
+
     def handle_forgot_password(email: str, server: AbstractServer) -> Response:
         try:
             context = UnauthedServiceContext(server=server)
@@ -28,6 +28,7 @@ from .. import __version__
 from ..abstract_server import AbstractServer
 from ..abstract_server import ServerSideType
 from ..abstract_server import ServerType
+from ..client.api import SessionSyftAPICall
 from ..client.api import SignedSyftAPICall
 from ..client.api import SyftAPI
 from ..client.api import SyftAPICall
@@ -56,6 +57,7 @@ from ..service.queue.base_queue import AbstractMessageHandler
 from ..service.queue.base_queue import QueueConsumer
 from ..service.queue.base_queue import QueueProducer
 from ..service.queue.queue import APICallMessageHandler
+from ..service.queue.queue import remove_worker_servers
 from ..service.queue.queue import ConsumerType
 from ..service.queue.queue import QueueManager
 from ..service.queue.queue_stash import APIEndpointQueueItem
@@ -113,8 +115,10 @@ from ..util.util import get_env
 from ..util.util import get_queue_address
 from ..util.util import random_name
 from ..util.util import thread_ident
+from .api_session import APISessionManager
 from .credentials import SyftSigningKey
 from .credentials import SyftVerifyKey
+from .env import get_api_session_ttl
 from .env import get_default_root_email
 from .env import get_default_root_password
 from .env import get_default_root_username
@@ -273,6 +277,9 @@ class Server(AbstractServer):
         else:
             skey = signing_key
         self.signing_key = skey or SyftSigningKey.generate()
+        self.api_sessions = APISessionManager(
+            self.signing_key, ttl=get_api_session_ttl()
+        )
 
         self.association_request_auto_approval = association_request_auto_approval
 
@@ -485,6 +492,7 @@ class Server(AbstractServer):
 
         self.queue_manager.producers.clear()
         self.queue_manager.consumers.clear()
+        remove_worker_servers(self.id)
 
         ServerRegistry.remove_server(self.id)
 
@@ -1084,7 +1092,7 @@ class Server(AbstractServer):
     @instrument
     def handle_api_call(
         self,
-        api_call: SyftAPICall | SignedSyftAPICall,
+        api_call: SyftAPICall | SignedSyftAPICall | SessionSyftAPICall,
         job_id: UID | None = None,
         check_call_location: bool = True,
     ) -> SignedSyftAPICall:
@@ -1097,9 +1105,27 @@ class Server(AbstractServer):
 
         return signed_result
 
+    def handle_api_calls(
+        self, api_calls: list[SyftAPICall | SignedSyftAPICall | SessionSyftAPICall]
+    ) -> list[SignedSyftAPICall]:
+        """
+        Handle `api_calls` in order. A call that is rejected returns a signed
+        `SyftError` instead of failing the calls after it.
+        """
+        signed_results = []
+        for api_call in api_calls:
+            try:
+                signed_result = self.handle_api_call(api_call)
+            except SyftException as e:
+                signed_result = SyftAPIData(
+                    data=SyftError(message=e.public_message)
+                ).sign(self.signing_key)
+            signed_results.append(signed_result)
+        return signed_results
+
     def handle_api_call_with_unsigned_result(
         self,
-        api_call: SyftAPICall | SignedSyftAPICall,
+        api_call: SyftAPICall | SignedSyftAPICall | SessionSyftAPICall,
         job_id: UID | None = None,
         check_call_location: bool = True,
     ) -> Result | QueueItem | SyftObject | SyftError:
@@ -1107,13 +1133,33 @@ class Server(AbstractServer):
             raise SyftException(
                 public_message=f"You sent a {type(api_call)}. This server requires SignedSyftAPICall."
             )
+        elif isinstance(api_call, SessionSyftAPICall):
+            if not self.api_sessions.is_valid(api_call):
+                raise SyftException(
+                    public_message="Your API session is invalid or has expired"
+                )
         else:
             if not api_call.is_valid:
                 raise SyftException(public_message="Your message signature is invalid")
 
         if api_call.message.server_uid != self.id and check_call_location:
+            # the server we forward to can't check the session
+            if isinstance(api_call, SessionSyftAPICall):
+                raise SyftException(
+                    public_message="API sessions can't be used for other servers"
+                )
             return self.forward_message(api_call=api_call)
 
+        if api_call.message.path == "api_session":
+            if not isinstance(api_call, SignedSyftAPICall):
+                raise SyftException(
+                    public_message="An API session has to be started with a signed call"
+                )
+            return self.api_sessions.create(
+                credentials=api_call.credentials,
+                public_key=api_call.message.kwargs.get("public_key"),
+            )
+
         if api_call.message.path == "queue":
             return self.resolve_future(
                 credentials=api_call.credentials, uid=api_call.message.kwargs["uid"]
@@ -1138,7 +1184,6 @@ class Server(AbstractServer):
         if is_blocking or self.is_subprocess:
             api_call = api_call.message
 
-            role = self.get_role_for_credentials(credentials=credentials)
             settings = self.get_settings()
             # TODO: This instance check should be removed once we can ensure that
             # self.settings will always return a ServerSettings object.
@@ -1151,13 +1196,6 @@ class Server(AbstractServer):
                 raise SyftException(
                     public_message="Server doesn't allow guest sessions."
                 )
-            context = AuthedServiceContext(
-                server=self,
-                credentials=credentials,
-                role=role,
-                job_id=job_id,
-                is_blocking_api_call=is_blocking,
-            )
 
             AuthServerContextRegistry.set_server_context(self.id, context, credentials)
 
@@ -1177,7 +1215,7 @@ class Server(AbstractServer):
             _private_api_path = user_config_registry.private_path_for(api_call.path)
             method = self.get_service_method(_private_api_path)
             try:
-                logger.info(f"API Call: {api_call}")
+                logger.info("API Call: %s", api_call)
 
                 result = method(context, *api_call.args, **api_call.kwargs)
 
@@ -1393,9 +1431,28 @@ class Server(AbstractServer):
         self.queue_stash.set_placeholder(credentials, queue_item).unwrap()
 
         self.services.log.add(context, log_id, queue_item.job_id)
+        self.notify_queue_producers(queue_item.id)
 
         return job
 
+    def notify_queue_producers(self, queue_item_id: UID | None = None) -> None:
+        """Wake up the queue producers of this server to dispatch a new queue item."""
+        # subprocess servers do not have a queue manager
+        queue_manager = getattr(self, "queue_manager", None)
+        if queue_manager is None:
+            return
+        for producer in queue_manager.producers.values():
+            producer.notify(queue_item_id)
+
+    def notify_action_object_resolved(self, action_object_id: UID) -> None:
+        """Wake up the queue items of this server that wait on `action_object_id`."""
+        # subprocess servers do not have a queue manager
+        queue_manager = getattr(self, "queue_manager", None)
+        if queue_manager is None:
+            return
+        for producer in queue_manager.producers.values():
+            producer.notify_resolved(action_object_id)
+
     def _sort_jobs(self, jobs: list[Job]) -> list[Job]:
         job_datetimes = {}
         for job in jobs:
@@ -1438,7 +1495,7 @@ class Server(AbstractServer):
         self, api_call: SyftAPICall, parent_job_id: UID | None = None
     ) -> SyftSuccess:
         unsigned_call = api_call
-        if isinstance(api_call, SignedSyftAPICall):
+        if isinstance(api_call, SignedSyftAPICall | SessionSyftAPICall):
             unsigned_call = api_call.message
 
         credentials = api_call.credentials
@@ -1563,6 +1620,17 @@ class Server(AbstractServer):
             communication_protocol=communication_protocol,
         )
 
+    def get_api_schema(
+        self,
+        for_user: SyftVerifyKey | None = None,
+        communication_protocol: PROTOCOL_TYPE | None = None,
+    ) -> tuple[str, bytes]:
+        return SyftAPI.schema_for_user(
+            server=self,
+            user_verify_key=for_user,
+            communication_protocol=communication_protocol,
+        )
+
     def get_method_with_context(
         self, function: Callable, context: ServerServiceContext
     ) -> Callable:
@@ -6,10 +6,8 @@ from collections.abc import Callable
 from collections.abc import Iterable
 from enum import Enum
 import inspect
-from io import BytesIO
 import logging
 from pathlib import Path
-import sys
 import threading
 import time
 import types
@@ -28,8 +26,8 @@ from typing_extensions import Self
 from ...client.api import SyftAPI
 from ...client.api import SyftAPICall
 from ...client.client import SyftClient
+from ...serde.buffers import serialize_framed
 from ...serde.serializable import serializable
-from ...serde.serialize import _serialize as serialize
 from ...server.credentials import SyftVerifyKey
 from ...service.blob_storage.util import can_upload_to_blob_storage
 from ...service.response import SyftSuccess
@@ -689,6 +687,8 @@ class ActionObject(SyncableSyftObject):
         "syft_action_data_cache": None,
         "syft_blob_storage_entry_id": None,
     }
+    # __setattr__ writes to __dict__ directly and the wrapped data is mutable
+    __cache_content_hash__: ClassVar[bool] = False
 
     __attr_searchable__: list[str] = []  # type: ignore[misc]
     syft_action_data_cache: Any | None = None
@@ -820,8 +820,10 @@ class ActionObject(SyncableSyftObject):
                             f" the blob store but to memory cache since it is small."
                         )
                     )
-                serialized = serialize(data, to_bytes=True)
-                size = sys.getsizeof(serialized)
+                # large array buffers are streamed out-of-band, without
+                # being copied into the serialized message
+                serialized = serialize_framed(data)
+                size = serialized.size
                 storage_entry = CreateBlobStorageEntry.from_obj(data, file_size=size)
 
                 if not TraceResultRegistry.current_thread_is_tracing():
@@ -836,7 +838,7 @@ class ActionObject(SyncableSyftObject):
                 )
                 if allocate_method is not None:
                     blob_deposit_object = allocate_method(storage_entry)
-                    blob_deposit_object.write(BytesIO(serialized)).unwrap()
+                    blob_deposit_object.write(serialized).unwrap()
                     self.syft_blob_storage_entry_id = (
                         blob_deposit_object.blob_storage_entry_id
                     )
@@ -569,6 +569,10 @@ class ActionService(AbstractService):
                     blob_permissions
                 )
 
+        # queue items waiting on this result can run now, twins are always resolved
+        if getattr(result_action_object, "syft_resolved", True):
+            context.server.notify_action_object_resolved(result_id)
+
         return set_result
 
     @as_result(SyftException)
@@ -1,10 +1,15 @@
 # future
 from __future__ import annotations
 
+# third party
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...types.errors import SyftException
@@ -130,5 +135,35 @@ class ActionObjectStash(ObjectStash[ActionObject]):
 
         return uid
 
+    @as_result(StashException)
+    @with_session
+    def get_unresolved_ids(
+        self,
+        credentials: SyftVerifyKey,
+        uids: list[UID],
+        session: Session = None,
+    ) -> set[UID]:
+        """
+        The `uids` of stored action objects that are not resolved yet, with a single
+        query that only reads the `syft_resolved` flag instead of the objects.
+        """
+        uids = [uid.id for uid in uids]  # We only need the UID from LineageID or UID
+        stmt = sa.select(self.table.c.id, self.table.c.fields["syft_resolved"]).where(
+            self.table.c.id.in_(uids)
+        )
+        stmt = self._apply_permission_filter(
+            stmt, credentials=credentials, session=session
+        )
+        # TwinObjects do not have the flag, they are always resolved.
+        # SQLite returns JSON booleans as 0 and 1
+        return {
+            uid
+            for uid, resolved in session.execute(stmt)
+            if resolved is not None and not resolved
+        }
+
     def set(self, *args, **kwargs):  # type: ignore
         raise Exception("Use `ActionObjectStash.set_or_update` instead.")
+
+    def set_many(self, *args, **kwargs):  # type: ignore
+        raise Exception("Use `ActionObjectStash.set_or_update` instead.")
@@ -38,6 +38,8 @@ from ...types.transforms import make_set_default
 from ...types.transforms import transform
 from ...types.uid import UID
 from ...util.misc_objs import MarkdownDescription
+from ..code.utils import compile_source
+from ..code.utils import function_source
 from ..context import AuthedServiceContext
 from ..response import SyftError
 from ..user.user import UserView
@@ -241,7 +243,7 @@ class Endpoint(SyftObject):
             local_scope: dict[str, Callable] = {}
 
             # Execute the function string within the local scope
-            exec(helper_code, local_scope)  # nosec
+            exec(compile_source(helper_code), local_scope)  # nosec
             helper_function_dict[helper_name] = local_scope[helper_name]
 
         helper_function_set = HelperFunctionSet(helper_function_dict)
@@ -277,10 +279,8 @@ class Endpoint(SyftObject):
     def call_locally(
         self, context: AuthedServiceContext, *args: Any, **kwargs: Any
     ) -> Any:
-        inner_function = ast.parse(self.api_code).body[0]
-        inner_function.decorator_list = []
         # compile the function
-        raw_byte_code = compile(ast.unparse(inner_function), "<string>", "exec")
+        raw_byte_code = compile_source(function_source(self.api_code))
 
         # load it
         exec(raw_byte_code)  # nosec
@@ -608,11 +608,9 @@ class TwinAPIEndpoint(SyncableSyftObject):
             else:
                 print = original_print  # type: ignore
 
-            inner_function = ast.parse(code.api_code).body[0]
-            inner_function.decorator_list = []
-            # compile the function
-            src = ast.unparse(inner_function)
-            raw_byte_code = compile(src, code.func_name, "exec")
+            # compile the function, without its decorators
+            src = function_source(code.api_code)
+            raw_byte_code = compile_source(src, code.func_name)
             register_fn_in_linecache(code.func_name, src)
             user_client = self.get_user_client_from_server(context)
             admin_client = self.get_admin_client_from_server(context)
@@ -75,6 +75,7 @@ from ..action.action_object import ActionObject
 from ..context import AuthedServiceContext
 from ..dataset.dataset import Asset
 from ..job.job_stash import Job
+from ..log.log_service import LogBuffer
 from ..output.output_service import ExecutionOutput
 from ..policy.policy import Constant
 from ..policy.policy import CustomInputPolicy
@@ -100,6 +101,7 @@ from ..user.user_roles import ServiceRole
 from .code_parse import LaunchJobVisitor
 from .unparse import unparse
 from .utils import check_for_global_vars
+from .utils import compile_source
 from .utils import parse_code
 from .utils import submit_subjobs_code
 
@@ -114,7 +116,7 @@ PyCodeObject = Any
 
 def compile_byte_code(parsed_code: str) -> PyCodeObject | None:
     try:
-        return compile(parsed_code, "<string>", "exec")
+        return compile_source(parsed_code)
     except Exception as e:
         print("WARNING: to compile byte code", e)
     return None
@@ -1918,9 +1920,12 @@ def execute_byte_code(
             def __setattr__(self, __name: str, __value: Any) -> None:
                 raise Exception("Attempting to alter read-only value")
 
+        log_buffer = None
         if context.job is not None:
             job_id = context.job_id
             log_id = context.job.log_id
+            if context.server is not None:
+                log_buffer = LogBuffer(context=context, log_id=log_id)
 
             def print(*args: Any, sep: str = " ", end: str = "\n") -> str | None:
                 def to_str(arg: Any) -> str:
@@ -1936,10 +1941,8 @@ def execute_byte_code(
 
                 new_args = [to_str(arg) for arg in args]
                 new_str = sep.join(new_args) + end
-                if context.server is not None:
-                    context.server.services.log.append(
-                        context=context, uid=log_id, new_str=new_str
-                    )
+                if log_buffer is not None:
+                    log_buffer.write(new_str)
                 time = datetime.datetime.now().strftime("%d/%m/%y %H:%M:%S")
                 return __builtin__.print(
                     f"{time} FUNCTION LOG ({job_id}):",
@@ -1977,7 +1980,7 @@ def execute_byte_code(
                 ).unwrap()
 
         _globals["print"] = print
-        exec(code_item.parsed_code, _globals, _locals)  # nosec
+        exec(compile_source(code_item.parsed_code), _globals, _locals)  # nosec
 
         evil_string = f"{code_item.unique_func_name}(**kwargs)"
 
@@ -2017,6 +2020,9 @@ def execute_byte_code(
                 result_message += error_msg
 
             result = SyftError(message=result_message)
+        finally:
+            if log_buffer is not None:
+                log_buffer.flush()
 
         # reset print
         print = original_print
@@ -1,6 +1,8 @@
 # stdlib
 import ast
+from functools import lru_cache
 import inspect
+from types import CodeType
 
 # third party
 from IPython import get_ipython
@@ -12,6 +14,25 @@ from .code_parse import GlobalsVisitor
 from .code_parse import LaunchJobVisitor
 
 
+# compiled code is shared by the whole process, it is keyed by the source
+# so updated code and endpoints are compiled again
+COMPILED_CODE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=COMPILED_CODE_CACHE_SIZE)
+def compile_source(source: str, filename: str = "<string>") -> CodeType:
+    """Compile the module `source`, the code objects are cached by their source."""
+    return compile(source, filename, "exec")
+
+
+@lru_cache(maxsize=COMPILED_CODE_CACHE_SIZE)
+def function_source(raw_code: str) -> str:
+    """The source of the first function in `raw_code` without its decorators."""
+    inner_function = ast.parse(raw_code).body[0]
+    inner_function.decorator_list = []
+    return ast.unparse(inner_function)
+
+
 def submit_subjobs_code(submit_user_code, ep_client) -> None:  # type: ignore
     # TODO: fix the mypy issue. Reason: circular import
     # We are exploring the source code to automatically upload
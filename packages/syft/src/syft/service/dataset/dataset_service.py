@@ -1,6 +1,4 @@
 # stdlib
-from collections.abc import Collection
-from collections.abc import Sequence
 import logging
 
 # relative
@@ -31,15 +29,15 @@ logger = logging.getLogger(__name__)
 
 
 def _paginate_collection(
-    collection: Collection,
+    total: int,
     page_size: int | None = 0,
     page_index: int | None = 0,
 ) -> slice | None:
+    """Slice of page `page_index` in a collection of `total` items, None for all."""
     if page_size is None or page_size <= 0:
         return None
 
     # If chunk size is defined, then split list into evenly sized chunks
-    total = len(collection)
     page_index = 0 if page_index is None else page_index
 
     if page_size > total or page_index >= total // page_size or page_index < 0:
@@ -50,22 +48,6 @@ def _paginate_collection(
     return slice(start, stop)
 
 
-def _paginate_dataset_collection(
-    datasets: Sequence[Dataset],
-    page_size: int | None = 0,
-    page_index: int | None = 0,
-) -> DictTuple[str, Dataset] | DatasetPageView:
-    slice_ = _paginate_collection(datasets, page_size=page_size, page_index=page_index)
-    chunk = datasets[slice_] if slice_ is not None else datasets
-    results = DictTuple(chunk, lambda dataset: dataset.name)
-
-    return (
-        results
-        if slice_ is None
-        else DatasetPageView(datasets=results, total=len(datasets))
-    )
-
-
 @serializable(canonical_name="DatasetService", version=1)
 class DatasetService(AbstractService):
     stash: DatasetStash
@@ -114,15 +96,7 @@ class DatasetService(AbstractService):
         page_index: int | None = 0,
     ) -> DatasetPageView | DictTuple[str, Dataset]:
         """Get a Dataset"""
-        datasets = self.stash.get_all_active(context.credentials).unwrap()
-
-        for dataset in datasets:
-            if context.server is not None:
-                dataset.server_uid = context.server.id
-
-        return _paginate_dataset_collection(
-            datasets=datasets, page_size=page_size, page_index=page_index
-        )
+        return self._get_page(context, page_size=page_size, page_index=page_index)
 
     @service_method(path="dataset.search", name="search", roles=GUEST_ROLE_LEVEL)
     def search(
@@ -133,17 +107,50 @@ class DatasetService(AbstractService):
         page_index: int | None = 0,
     ) -> DatasetPageView | DictTuple[str, Dataset]:
         """Search a Dataset by name"""
-        results = self.get_all(context)
+        return self._get_page(
+            context,
+            filters={"name__icontains": name},
+            page_size=page_size,
+            page_index=page_index,
+        )
 
-        filtered_results = [
-            dataset
-            for dataset_name, dataset in results.items()
-            if name in dataset_name and not dataset.to_be_deleted
-        ]
+    def _get_page(
+        self,
+        context: AuthedServiceContext,
+        filters: dict | None = None,
+        page_size: int | None = 0,
+        page_index: int | None = 0,
+    ) -> DatasetPageView | DictTuple[str, Dataset]:
+        # only the requested page is loaded, the total is counted by the database
+        slice_ = None
+        if page_size is not None and page_size > 0:
+            total = self.stash.count_active(
+                context.credentials, filters=filters
+            ).unwrap()
+            slice_ = _paginate_collection(
+                total, page_size=page_size, page_index=page_index
+            )
+
+        if slice_ is None:
+            datasets = self.stash.get_all_active(
+                context.credentials, filters=filters
+            ).unwrap()
+        else:
+            datasets = self.stash.get_all_active(
+                context.credentials,
+                filters=filters,
+                limit=slice_.stop - slice_.start,
+                offset=slice_.start,
+            ).unwrap()
 
-        return _paginate_dataset_collection(
-            filtered_results, page_size=page_size, page_index=page_index
-        )
+        for dataset in datasets:
+            if context.server is not None:
+                dataset.server_uid = context.server.id
+
+        results = DictTuple(datasets, lambda dataset: dataset.name)
+        if slice_ is None:
+            return results
+        return DatasetPageView(datasets=results, total=total)
 
     @service_method(path="dataset.get_by_id", name="get_by_id")
     def get_by_id(self, context: AuthedServiceContext, uid: UID) -> Dataset:
@@ -22,6 +22,18 @@ class DatasetStash(ObjectStash[Dataset]):
             filters={"action_ids__contains": uid},
         ).unwrap()
 
+    @as_result(StashException)
+    def count_active(
+        self,
+        credentials: SyftVerifyKey,
+        has_permission: bool = False,
+        filters: dict | None = None,
+    ) -> int:
+        filters = {**(filters or {}), "to_be_deleted": False}
+        return self.count(
+            credentials=credentials, filters=filters, has_permission=has_permission
+        ).unwrap()
+
     @as_result(StashException)
     def get_all_active(
         self,
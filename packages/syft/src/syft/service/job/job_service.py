@@ -132,6 +132,7 @@ class JobService(AbstractService):
 
         self.stash.set(context.credentials, job).unwrap()
         context.server.services.log.restart(context, job.log_id)
+        context.server.notify_queue_producers(queue_item.id)
 
         return SyftSuccess(message="Great Success!")
 
@@ -156,8 +157,10 @@ class JobService(AbstractService):
         if subjobs is not None:
             for subjob in subjobs:
                 subjob.status = JobStatus.TERMINATING
-                res = self.stash.update(context.credentials, obj=subjob).unwrap()
-                results.append(res)
+            updated_subjobs = self.stash.update_many(
+                context.credentials, objs=subjobs
+            ).unwrap()
+            results.extend(updated_subjobs)
 
         # wait for job and subjobs to be killed by MonitorThread
         wait_until(lambda: job.fetched_status == JobStatus.INTERRUPTED)
@@ -15,6 +15,7 @@ from typing_extensions import Self
 
 # relative
 from ...client.api import SyftAPICall
+from ...client.api import post_process_result
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...service.context import AuthedServiceContext
@@ -316,46 +317,56 @@ class Job(SyncableSyftObject):
         return self.get_api().services.log.get(self.log_id)
 
     def logs(
-        self, stdout: bool = True, stderr: bool = True, _print: bool = True
+        self,
+        stdout: bool = True,
+        stderr: bool = True,
+        _print: bool = True,
+        tail: int | None = None,
     ) -> str | None:
+        """Logs of the job, only the last `tail` lines of each log if it is set."""
         api = self.get_api()
 
-        has_permissions = True
+        def log_call(path: str, **kwargs: Any) -> SyftAPICall:
+            return SyftAPICall(
+                server_uid=self.server_uid,
+                path=path,
+                args=[],
+                kwargs={"uid": self.log_id, **kwargs},
+                blocking=True,
+            )
+
+        # the logs and the storage permission are fetched in one round trip
+        api_calls = {}
+        if stdout:
+            api_calls["stdout"] = log_call("log.get_stdout", tail=tail)
+        if stderr:
+            api_calls["stderr"] = log_call("log.get_stderr", tail=tail)
+        api_calls["storage_permission"] = log_call("log.has_storage_permission")
+        responses = dict(zip(api_calls, api.make_calls(list(api_calls.values()))))
 
         results = []
         if stdout:
-            stdout_log = api.services.log.get_stdout(self.log_id)
-            if isinstance(stdout_log, SyftError):
-                results.append(f"Log {self.log_id} not available")
-                has_permissions = False
-            else:
-                results.append(stdout_log)
+            stdout_log = post_process_result(
+                responses["stdout"], unwrap_on_success=True
+            )
+            results.append(stdout_log)
 
-        if stderr:
-            try:
-                stderr_log = api.services.log.get_stderr(self.log_id)
-                if isinstance(stderr_log, SyftError):
-                    results.append(f"Error log {self.log_id} not available")
-                    has_permissions = False
-                else:
-                    results.append(stderr_log)
-            except Exception:
-                # no access
-                if isinstance(self.result, Err):
-                    results.append(self.result.value)
-        else:
-            # add short error
-            if isinstance(self.result, Err):
-                results.append(self.result.value)
+        if stderr and not isinstance(responses["stderr"], SyftError):
+            stderr_log = post_process_result(
+                responses["stderr"], unwrap_on_success=True
+            )
+            results.append(stderr_log)
+        elif isinstance(self.result, Err):
+            # no access to the error log, or it was not requested: add short error
+            results.append(self.result.value)
 
-        if has_permissions:
-            has_storage_permission = api.services.log.has_storage_permission(
-                self.log_id
+        has_storage_permission = post_process_result(
+            responses["storage_permission"], unwrap_on_success=True
+        )
+        if not has_storage_permission:
+            prompt_warning_message(
+                message="This is a placeholder object, the real data lives on a different server and is not synced."
             )
-            if not has_storage_permission:
-                prompt_warning_message(
-                    message="This is a placeholder object, the real data lives on a different server and is not synced."
-                )
 
         results_str = "\n".join(results)
         if not _print:
@@ -1,11 +1,17 @@
 # stdlib
+from enum import Enum
+import time
 from typing import Any
 from typing import ClassVar
 
+# third party
+from pydantic import Field
+
 # relative
 from ...serde.serializable import serializable
 from ...service.context import AuthedServiceContext
 from ...types.syft_object import SYFT_OBJECT_VERSION_1
+from ...types.syft_object import SyftObject
 from ...types.syncable_object import SyncableSyftObject
 from ...types.uid import UID
 
@@ -40,3 +46,28 @@ class SyftLog(SyncableSyftObject):
         self, context: AuthedServiceContext, **kwargs: dict
     ) -> list[UID]:  # type: ignore
         return [self.job_id]
+
+
+@serializable(canonical_name="LogStream", version=1)
+class LogStream(str, Enum):
+    STDOUT = "stdout"
+    STDERR = "stderr"
+
+
+@serializable()
+class SyftLogChunk(SyftObject):
+    """
+    Text appended to a stream of a `SyftLog`. Chunks are only inserted, the text of
+    a log is the text stored on the `SyftLog` followed by its chunks in order.
+    """
+
+    __canonical_name__ = "SyftLogChunk"
+    __version__ = SYFT_OBJECT_VERSION_1
+
+    __attr_searchable__ = ["log_id", "stream", "timestamp"]
+    __order_by__ = ("timestamp", "asc")
+
+    log_id: UID
+    stream: LogStream = LogStream.STDOUT
+    text: str
+    timestamp: float = Field(default_factory=time.time)
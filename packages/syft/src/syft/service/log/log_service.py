@@ -1,7 +1,12 @@
+# stdlib
+import threading
+
 # relative
 from ...serde.serializable import serializable
 from ...store.db.db import DBManager
+from ...types.errors import SyftException
 from ...types.uid import UID
+from ..action.action_permissions import ActionObjectWRITE
 from ..action.action_permissions import StoragePermission
 from ..context import AuthedServiceContext
 from ..response import SyftSuccess
@@ -10,16 +15,28 @@ from ..service import TYPE_TO_SERVICE
 from ..service import service_method
 from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
+from .log import LogStream
 from .log import SyftLog
+from .log import SyftLogChunk
+from .log_stash import LogChunkStash
 from .log_stash import LogStash
+from .log_stash import tail_lines
+
+# A job's printed text is appended to its log once this many characters are buffered
+LOG_FLUSH_SIZE = 64 * 1024
+
+# or this many seconds after the first unflushed print
+LOG_FLUSH_INTERVAL_SEC = 1.0
 
 
 @serializable(canonical_name="LogService", version=1)
 class LogService(AbstractService):
     stash: LogStash
+    chunk_stash: LogChunkStash
 
     def __init__(self, store: DBManager) -> None:
         self.stash = LogStash(store=store)
+        self.chunk_stash = LogChunkStash(store=store)
 
     @service_method(path="log.add", name="add", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def add(
@@ -41,31 +58,60 @@ class LogService(AbstractService):
         new_str: str = "",
         new_err: str = "",
     ) -> SyftSuccess:
-        new_log = self.stash.get_by_uid(context.credentials, uid).unwrap()
-        if new_str:
-            new_log.append(new_str)
-
-        if new_err:
-            new_log.append_error(new_err)
-
-        self.stash.update(context.credentials, new_log).unwrap()
+        """
+        Append text to the log as new chunks, the stored log is neither read nor
+        rewritten.
+        """
+        permission = ActionObjectWRITE(uid=uid, credentials=context.credentials)
+        if not self.stash.has_permission(permission):
+            raise SyftException(
+                public_message=f"You do not have permission to append to log {uid}"
+            )
+
+        for stream, text in ((LogStream.STDOUT, new_str), (LogStream.STDERR, new_err)):
+            if text:
+                chunk = SyftLogChunk(log_id=uid, stream=stream, text=text)
+                self.chunk_stash.append(chunk).unwrap()
         return SyftSuccess(message="Log Append successful!")
 
+    def _get_text(
+        self,
+        log: SyftLog,
+        stream: LogStream,
+        tail: int | None = None,
+    ) -> str:
+        stored = log.stdout if stream == LogStream.STDOUT else log.stderr
+        text = self.chunk_stash.get_text(log.id, stream, tail=tail).unwrap()
+        if not stored:
+            return text
+        text = stored + text
+        return text if tail is None else tail_lines(text, tail)
+
+    def _with_chunks(self, log: SyftLog) -> SyftLog:
+        log.stdout = self._get_text(log, LogStream.STDOUT)
+        log.stderr = self._get_text(log, LogStream.STDERR)
+        return log
+
     @service_method(path="log.get", name="get", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def get(self, context: AuthedServiceContext, uid: UID) -> SyftLog:
-        return self.stash.get_by_uid(context.credentials, uid).unwrap()
+        log = self.stash.get_by_uid(context.credentials, uid).unwrap()
+        return self._with_chunks(log)
 
     @service_method(
         path="log.get_stdout", name="get_stdout", roles=DATA_SCIENTIST_ROLE_LEVEL
     )
-    def get_stdout(self, context: AuthedServiceContext, uid: UID) -> str:
-        result = self.get(context, uid)
-        return result.stdout
+    def get_stdout(
+        self, context: AuthedServiceContext, uid: UID, tail: int | None = None
+    ) -> str:
+        log = self.stash.get_by_uid(context.credentials, uid).unwrap()
+        return self._get_text(log, LogStream.STDOUT, tail=tail)
 
     @service_method(path="log.get_stderr", name="get_stderr", roles=ADMIN_ROLE_LEVEL)
-    def get_stderr(self, context: AuthedServiceContext, uid: UID) -> str:
-        result = self.get(context, uid)
-        return result.stderr
+    def get_stderr(
+        self, context: AuthedServiceContext, uid: UID, tail: int | None = None
+    ) -> str:
+        log = self.stash.get_by_uid(context.credentials, uid).unwrap()
+        return self._get_text(log, LogStream.STDERR, tail=tail)
 
     @service_method(path="log.restart", name="restart", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def restart(
@@ -76,15 +122,18 @@ class LogService(AbstractService):
         log = self.stash.get_by_uid(context.credentials, uid).unwrap()
         log.restart()
         self.stash.update(context.credentials, log).unwrap()
+        self.chunk_stash.delete_by_log_id(uid).unwrap()
         return SyftSuccess(message="Log Restart successful!")
 
     @service_method(path="log.get_all", name="get_all", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def get_all(self, context: AuthedServiceContext) -> list[SyftLog]:
-        return self.stash.get_all(context.credentials).unwrap()  # type: ignore
+        logs = self.stash.get_all(context.credentials).unwrap()
+        return [self._with_chunks(log) for log in logs]
 
     @service_method(path="log.delete", name="delete", roles=DATA_SCIENTIST_ROLE_LEVEL)
     def delete(self, context: AuthedServiceContext, uid: UID) -> SyftSuccess:
         self.stash.delete_by_uid(context.credentials, uid).unwrap()
+        self.chunk_stash.delete_by_log_id(uid).unwrap()
         return SyftSuccess(message=f"log {uid} succesfully deleted")
 
     @service_method(
@@ -98,4 +147,56 @@ class LogService(AbstractService):
         return result
 
 
+class LogBuffer:
+    """
+    Collects the text printed by a job and appends it to the job's log in chunks,
+    once `LOG_FLUSH_SIZE` characters are buffered or `LOG_FLUSH_INTERVAL_SEC` after
+    the first unflushed print. Call `flush` when the job is done.
+    """
+
+    def __init__(
+        self,
+        context: AuthedServiceContext,
+        log_id: UID,
+        flush_size: int = LOG_FLUSH_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL_SEC,
+    ) -> None:
+        self.context = context
+        self.log_id = log_id
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._texts: list[str] = []
+        self._size = 0
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        # flushes are serialized, so chunks are appended in the order of the prints
+        self._flush_lock = threading.Lock()
+
+    def write(self, text: str) -> None:
+        with self._lock:
+            self._texts.append(text)
+            self._size += len(text)
+            if self._size < self.flush_size:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.flush_interval, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                text = "".join(self._texts)
+                self._texts = []
+                self._size = 0
+            if text:
+                self.context.server.services.log.append(
+                    context=self.context, uid=self.log_id, new_str=text
+                )
+
+
 TYPE_TO_SERVICE[SyftLog] = LogService
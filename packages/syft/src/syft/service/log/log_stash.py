@@ -1,9 +1,97 @@
+# third party
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
+from ...store.document_store_errors import StashException
+from ...types.result import as_result
+from ...types.uid import UID
+from .log import LogStream
 from .log import SyftLog
+from .log import SyftLogChunk
+
+# Number of chunks read per query when looking for the last lines of a log
+LOG_TAIL_BATCH_SIZE = 100
 
 
 @serializable(canonical_name="LogStash", version=1)
 class LogStash(ObjectStash[SyftLog]):
     pass
+
+
+@serializable(canonical_name="LogChunkStash", version=1)
+class LogChunkStash(ObjectStash[SyftLogChunk]):
+    @as_result(StashException)
+    @with_session
+    def append(self, chunk: SyftLogChunk, session: Session = None) -> SyftLogChunk:
+        """
+        Insert `chunk` with a single INSERT and without permission rows, chunks are
+        only read through their `SyftLog`, whose permissions `LogService` checks.
+        """
+        stmt = self._insert().values(
+            id=chunk.id,
+            fields=self._serialize_fields(chunk),
+            storage_permissions=[self.server_uid.no_dash],
+        )
+        session.execute(stmt)
+        return chunk
+
+    @as_result(StashException)
+    @with_session
+    def get_text(
+        self,
+        log_id: UID,
+        stream: LogStream,
+        tail: int | None = None,
+        session: Session = None,
+    ) -> str:
+        """
+        Text of the chunks of `stream` of log `log_id`. With `tail`, only the last
+        `tail` lines are returned, and chunks are read newest first until they hold
+        enough lines.
+        """
+        filters = {"log_id": log_id, "stream": stream}
+        if tail is None:
+            chunks = self.get_all(
+                self.root_verify_key,
+                filters=filters,
+                has_permission=True,
+                session=session,
+            ).unwrap()
+            return "".join(chunk.text for chunk in chunks)
+
+        texts: list[str] = []
+        n_lines = 0
+        offset = 0
+        while True:
+            chunks = self.get_all(
+                self.root_verify_key,
+                filters=filters,
+                has_permission=True,
+                sort_order="desc",
+                limit=LOG_TAIL_BATCH_SIZE,
+                offset=offset,
+                session=session,
+            ).unwrap()
+            texts += [chunk.text for chunk in chunks]
+            # the last line of a log ends with a newline
+            n_lines += sum(chunk.text.count("\n") for chunk in chunks)
+            offset += len(chunks)
+            if n_lines > tail or len(chunks) < LOG_TAIL_BATCH_SIZE:
+                break
+        return tail_lines("".join(reversed(texts)), tail)
+
+    @as_result(StashException)
+    @with_session
+    def delete_by_log_id(self, log_id: UID, session: Session = None) -> None:
+        stmt = self.table.delete().where(self._get_field_filter("log_id", log_id))
+        session.execute(stmt)
+
+
+def tail_lines(text: str, n: int) -> str:
+    """Last `n` lines of `text`."""
+    if n <= 0:
+        return ""
+    return "".join(text.splitlines(keepends=True)[-n:])
@@ -267,48 +267,48 @@ class MigrationService(AbstractService):
 
         for key, objects in migrated_objects.items():
             created_objects[key] = []
-            for migrated_object in objects:
-                stash = self._search_stash_for_klass(
-                    context, type(migrated_object)
-                ).unwrap()
-
-                result = stash.set(
+            for stash, stash_objects in self._group_by_stash(context, objects).items():
+                created = stash.set_many(
                     context.credentials,
-                    obj=migrated_object,
+                    objs=stash_objects,
+                    ignore_duplicates=ignore_existing,
                     skip_check_type=skip_check_type,
-                )
-                # Exception from the new Error Handling pattern, no need to change
-                if result.is_err():
-                    # TODO: subclass a DuplicationKeyError
-                    if ignore_existing and (
-                        "Duplication Key Error" in result.err()._private_message  # type: ignore
-                        or "Duplication Key Error" in result.err().public_message  # type: ignore
-                    ):
+                ).unwrap()
+                created_uids = {obj.id for obj in created}
+                for migrated_object in stash_objects:
+                    if migrated_object.id not in created_uids:
                         print(
                             f"{type(migrated_object)} #{migrated_object.id} already exists"
                         )
-                        continue
-                    else:
-                        result.unwrap()  # this will raise the exception inside the wrapper
-                created_objects[key].append(result.unwrap())
+                created_objects[key].extend(created)
         return created_objects
 
     @as_result(SyftException)
     def _update_migrated_objects(
         self, context: AuthedServiceContext, migrated_objects: list[SyftObject]
     ) -> SyftSuccess:
-        for migrated_object in migrated_objects:
-            stash = self._search_stash_for_klass(
-                context, type(migrated_object)
-            ).unwrap()
-
-            stash.update(
+        for stash, stash_objects in self._group_by_stash(
+            context, migrated_objects
+        ).items():
+            stash.update_many(
                 context.credentials,
-                obj=migrated_object,
+                objs=stash_objects,
             ).unwrap()
 
         return SyftSuccess(message="Updated migration objects!")
 
+    def _group_by_stash(
+        self, context: AuthedServiceContext, objects: list[SyftObject]
+    ) -> dict[ObjectStash, list[SyftObject]]:
+        stashes: dict[type[SyftObject], ObjectStash] = {}
+        objects_by_stash: dict[ObjectStash, list[SyftObject]] = defaultdict(list)
+        for obj in objects:
+            klass = type(obj)
+            if klass not in stashes:
+                stashes[klass] = self._search_stash_for_klass(context, klass).unwrap()
+            objects_by_stash[stashes[klass]].append(obj)
+        return objects_by_stash
+
     @as_result(SyftException)
     def _migrate_objects(
         self,
@@ -3,6 +3,7 @@
 # relative
 from ...serde.serializable import serializable
 from ...store.db.db import DBManager
+from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...types.errors import SyftException
 from ...types.result import as_result
@@ -217,14 +218,12 @@ class NotificationService(AbstractService):
     def filter_by_obj(
         self, context: AuthedServiceContext, obj_uid: UID
     ) -> Notification:
-        notifications = self.stash.get_all(context.credentials).unwrap()
-        for notification in notifications:
-            if (
-                notification.linked_obj
-                and notification.linked_obj.object_uid == obj_uid
-            ):
-                return notification
-        raise SyftException(public_message="Could not get notifications!!")
+        try:
+            return self.stash.get_by_linked_obj_uid(
+                context.credentials, obj_uid=obj_uid
+            ).unwrap()
+        except NotFoundException:
+            raise SyftException(public_message="Could not get notifications!!")
 
 
 TYPE_TO_SERVICE[Notification] = NotificationService
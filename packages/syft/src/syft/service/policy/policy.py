@@ -27,6 +27,8 @@ from ...abstract_server import ServerType
 from ...client.api import APIRegistry
 from ...client.api import RemoteFunction
 from ...client.api import ServerIdentity
+from ...client.api import SyftAPICall
+from ...client.api import post_process_result
 from ...serde.recursive_primitives import recursive_serde_register_type
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
@@ -54,6 +56,7 @@ from ..context import AuthedServiceContext
 from ..context import ChangeContext
 from ..context import ServerServiceContext
 from ..dataset.dataset import Asset
+from ..response import SyftError
 
 # Use this for return type enums:
 # class MyEnum(Enum):
@@ -168,8 +171,7 @@ def partition_by_server(kwargs: dict[str, Any]) -> dict[ServerIdentity, dict[str
     from ...types.twin_object import TwinObject
     from ..action.action_object import ActionObject
 
-    # fetches the all the current api's connected
-    output_kwargs = {}
+    uids = {}
     for k, v in kwargs.items():
         uid = v
         if isinstance(v, ActionObject):
@@ -182,29 +184,48 @@ def partition_by_server(kwargs: dict[str, Any]) -> dict[ServerIdentity, dict[str
             uid = v.action_id
         if not isinstance(uid, UID):
             raise Exception(f"Input {k} must have a UID not {type(v)}")
+        uids[k] = uid
 
-        _obj_exists = False
-        for identity, api in APIRegistry.__api_registry__.items():
-            try:
-                if api.services.action.exists(uid):
-                    server_identity = ServerIdentity.from_api(api)
-                    if server_identity not in output_kwargs:
-                        output_kwargs[server_identity] = {k: uid}
-                    else:
-                        output_kwargs[server_identity].update({k: uid})
-
-                    _obj_exists = True
-                    break
-            except (requests.exceptions.ConnectionError, SyftException):
-                # To handle the cases , where there an old api objects in
-                # in APIRegistry
-                continue
-            except Exception as e:
-                print(f"Error in partition_by_server with identity {identity}", e)
-                raise e
-
-        if not _obj_exists:
-            raise Exception(f"Input data {k}:{uid} does not belong to any Datasite")
+    # fetches the all the current api's connected, and checks all the inputs that
+    # are not found yet in one round trip per api
+    output_kwargs: dict[ServerIdentity, dict[str, UID]] = {}
+    for identity, api in APIRegistry.__api_registry__.items():
+        if not uids:
+            break
+        api_calls = [
+            SyftAPICall(
+                server_uid=api.server_uid,
+                path="action.exists",
+                args=[],
+                kwargs={"obj_id": uid},
+                blocking=True,
+            )
+            for uid in uids.values()
+        ]
+        try:
+            results = api.make_calls(api_calls)
+        except (requests.exceptions.ConnectionError, SyftException):
+            # To handle the cases , where there an old api objects in
+            # in APIRegistry
+            continue
+        except Exception as e:
+            print(f"Error in partition_by_server with identity {identity}", e)
+            raise e
+
+        found = {
+            k: uid
+            for (k, uid), result in zip(uids.items(), results)
+            if not isinstance(result, SyftError)
+            and post_process_result(result, unwrap_on_success=True)
+        }
+        if found:
+            server_identity = ServerIdentity.from_api(api)
+            output_kwargs.setdefault(server_identity, {}).update(found)
+            uids = {k: uid for k, uid in uids.items() if k not in found}
+
+    if uids:
+        k, uid = next(iter(uids.items()))
+        raise Exception(f"Input data {k}:{uid} does not belong to any Datasite")
 
     return output_kwargs
 
@@ -1145,7 +1145,7 @@ class ProjectSubmit(SyftObject):
 
     # Unused at the moment
     project_permissions: set[str] = set()
-    consensus_model: ConsensusModel = DemocraticConsensusModel()
+    consensus_model: ConsensusModel = Field(default_factory=DemocraticConsensusModel)
 
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
@@ -64,6 +64,14 @@ class QueueProducer:
     ) -> None:
         raise NotImplementedError
 
+    def notify(self, uid: UID | None = None) -> None:
+        """Signal that the queue item `uid` (or any item if None) is ready to queue."""
+        pass
+
+    def notify_resolved(self, action_object_id: UID) -> None:
+        """Signal that the action object `action_object_id` was resolved."""
+        pass
+
     def close(self) -> None:
         raise NotImplementedError
 
@@ -2,14 +2,15 @@
 from enum import Enum
 import logging
 from multiprocessing import Process
+import os
 import threading
 from threading import Thread
-import time
 from typing import Any
 from typing import TYPE_CHECKING
 from typing import cast
 
 # third party
+from cachetools import LRUCache
 import psutil
 
 # relative
@@ -41,6 +42,7 @@ from .queue_stash import Status
 
 if TYPE_CHECKING:
     # relative
+    from ...server.server import Server
     from .queue_stash import QueueStash
 
 logger = logging.getLogger(__name__)
@@ -71,7 +73,7 @@ class MonitorThread(threading.Thread):
     def run(self) -> None:
         while not self.stop_requested.is_set():
             self.monitor()
-            time.sleep(self.interval)
+            self.stop_requested.wait(self.interval)
 
     def monitor(self) -> None:
         # Implement the monitoring logic here
@@ -101,6 +103,75 @@ class MonitorThread(threading.Thread):
             logger.warning(f"Failed to terminate job {job.id}: {e}")
 
 
+# Number of worker servers kept alive per process, one per server the consumers serve
+WORKER_SERVER_CACHE_SIZE = 8
+
+_worker_servers: LRUCache = LRUCache(maxsize=WORKER_SERVER_CACHE_SIZE)
+_worker_servers_lock = threading.Lock()
+
+
+def get_worker_server(worker_settings: WorkerSettings) -> "Server":
+    """
+    Server that runs the queue items of `worker_settings`.
+
+    The server is created on the first message and reused for the next ones, so its
+    DB engine, stashes and services are only initialized once per process. Job
+    processes forked by a consumer inherit the initialized server.
+    """
+    # relative
+    from ...server.server import Server
+
+    queue_config = worker_settings.queue_config
+    if queue_config is None:
+        raise ValueError(f"{worker_settings} has no queue configurations!")
+
+    key = (worker_settings.id, worker_settings.db_config.connection_string)
+    with _worker_servers_lock:
+        worker = _worker_servers.get(key)
+        if worker is None:
+            queue_config.client_config.create_producer = False
+            queue_config.client_config.n_consumers = 0
+
+            worker = Server(
+                id=worker_settings.id,
+                name=worker_settings.name,
+                signing_key=worker_settings.signing_key,
+                db_config=worker_settings.db_config,
+                blob_storage_config=worker_settings.blob_store_config,
+                server_side_type=worker_settings.server_side_type,
+                deployment_type=worker_settings.deployment_type,
+                queue_config=queue_config,
+                is_subprocess=True,
+                migrate=False,
+            )
+
+            # otherwise it reads it from env, resulting in the wrong credentials
+            worker.id = worker_settings.id
+            worker.signing_key = worker_settings.signing_key
+            _worker_servers[key] = worker
+    return worker
+
+
+def remove_worker_servers(server_id: UID) -> None:
+    """Drop the cached worker servers of `server_id`, called when it is stopped."""
+    with _worker_servers_lock:
+        for key in [key for key in _worker_servers if key[0] == server_id]:
+            worker = _worker_servers.pop(key)
+            worker.db.engine.dispose()
+
+
+def _reset_worker_servers_after_fork() -> None:
+    global _worker_servers_lock
+    # the lock can be held by another thread of the parent while forking
+    _worker_servers_lock = threading.Lock()
+    # pooled DB connections belong to the parent, the child opens its own
+    for worker in _worker_servers.values():
+        worker.db.engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_worker_servers_after_fork)
+
+
 @serializable(canonical_name="QueueManager", version=1)
 class QueueManager(BaseQueueManager):
     config: QueueConfig
@@ -168,29 +239,7 @@ def handle_message_multiprocessing(
     queue_item: QueueItem,
     credentials: SyftVerifyKey,
 ) -> None:
-    # this is a temp hack to prevent some multithreading issues
-    time.sleep(0.5)
-    queue_config = worker_settings.queue_config
-    if queue_config is None:
-        raise ValueError(f"{worker_settings} has no queue configurations!")
-    queue_config.client_config.create_producer = False
-    queue_config.client_config.n_consumers = 0
-
-    # relative
-    from ...server.server import Server
-
-    worker = Server(
-        id=worker_settings.id,
-        name=worker_settings.name,
-        signing_key=worker_settings.signing_key,
-        db_config=worker_settings.db_config,
-        blob_storage_config=worker_settings.blob_store_config,
-        server_side_type=worker_settings.server_side_type,
-        queue_config=queue_config,
-        is_subprocess=True,
-        migrate=False,
-        deployment_type=worker_settings.deployment_type,
-    )
+    worker = get_worker_server(worker_settings)
 
     # Set monitor thread for this job.
     monitor_thread = MonitorThread(queue_item, worker, credentials)
@@ -274,6 +323,7 @@ def handle_message_multiprocessing(
 
     # Finish monitor thread
     monitor_thread.stop()
+    monitor_thread.join()
 
 
 @serializable(canonical_name="APICallMessageHandler", version=1)
@@ -282,34 +332,14 @@ class APICallMessageHandler(AbstractMessageHandler):
 
     @staticmethod
     def handle_message(message: bytes, syft_worker_id: UID) -> None:
-        # relative
-        from ...server.server import Server
-
-        queue_item = deserialize(message, from_bytes=True)
+        queue_item = deserialize(message, from_bytes=True, trusted=True)
         queue_item = cast(QueueItem, queue_item)
         worker_settings = queue_item.worker_settings
         if worker_settings is None:
             raise ValueError("Worker settings are missing in the queue item.")
 
+        worker = get_worker_server(worker_settings)
         queue_config = worker_settings.queue_config
-        queue_config.client_config.create_producer = False
-        queue_config.client_config.n_consumers = 0
-
-        worker = Server(
-            id=worker_settings.id,
-            name=worker_settings.name,
-            signing_key=worker_settings.signing_key,
-            db_config=worker_settings.db_config,
-            server_side_type=worker_settings.server_side_type,
-            deployment_type=worker_settings.deployment_type,
-            queue_config=queue_config,
-            is_subprocess=True,
-            migrate=False,
-        )
-
-        # otherwise it reads it from env, resulting in the wrong credentials
-        worker.id = worker_settings.id
-        worker.signing_key = worker_settings.signing_key
 
         credentials = queue_item.syft_client_verify_key
         try:
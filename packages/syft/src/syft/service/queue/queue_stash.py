@@ -3,12 +3,16 @@ from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
+# third party
+from sqlalchemy.orm import Session
+
 # relative
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...server.worker_settings import WorkerSettings
 from ...server.worker_settings import WorkerSettingsV1
 from ...store.db.stash import ObjectStash
+from ...store.db.stash import with_session
 from ...store.document_store_errors import NotFoundException
 from ...store.document_store_errors import StashException
 from ...store.linked_obj import LinkedObject
@@ -21,6 +25,7 @@ from ...types.syft_object import SyftObject
 from ...types.transforms import TransformContext
 from ...types.uid import UID
 from ..action.action_permissions import ActionObjectPermission
+from ..action.action_permissions import ActionPermission
 
 __all__ = ["QueueItem"]
 
@@ -188,13 +193,45 @@ class QueueStash(ObjectStash[QueueItem]):
 
     @as_result(StashException)
     def get_by_status(
-        self, credentials: SyftVerifyKey, status: Status
+        self,
+        credentials: SyftVerifyKey,
+        status: Status,
+        uids: list[UID] | None = None,
     ) -> list[QueueItem]:
+        filters: dict[str, Any] = {"status": status}
+        if uids is not None:
+            filters["id__in"] = uids
         return self.get_all(
             credentials=credentials,
-            filters={"status": status},
+            filters=filters,
         ).unwrap()
 
+    @as_result(StashException)
+    @with_session
+    def claim(
+        self, credentials: SyftVerifyKey, item: QueueItem, session: Session = None
+    ) -> bool:
+        """
+        Mark `item` as PROCESSING with a single UPDATE that only matches while the
+        stored item is still CREATED. Returns False if another producer claimed it
+        first.
+        """
+        item.status = Status.PROCESSING
+        stmt = (
+            self.table.update()
+            .where(self._get_field_filter("id", item.id))
+            .where(self._get_field_filter("status", Status.CREATED))
+            .values(fields=self._serialize_fields(item))
+        )
+        stmt = self._apply_permission_filter(
+            stmt,
+            credentials=credentials,
+            permission=ActionPermission.WRITE,
+            session=session,
+        )
+        row = session.execute(stmt.returning(self.table.c.id)).first()
+        return row is not None
+
     @as_result(StashException)
     def _get_by_worker_pool(
         self, credentials: SyftVerifyKey, worker_pool: LinkedObject
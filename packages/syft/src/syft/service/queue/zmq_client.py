@@ -19,6 +19,7 @@ from .base_queue import QueueClientConfig
 from .base_queue import QueueConfig
 from .queue import ConsumerType
 from .queue_stash import QueueStash
+from .zmq_common import CONSUMER_PREFETCH_COUNT
 from .zmq_consumer import ZMQConsumer
 from .zmq_producer import ZMQProducer
 
@@ -101,10 +102,12 @@ class ZMQClient(QueueClient):
         address: str | None = None,
         worker_stash: WorkerStash | None = None,
         syft_worker_id: UID | None = None,
+        prefetch: int = CONSUMER_PREFETCH_COUNT,
     ) -> ZMQConsumer:
         """Add a consumer to a queue
 
-        A queue should have at least one producer attached to the group.
+        A queue should have at least one producer attached to the group. The
+        consumer accepts up to `prefetch` requests before replying to the first.
 
         """
 
@@ -118,6 +121,7 @@ class ZMQClient(QueueClient):
             service_name=service_name,
             syft_worker_id=syft_worker_id,
             worker_stash=worker_stash,
+            prefetch=prefetch,
         )
         self.consumers[queue_name].append(consumer)
 
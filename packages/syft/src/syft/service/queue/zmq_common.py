@@ -1,9 +1,13 @@
 # stdlib
+from collections import deque
+from enum import IntEnum
+import os
 import threading
 import time
 from typing import Any
 
 # third party
+from pydantic import Field
 from pydantic import field_validator
 
 # relative
@@ -30,6 +34,15 @@ WORKER_TIMEOUT_SEC = 60
 # Duration (in seconds) after which producer without a heartbeat will be marked as expired
 PRODUCER_TIMEOUT_SEC = 60
 
+# Duration (in seconds) between producer sweeps for queue items it was not notified of
+QUEUE_RECONCILE_INTERVAL_SEC = 5
+
+# Duration (in seconds) after which producer retries items that could not be queued yet
+QUEUE_RETRY_INTERVAL_SEC = 1
+
+# Number of requests a consumer accepts before it has replied to the earlier ones
+CONSUMER_PREFETCH_COUNT = int(os.getenv("CONSUMER_PREFETCH_COUNT", 1))
+
 # Lock for working on ZMQ socket
 ZMQ_SOCKET_LOCK = threading.Lock()
 
@@ -52,6 +65,13 @@ class ZMQCommand:
     W_DISCONNECT = b"0x05"
 
 
+class QueuePriority(IntEnum):
+    """Request lanes of a service, lower values are dispatched first"""
+
+    HIGH = 0
+    NORMAL = 1
+
+
 class Timeout:
     def __init__(self, offset_sec: float):
         self.__offset = float(offset_sec)
@@ -77,8 +97,27 @@ class Timeout:
 class Service:
     def __init__(self, name: str) -> None:
         self.name = name
-        self.requests: list[bytes] = []
-        self.waiting: list[Worker] = []  # List of waiting workers
+        # one lane of requests per priority
+        self.requests: list[deque[bytes]] = [deque() for _ in QueuePriority]
+        self.waiting: deque[Worker] = deque()  # Workers with credit left
+
+    def has_requests(self) -> bool:
+        return any(self.requests)
+
+    def push(self, msg: bytes, priority: QueuePriority = QueuePriority.NORMAL) -> None:
+        self.requests[priority].append(msg)
+
+    def pop(self) -> tuple[QueuePriority, bytes]:
+        """Oldest request of the highest priority lane."""
+        for priority in QueuePriority:
+            if self.requests[priority]:
+                return priority, self.requests[priority].popleft()
+        raise IndexError(f"Service {self.name} has no requests")
+
+    def requeue(self, requests: list[tuple[QueuePriority, bytes]]) -> None:
+        """Put `requests` back in front of their lanes, keeping their order."""
+        for priority, msg in reversed(requests):
+            self.requests[priority].appendleft(msg)
 
 
 class Worker(SyftBaseModel):
@@ -87,6 +126,9 @@ class Worker(SyftBaseModel):
     service: Service | None = None
     syft_worker_id: UID | None = None
     expiry_t: Timeout = Timeout(WORKER_TIMEOUT_SEC)
+    prefetch: int = 1
+    # requests sent to the worker that it has not replied to, oldest first
+    in_flight: deque[tuple[QueuePriority, bytes]] = Field(default_factory=deque)
 
     @field_validator("syft_worker_id", mode="before")
     @classmethod
@@ -95,6 +137,10 @@ class Worker(SyftBaseModel):
             return UID(v)
         return v
 
+    @property
+    def credit(self) -> int:
+        return self.prefetch - len(self.in_flight)
+
     def has_expired(self) -> bool:
         return self.expiry_t.has_expired()
 
@@ -17,6 +17,7 @@ from ..worker.worker_pool import ConsumerState
 from ..worker.worker_stash import WorkerStash
 from .base_queue import AbstractMessageHandler
 from .base_queue import QueueConsumer
+from .zmq_common import CONSUMER_PREFETCH_COUNT
 from .zmq_common import HEARTBEAT_INTERVAL_SEC
 from .zmq_common import PRODUCER_TIMEOUT_SEC
 from .zmq_common import THREAD_TIMEOUT_SEC
@@ -60,6 +61,7 @@ class ZMQConsumer(QueueConsumer):
         syft_worker_id: UID | None = None,
         worker_stash: WorkerStash | None = None,
         verbose: bool = False,
+        prefetch: int = CONSUMER_PREFETCH_COUNT,
     ) -> None:
         self.address = address
         self.message_handler = message_handler
@@ -73,6 +75,7 @@ class ZMQConsumer(QueueConsumer):
         self._stop = Event()
         self.syft_worker_id = syft_worker_id
         self.worker_stash = worker_stash
+        self.prefetch = prefetch
         self.post_init()
 
     @classmethod
@@ -121,7 +124,11 @@ class ZMQConsumer(QueueConsumer):
         # Register queue with the producer
         self.send_to_producer(
             ZMQCommand.W_READY,
-            [self.service_name.encode(), str(self.syft_worker_id).encode()],
+            [
+                self.service_name.encode(),
+                str(self.syft_worker_id).encode(),
+                str(self.prefetch).encode(),
+            ],
         )
 
     def post_init(self) -> None:
@@ -233,6 +240,7 @@ class ZMQConsumer(QueueConsumer):
                             logger.exception("Couldn't handle message", exc_info=e)
                         finally:
                             self.clear_job()
+                            self.send_reply()
                     elif command == ZMQCommand.W_HEARTBEAT:
                         self.set_producer_alive()
                     elif command == ZMQCommand.W_DISCONNECT:
@@ -263,6 +271,11 @@ class ZMQConsumer(QueueConsumer):
         # producer timer is within timeout
         return not self.producer_ping_t.has_expired()
 
+    def send_reply(self) -> None:
+        # ask for the next request now instead of on the next heartbeat
+        self.send_to_producer(ZMQCommand.W_REPLY)
+        self.heartbeat_t.reset()
+
     def send_heartbeat(self) -> None:
         if self.heartbeat_t.has_expired() and self.is_producer_alive():
             self.send_to_producer(ZMQCommand.W_HEARTBEAT)
@@ -1,11 +1,10 @@
 # stdlib
 from binascii import hexlify
-import itertools
+from collections import defaultdict
 import logging
-import sys
 import threading
 from threading import Event
-from time import sleep
+import time
 from typing import Any
 
 # third party
@@ -25,10 +24,15 @@ from ..service import AbstractService
 from ..worker.worker_pool import ConsumerState
 from ..worker.worker_stash import WorkerStash
 from .base_queue import QueueProducer
+from .queue_stash import APIEndpointQueueItem
 from .queue_stash import ActionQueueItem
+from .queue_stash import QueueItem
 from .queue_stash import QueueStash
 from .queue_stash import Status
 from .zmq_common import HEARTBEAT_INTERVAL_SEC
+from .zmq_common import QUEUE_RECONCILE_INTERVAL_SEC
+from .zmq_common import QUEUE_RETRY_INTERVAL_SEC
+from .zmq_common import QueuePriority
 from .zmq_common import Service
 from .zmq_common import THREAD_TIMEOUT_SEC
 from .zmq_common import Timeout
@@ -60,6 +64,14 @@ class ZMQProducer(QueueProducer):
         self.queue_name = queue_name
         self.auth_context = context
         self._stop = Event()
+        self._notified = Event()
+        self._pending_lock = threading.Lock()
+        self._pending: set[UID] = set()
+        self._resolved: set[UID] = set()
+        self._deferred: set[UID] = set()
+        # action object id -> ids of the queue items waiting on it, and the inverse
+        self._dependents: dict[UID, set[UID]] = defaultdict(set)
+        self._blocked: dict[UID, set[UID]] = {}
         self.post_init()
 
     @property
@@ -71,20 +83,28 @@ class ZMQProducer(QueueProducer):
 
         self.services: dict[str, Service] = {}
         self.workers: dict[bytes, Worker] = {}
-        self.waiting: list[Worker] = []
+        # workers with credit left, by identity
+        self.waiting: dict[bytes, Worker] = {}
         self.heartbeat_t = Timeout(HEARTBEAT_INTERVAL_SEC)
+        self.purge_t = Timeout(HEARTBEAT_INTERVAL_SEC)
         self.context = zmq.Context(1)
         self.socket = self.context.socket(zmq.ROUTER)
         self.socket.setsockopt(LINGER, 1)
         self.socket.setsockopt_string(zmq.IDENTITY, self.id)
+        # the queue thread wakes up the dispatch thread through an inproc socket
+        self.wakeup_address = f"inproc://wakeup-{self.id}"
+        self.wakeup_socket = self.context.socket(zmq.PAIR)
+        self.wakeup_socket.bind(self.wakeup_address)
         self.poll_workers = zmq.Poller()
         self.poll_workers.register(self.socket, zmq.POLLIN)
+        self.poll_workers.register(self.wakeup_socket, zmq.POLLIN)
         self.bind(f"tcp://*:{self.port}")
         self.thread: threading.Thread | None = None
         self.producer_thread: threading.Thread | None = None
 
     def close(self) -> None:
         self._stop.set()
+        self._notified.set()
         try:
             if self.thread:
                 self.thread.join(THREAD_TIMEOUT_SEC)
@@ -105,10 +125,12 @@ class ZMQProducer(QueueProducer):
                 self.producer_thread = None
 
             self.poll_workers.unregister(self.socket)
+            self.poll_workers.unregister(self.wakeup_socket)
         except Exception as e:
             logger.exception("Failed to unregister poller.", exc_info=e)
         finally:
             self.socket.close()
+            self.wakeup_socket.close()
             self.context.destroy()
 
     @property
@@ -119,110 +141,233 @@ class ZMQProducer(QueueProducer):
             raise Exception(f"{self.auth_context} does not have a server.")
 
     @as_result(SyftException)
-    def contains_unresolved_action_objects(self, arg: Any, recursion: int = 0) -> bool:
-        """recursively check collections for unresolved action objects"""
+    def get_unresolved_action_object_ids(
+        self, arg: Any, recursion: int = 0
+    ) -> set[UID]:
+        """recursively collect the ids of unresolved action objects in collections"""
         if isinstance(arg, UID):
             arg = self.action_service.get(self.auth_context, arg)
-            return self.contains_unresolved_action_objects(
+            return self.get_unresolved_action_object_ids(
                 arg, recursion=recursion + 1
             ).unwrap()
         if isinstance(arg, ActionObject):
             if not arg.syft_resolved:
                 arg = self.action_service.get(self.auth_context, arg)
                 if not arg.syft_resolved:
-                    return True
+                    return {arg.id.id}
             arg = arg.syft_action_data
 
-        value = False
+        unresolved: set[UID] = set()
         if isinstance(arg, list):
             for elem in arg:
-                value = self.contains_unresolved_action_objects(
+                unresolved |= self.get_unresolved_action_object_ids(
                     elem, recursion=recursion + 1
                 ).unwrap()
-                if value:
-                    return True
         if isinstance(arg, dict):
             for elem in arg.values():
-                value = self.contains_unresolved_action_objects(
+                unresolved |= self.get_unresolved_action_object_ids(
                     elem, recursion=recursion + 1
                 ).unwrap()
-                if value:
-                    return True
-        return value
-
-    def read_items(self) -> None:
-        while True:
-            if self._stop.is_set():
-                break
-            try:
-                sleep(1)
-
-                # Items to be queued
-                items_to_queue = self.queue_stash.get_by_status(
-                    self.queue_stash.root_verify_key,
-                    status=Status.CREATED,
-                ).unwrap()
+        return unresolved
+
+    def block(self, item_id: UID, action_object_ids: set[UID]) -> None:
+        """Wait with queue item `item_id` until the action objects are resolved."""
+        self._blocked[item_id] = action_object_ids
+        for action_object_id in action_object_ids:
+            self._dependents[action_object_id].add(item_id)
+
+    def unblock(self, action_object_ids: set[UID]) -> set[UID]:
+        """Remove resolved action objects from the index, returns the woken items."""
+        item_ids: set[UID] = set()
+        for action_object_id in action_object_ids:
+            item_ids |= self._dependents.get(action_object_id, set())
+        # the woken items are checked again, and blocked again if needed
+        self.unblock_items(item_ids)
+        return item_ids
+
+    def unblock_items(self, item_ids: set[UID]) -> None:
+        """Remove the queue items `item_ids` from the dependency index."""
+        for item_id in item_ids:
+            for action_object_id in self._blocked.pop(item_id, set()):
+                dependents = self._dependents.get(action_object_id)
+                if dependents is not None:
+                    dependents.discard(item_id)
+                    if not dependents:
+                        del self._dependents[action_object_id]
+
+    def get_unblocked(self, resolved: set[UID]) -> set[UID]:
+        """
+        Queue items that can be checked again, because an action object they wait
+        on was resolved. `resolved` are the action objects we were notified of, the
+        others are checked with one query for all blocked items.
+        """
+        if not self._dependents:
+            return set()
 
-                items_to_queue = [] if items_to_queue is None else items_to_queue
+        if self._dependents.keys() - resolved:
+            unresolved = self.action_service.stash.get_unresolved_ids(
+                self.auth_context.credentials,
+                uids=list(self._dependents.keys() - resolved),
+            ).unwrap()
+        else:
+            unresolved = set()
+        return self.unblock(self._dependents.keys() - unresolved)
+
+    def notify(self, uid: UID | None = None) -> None:
+        """Wake up the queue thread, `uid` is a queue item that was just created."""
+        if uid is not None:
+            with self._pending_lock:
+                self._pending.add(uid)
+        self._notified.set()
+
+    def notify_resolved(self, action_object_id: UID) -> None:
+        """Wake up the queue items that wait on the action object `action_object_id`."""
+        with self._pending_lock:
+            self._resolved.add(action_object_id.id)
+        self._notified.set()
 
-                # Queue Items that are in the processing state
-                items_processing = self.queue_stash.get_by_status(
-                    self.queue_stash.root_verify_key,
-                    status=Status.PROCESSING,
-                ).unwrap()
+    def read_items(self) -> None:
+        """
+        Move CREATED queue items to the requests of their worker pool service.
+
+        The thread sleeps until `notify` is called and then only loads the notified
+        items. Items waiting on unresolved action objects are kept in a dependency
+        index and only loaded again once one of those objects is resolved, either
+        through `notify_resolved` or a single check of all blocked objects every
+        `QUEUE_RETRY_INTERVAL_SEC`. Items whose worker pool is not registered yet
+        are retried at the same interval, and all CREATED items are swept every
+        `QUEUE_RECONCILE_INTERVAL_SEC` to pick up items nobody notified us about.
+        """
+        wakeup = self.context.socket(zmq.PAIR)
+        wakeup.connect(self.wakeup_address)
+        last_sweep = 0.0
+        last_retry = 0.0
+        try:
+            while not self._stop.is_set():
+                timeout = (
+                    QUEUE_RETRY_INTERVAL_SEC
+                    if self._deferred or self._dependents
+                    else QUEUE_RECONCILE_INTERVAL_SEC
+                )
+                self._notified.wait(timeout)
+                self._notified.clear()
+                if self._stop.is_set():
+                    break
+
+                with self._pending_lock:
+                    uids = self._pending
+                    resolved = self._resolved
+                    self._pending = set()
+                    self._resolved = set()
+
+                if time.monotonic() - last_retry >= QUEUE_RETRY_INTERVAL_SEC:
+                    last_retry = time.monotonic()
+                    uids |= self._deferred
+                    try:
+                        uids |= self.get_unblocked(resolved)
+                    except Exception as e:
+                        logger.exception(
+                            "ZMQProducer failed to check blocked items", exc_info=e
+                        )
+                elif resolved:
+                    uids |= self.unblock(resolved)
+
+                sweep = time.monotonic() - last_sweep >= QUEUE_RECONCILE_INTERVAL_SEC
+                if not sweep and not uids:
+                    continue
 
-                items_processing = [] if items_processing is None else items_processing
-
-                for item in itertools.chain(items_to_queue, items_processing):
-                    # TODO: if resolving fails, set queueitem to errored, and jobitem as well
-                    if item.status == Status.CREATED:
-                        if isinstance(item, ActionQueueItem):
-                            action = item.kwargs["action"]
-                            if (
-                                self.contains_unresolved_action_objects(
-                                    action.args
-                                ).unwrap()
-                                or self.contains_unresolved_action_objects(
-                                    action.kwargs
-                                ).unwrap()
-                            ):
-                                continue
-
-                        msg_bytes = serialize(item, to_bytes=True)
-                        worker_pool = item.worker_pool.resolve_with_context(
-                            self.auth_context
+                try:
+                    items_to_queue = self.queue_stash.get_by_status(
+                        self.queue_stash.root_verify_key,
+                        status=Status.CREATED,
+                        uids=None if sweep else list(uids),
+                    ).unwrap()
+                except Exception as e:
+                    logger.exception(
+                        "ZMQProducer failed to read queue items", exc_info=e
+                    )
+                    continue
+
+                if sweep:
+                    last_sweep = time.monotonic()
+                    # forget blocked items that are no longer CREATED
+                    created = {item.id for item in items_to_queue}
+                    self.unblock_items(self._blocked.keys() - created)
+                    # blocked items are only checked again once they are unblocked
+                    items_to_queue = [
+                        item for item in items_to_queue if item.id not in self._blocked
+                    ]
+                # items that are no longer CREATED do not need to be retried
+                self._deferred = self._deferred - uids
+
+                queued = False
+                for item in items_to_queue:
+                    try:
+                        queued = self.queue_item(item) or queued
+                    except Exception as e:
+                        logger.exception(
+                            f"ZMQProducer failed to queue item {item.id}", exc_info=e
+                        )
+                        item.status = Status.ERRORED
+                        self.queue_stash.update(
+                            item.syft_client_verify_key, item
                         ).unwrap()
-                        service_name = worker_pool.name
-                        service: Service | None = self.services.get(service_name)
 
-                        # Skip adding message if corresponding service/pool
-                        # is not registered.
-                        if service is None:
-                            continue
+                if queued:
+                    # wake up the dispatch thread, which polls the worker socket
+                    wakeup.send(b"")
+        finally:
+            wakeup.close()
 
-                        # append request message to the corresponding service
-                        # This list is processed in dispatch method.
+    def queue_item(self, item: QueueItem) -> bool:
+        """
+        Claim a CREATED `item` and append it to the requests of its service.
 
-                        # TODO: Logic to evaluate the CAN RUN Condition
-                        item.status = Status.PROCESSING
-                        self.queue_stash.update(
-                            item.syft_client_verify_key, item
-                        ).unwrap(public_message=f"failed to update queue item {item}")
-                        service.requests.append(msg_bytes)
-                    elif item.status == Status.PROCESSING:
-                        # Evaluate Retry condition here
-                        # If job running and timeout or job status is KILL
-                        # or heartbeat fails
-                        # or container id doesn't exists, kill process or container
-                        # else decrease retry count and mark status as CREATED.
-                        pass
-            except Exception as e:
-                # stdlib
-                import traceback
-
-                print(e, traceback.format_exc(), file=sys.stderr)
-                item.status = Status.ERRORED
-                self.queue_stash.update(item.syft_client_verify_key, item).unwrap()
+        Returns False if the item is not ready yet, in which case it is retried, or
+        if another producer claimed it first.
+        """
+        # TODO: if resolving fails, set queueitem to errored, and jobitem as well
+        if isinstance(item, ActionQueueItem):
+            action = item.kwargs["action"]
+            unresolved = (
+                self.get_unresolved_action_object_ids(action.args).unwrap()
+                | self.get_unresolved_action_object_ids(action.kwargs).unwrap()
+            )
+            if unresolved:
+                self.block(item.id, unresolved)
+                return False
+
+        msg_bytes = serialize(item, to_bytes=True)
+        worker_pool = item.worker_pool.resolve_with_context(self.auth_context).unwrap()
+        service_name = worker_pool.name
+        service: Service | None = self.services.get(service_name)
+
+        # Retry later if corresponding service/pool is not registered.
+        if service is None:
+            self._deferred.add(item.id)
+            return False
+
+        # TODO: Logic to evaluate the CAN RUN Condition
+        claimed = self.queue_stash.claim(item.syft_client_verify_key, item).unwrap(
+            public_message=f"failed to update queue item {item}"
+        )
+        if not claimed:
+            return False
+
+        # append request message to the corresponding service
+        # The lanes are processed in dispatch method.
+        service.push(msg_bytes, self.get_priority(item))
+        return True
+
+    @staticmethod
+    def get_priority(item: QueueItem) -> QueuePriority:
+        """
+        Actions and API endpoint calls are waited on by a running job or a client,
+        so they are dispatched before the jobs queued in the same worker pool.
+        """
+        if isinstance(item, ActionQueueItem | APIEndpointQueueItem):
+            return QueuePriority.HIGH
+        return QueuePriority.NORMAL
 
     def run(self) -> None:
         self.thread = threading.Thread(target=self._run)
@@ -243,31 +388,55 @@ class ZMQProducer(QueueProducer):
     def send_heartbeats(self) -> None:
         """Send heartbeats to idle workers if it's time"""
         if self.heartbeat_t.has_expired():
-            for worker in self.waiting:
+            for worker in self.waiting.values():
                 self.send_to_worker(worker, ZMQCommand.W_HEARTBEAT)
             self.heartbeat_t.reset()
 
     def purge_workers(self) -> None:
-        """Look for & kill expired workers.
+        """Look for & kill expired workers and workers marked for deletion.
 
-        Workers are oldest to most recent, so we stop at the first alive worker.
+        Expiry is checked against the last heartbeat of each idle worker, the
+        workers marked for deletion are loaded with one query every
+        `HEARTBEAT_INTERVAL_SEC`.
         """
-        # work on a copy of the iterator
-        for worker in self.waiting:
+        to_be_deleted: set[UID] = set()
+        if self.waiting and self.purge_t.has_expired():
+            self.purge_t.reset()
+            to_be_deleted = self.get_workers_to_be_deleted()
+
+        # work on a copy, deleting a worker removes it from the waiting workers
+        for worker in list(self.waiting.values()):
+            # busy workers do not send heartbeats, like before they only get purged
+            # once they are idle
+            if worker.in_flight:
+                continue
+            marked = worker.syft_worker_id in to_be_deleted
+            if not worker.has_expired() and not marked:
+                continue
+
             res = worker._syft_worker(self.worker_stash, self.auth_context.credentials)
             if res.is_err() or (syft_worker := res.ok()) is None:
                 logger.info(f"Failed to retrieve SyftWorker {worker.syft_worker_id}")
                 continue
 
-            if worker.has_expired() or syft_worker.to_be_deleted:
-                logger.info(f"Deleting expired worker id={worker}")
-                self.delete_worker(worker, syft_worker.to_be_deleted)
+            logger.info(f"Deleting expired worker id={worker}")
+            self.delete_worker(worker, marked)
+            self.auth_context.server.services.worker._delete(
+                self.auth_context, syft_worker
+            )
 
-                # relative
+    def get_workers_to_be_deleted(self) -> set[UID]:
+        if self.worker_stash is None:
+            return set()
 
-                self.auth_context.server.services.worker._delete(
-                    self.auth_context, syft_worker
-                )
+        try:
+            workers = self.worker_stash.get_all(
+                self.auth_context.credentials, filters={"to_be_deleted": True}
+            ).unwrap()
+        except Exception as e:
+            logger.exception("Failed to retrieve SyftWorkers to delete", exc_info=e)
+            return set()
+        return {worker.id for worker in workers}
 
     def update_consumer_state_for_worker(
         self, syft_worker_id: UID, consumer_state: ConsumerState
@@ -298,27 +467,39 @@ class ZMQProducer(QueueProducer):
             )
 
     def worker_waiting(self, worker: Worker) -> None:
-        """This worker is now waiting for work."""
+        """This worker can take more work, if it has credit left."""
+        worker.reset_expiry()
+        if worker.credit <= 0:
+            return
+
         # Queue to broker and service waiting lists
-        if worker not in self.waiting:
-            self.waiting.append(worker)
+        if worker.identity not in self.waiting:
+            self.waiting[worker.identity] = worker
+            if not worker.in_flight:
+                self.update_consumer_state_for_worker(
+                    worker.syft_worker_id, ConsumerState.IDLE
+                )
         if worker.service is not None and worker not in worker.service.waiting:
             worker.service.waiting.append(worker)
-        worker.reset_expiry()
-        self.update_consumer_state_for_worker(worker.syft_worker_id, ConsumerState.IDLE)
         self.dispatch(worker.service, None)
 
-    def dispatch(self, service: Service, msg: bytes) -> None:
-        """Dispatch requests to waiting workers as possible"""
+    def dispatch(self, service: Service, msg: bytes | None) -> None:
+        """Dispatch requests to waiting workers as possible
+
+        Workers take turns, so a request is only prefetched by a busy worker when
+        every waiting worker already got one.
+        """
         if msg is not None:  # Queue message if any
-            service.requests.append(msg)
-
-        self.purge_workers()
-        while service.waiting and service.requests:
-            # One worker consuming only one message at a time.
-            msg = service.requests.pop(0)
-            worker = service.waiting.pop(0)
-            self.waiting.remove(worker)
+            service.push(msg)
+
+        while service.waiting and service.has_requests():
+            worker = service.waiting.popleft()
+            priority, msg = service.pop()
+            worker.in_flight.append((priority, msg))
+            if worker.credit > 0:
+                service.waiting.append(worker)
+            else:
+                self.waiting.pop(worker.identity, None)
             self.send_to_worker(worker, ZMQCommand.W_REQUEST, msg)
 
     def send_to_worker(
@@ -362,7 +543,7 @@ class ZMQProducer(QueueProducer):
                     logger.info("ZMQProducer thread stopped")
                     return
 
-                for service in self.services.values():
+                for service in list(self.services.values()):
                     self.dispatch(service, None)
 
                 items = None
@@ -372,7 +553,14 @@ class ZMQProducer(QueueProducer):
                 except Exception as e:
                     logger.exception("ZMQProducer poll error", exc_info=e)
 
-                if items:
+                events = dict(items) if items else {}
+
+                if self.wakeup_socket in events:
+                    # new requests were queued, they are dispatched on the next loop
+                    while self.wakeup_socket.poll(0):
+                        self.wakeup_socket.recv()
+
+                if self.socket in events:
                     msg = self.socket.recv_multipart()
 
                     if len(msg) < 3:
@@ -412,6 +600,8 @@ class ZMQProducer(QueueProducer):
         if ZMQCommand.W_READY == command:
             service_name = data.pop(0).decode()
             syft_worker_id = data.pop(0).decode()
+            if data:
+                worker.prefetch = max(1, int(data.pop(0)))
             if worker_ready:
                 # Not first command in session or Reserved service name
                 # If worker was already present, then we disconnect it first
@@ -431,6 +621,15 @@ class ZMQProducer(QueueProducer):
                 worker.syft_worker_id = UID(syft_worker_id)
                 self.worker_waiting(worker)
 
+        elif ZMQCommand.W_REPLY == command:
+            if worker_ready:
+                # The oldest request is done, which frees one credit
+                if worker.in_flight:
+                    worker.in_flight.popleft()
+                self.worker_waiting(worker)
+            else:
+                logger.info(f"Got reply, but worker not ready. {worker}")
+                self.delete_worker(worker, True)
         elif ZMQCommand.W_HEARTBEAT == command:
             if worker_ready:
                 # If worker is ready then reset expiry
@@ -454,8 +653,12 @@ class ZMQProducer(QueueProducer):
         if worker.service and worker in worker.service.waiting:
             worker.service.waiting.remove(worker)
 
-        if worker in self.waiting:
-            self.waiting.remove(worker)
+        # the oldest request may be running, the prefetched ones were never started
+        if worker.service and len(worker.in_flight) > 1:
+            worker.service.requeue(list(worker.in_flight)[1:])
+        worker.in_flight.clear()
+
+        self.waiting.pop(worker.identity, None)
 
         self.workers.pop(worker.identity, None)
 
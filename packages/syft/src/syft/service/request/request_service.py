@@ -5,6 +5,7 @@ import logging
 from ...serde.serializable import serializable
 from ...server.credentials import SyftVerifyKey
 from ...store.db.db import DBManager
+from ...store.document_store_errors import NotFoundException
 from ...store.linked_obj import LinkedObject
 from ...types.errors import SyftException
 from ...types.result import as_result
@@ -14,6 +15,7 @@ from ..notification.email_templates import EmailTemplate
 from ..notification.email_templates import RequestEmailTemplate
 from ..notification.email_templates import RequestUpdateEmailTemplate
 from ..notification.notification_service import CreateNotification
+from ..notification.notifications import Notification
 from ..notifier.notifier_enums import NOTIFIERS
 from ..notifier.notifier_service import RateLimitException
 from ..response import SyftSuccess
@@ -23,6 +25,7 @@ from ..service import TYPE_TO_SERVICE
 from ..service import service_method
 from ..user.user_roles import ADMIN_ROLE_LEVEL
 from ..user.user_roles import DATA_SCIENTIST_ROLE_LEVEL
+from ..user.user import UserView
 from ..user.user_roles import GUEST_ROLE_LEVEL
 from .request import Change
 from .request import Request
@@ -149,27 +152,57 @@ class RequestService(AbstractService):
         page_size: int | None = 0,
     ) -> list[list[RequestInfo]] | list[RequestInfo]:
         """Get the information of all requests"""
-        result = self.stash.get_all(context.credentials).unwrap()
-        requests: list[RequestInfo] = []
-        for req in result:
-            user = context.server.services.user.get_by_verify_key(
-                req.requesting_user_verify_key
+        if page_size and page_index:
+            # a single page is requested, only load that page
+            result = self.stash.get_all(
+                context.credentials,
+                limit=page_size,
+                offset=page_index * page_size,
             ).unwrap()
-            message = context.server.services.notification.filter_by_obj(
-                context=context, obj_uid=req.id
+        else:
+            result = self.stash.get_all(context.credentials).unwrap()
+
+        # users and notifications are loaded with one query each, not one per request
+        verify_keys = list({req.requesting_user_verify_key for req in result})
+        user_stash = context.server.services.user.stash
+        users = user_stash.get_all_by_verify_keys(
+            user_stash.root_verify_key, verify_keys=verify_keys
+        ).unwrap()
+        users_by_verify_key = {str(user.verify_key): user for user in users}
+
+        notifications = (
+            context.server.services.notification.stash.get_all_by_linked_obj_uids(
+                context.credentials, obj_uids=[req.id for req in result]
             ).unwrap()
-            requests.append(RequestInfo(user=user, request=req, notification=message))
-        if not page_size:
+        )
+        notifications_by_obj_uid: dict[UID, Notification] = {}
+        for notification in notifications:
+            if notification.linked_obj is not None:
+                notifications_by_obj_uid.setdefault(
+                    notification.linked_obj.object_uid, notification
+                )
+
+        requests: list[RequestInfo] = []
+        for req in result:
+            user = users_by_verify_key.get(str(req.requesting_user_verify_key))
+            if user is None:
+                raise NotFoundException(
+                    private_message=f"User with verify key {req.requesting_user_verify_key} not found"
+                )
+            message = notifications_by_obj_uid.get(req.id)
+            if message is None:
+                raise SyftException(public_message="Could not get notifications!!")
+            requests.append(
+                RequestInfo(user=user.to(UserView), request=req, message=message)
+            )
+        if not page_size or page_index:
             return requests
 
         # If chunk size is defined, then split list into evenly sized chunks
         chunked_requests: list[list[RequestInfo]] = [
             requests[i : i + page_size] for i in range(0, len(requests), page_size)
         ]
-        if page_index:
-            return chunked_requests[page_index]
-        else:
-            return chunked_requests
+        return chunked_requests
 
     @service_method(path="request.add_changes", name="add_changes")
     def add_changes(
@@ -25,6 +25,7 @@ from ..api.api import TwinAPIEndpoint
 from ..code.user_code import UserCodeStatusCollection
 from ..context import AuthedServiceContext
 from ..job.job_stash import Job
+from ..log.log import SyftLog
 from ..response import SyftSuccess
 from ..service import AbstractService
 from ..service import TYPE_TO_SERVICE
@@ -55,25 +56,30 @@ class SyncService(AbstractService):
     def add_actionobject_read_permissions(
         self,
         context: AuthedServiceContext,
-        action_object: ActionObject,
-        new_permissions: list[ActionObjectPermission],
+        action_objects: list[ActionObject],
+        new_permissions: dict[UID, list[ActionObjectPermission]],
     ) -> None:
-        action_stash = context.server.services.action.stash
-        for permission in new_permissions:
-            if permission.permission == ActionPermission.READ:
-                action_stash.add_permission(permission)
-
-        blob_id = action_object.syft_blob_storage_entry_id
-        if blob_id:
-            blob_stash = context.server.services.blob_storage.stash
-            for permission in new_permissions:
-                if permission.permission == ActionPermission.READ:
-                    permission_blob = ActionObjectPermission(
-                        uid=blob_id,
-                        permission=permission.permission,
-                        credentials=permission.credentials,
+        read_permissions = []
+        blob_read_permissions = []
+        for action_object in action_objects:
+            blob_id = action_object.syft_blob_storage_entry_id
+            for permission in new_permissions[action_object.id.id]:
+                if permission.permission != ActionPermission.READ:
+                    continue
+                read_permissions.append(permission)
+                if blob_id:
+                    blob_read_permissions.append(
+                        ActionObjectPermission(
+                            uid=blob_id,
+                            permission=permission.permission,
+                            credentials=permission.credentials,
+                        )
                     )
-                    blob_stash.add_permission(permission_blob)
+
+        action_stash = context.server.services.action.stash
+        action_stash.add_permissions(read_permissions, ignore_missing=True).unwrap()
+        blob_stash = context.server.services.blob_storage.stash
+        blob_stash.add_permissions(blob_read_permissions, ignore_missing=True).unwrap()
 
     def set_obj_ids(self, context: AuthedServiceContext, x: Any) -> None:
         if hasattr(x, "__dict__") and isinstance(x, SyftObject):
@@ -123,62 +129,84 @@ class SyncService(AbstractService):
             raise ValueError(f"Could not find stash for {type(item)}")
         return stash
 
-    def add_permissions_for_item(
+    def add_permissions_for_items(
         self,
         context: AuthedServiceContext,
-        item: SyftObject,
-        new_permissions: list[ActionObjectPermission],
+        items: list[SyftObject],
+        new_permissions: dict[UID, list[ActionObjectPermission]],
     ) -> None:
-        if isinstance(item, ActionObject):
-            raise ValueError("ActionObject permissions should be added separately")
-        else:
+        read_permissions_by_store: dict[ObjectStash, list[ActionObjectPermission]] = (
+            defaultdict(list)
+        )
+        for item in items:
+            if isinstance(item, ActionObject):
+                raise ValueError("ActionObject permissions should be added separately")
             store = get_store(context, item)  # type: ignore
-            for permission in new_permissions:
-                if permission.permission == ActionPermission.READ:
-                    store.add_permission(permission)
+            read_permissions_by_store[store].extend(
+                permission
+                for permission in new_permissions[item.id.id]
+                if permission.permission == ActionPermission.READ
+            )
 
-    def add_storage_permissions_for_item(
+        for store, permissions in read_permissions_by_store.items():
+            store.add_permissions(permissions, ignore_missing=True).unwrap()
+
+    def add_storage_permissions_for_items(
         self,
         context: AuthedServiceContext,
-        item: SyftObject,
-        new_permissions: list[StoragePermission],
+        items: list[SyftObject],
+        new_permissions: dict[UID, list[StoragePermission]],
     ) -> None:
-        store = get_store(context, item)
-        store.add_storage_permissions(new_permissions)
+        permissions_by_store: dict[ObjectStash, list[StoragePermission]] = defaultdict(
+            list
+        )
+        for item in items:
+            store = get_store(context, item)  # type: ignore
+            permissions_by_store[store].extend(new_permissions[item.id.id])
+
+        for store, permissions in permissions_by_store.items():
+            store.add_storage_permissions(permissions, ignore_missing=True).unwrap()
 
     @as_result(SyftException)
-    def set_object(
-        self, context: AuthedServiceContext, item: SyncableSyftObject
-    ) -> SyftObject:
-        stash = self.get_stash_for_item(context, item).unwrap()
+    def set_objects(
+        self, context: AuthedServiceContext, items: list[SyncableSyftObject]
+    ) -> None:
         creds = context.credentials
 
-        obj = None
-        try:
-            obj = stash.get_by_uid(context.credentials, item.id).unwrap()
-        except (SyftException, KeyError):
-            obj = None
-
-        exists = obj is not None
-
-        if isinstance(item, TwinAPIEndpoint):
-            # we need the side effect of set function
-            # to create an action object
-            res = context.server.services.api.set(context=context, endpoint=item)
-            return item
-
-        if exists:
-            res = stash.update(creds, item).unwrap()
-        else:
+        stashes: dict[type, ObjectStash] = {}
+        items_by_stash: dict[ObjectStash, list[SyncableSyftObject]] = defaultdict(list)
+        for item in items:
+            if isinstance(item, TwinAPIEndpoint):
+                # we need the side effect of set function
+                # to create an action object
+                context.server.services.api.set(context=context, endpoint=item)
+                continue
+            if isinstance(item, SyftLog):
+                # the synced log holds all of its text, which replaces the local chunks
+                context.server.services.log.chunk_stash.delete_by_log_id(
+                    item.id
+                ).unwrap()
+            if type(item) not in stashes:
+                stashes[type(item)] = self.get_stash_for_item(context, item).unwrap()
+            items_by_stash[stashes[type(item)]].append(item)
+
+        for stash, stash_items in items_by_stash.items():
+            existing_uids = {
+                obj.id
+                for obj in stash.get_by_uids(
+                    creds, [item.id for item in stash_items]
+                ).unwrap()
+            }
+            stash.update_many(
+                creds, [item for item in stash_items if item.id in existing_uids]
+            ).unwrap()
             # Storage permissions are added separately
-            res = stash.set(
+            stash.set_many(
                 creds,
-                item,
+                [item for item in stash_items if item.id not in existing_uids],
                 add_storage_permission=False,
             ).unwrap()
 
-        return res
-
     @service_method(
         path="sync.sync_items",
         name="sync_items",
@@ -202,22 +230,22 @@ class SyncService(AbstractService):
         for storage_permission in storage_permissions:
             storage_permissions_dict[storage_permission.uid].append(storage_permission)
 
+        action_objects = []
+        items_to_set = []
         for item in items:
-            new_permissions = permissions_dict[item.id.id]
-            new_storage_permissions = storage_permissions_dict[item.id.id]
             if isinstance(item, ActionObject):
-                self.add_actionobject_read_permissions(context, item, new_permissions)
-                self.add_storage_permissions_for_item(
-                    context, item, new_storage_permissions
-                )
+                action_objects.append(item)
             else:
-                item = self.transform_item(context, item)  # type: ignore[unreachable]
-                self.set_object(context, item).unwrap()
+                items_to_set.append(self.transform_item(context, item))  # type: ignore[unreachable]
 
-                self.add_permissions_for_item(context, item, new_permissions)
-                self.add_storage_permissions_for_item(
-                    context, item, new_storage_permissions
-                )
+        self.add_actionobject_read_permissions(
+            context, action_objects, permissions_dict
+        )
+        self.set_objects(context, items_to_set).unwrap()
+        self.add_permissions_for_items(context, items_to_set, permissions_dict)
+        self.add_storage_permissions_for_items(
+            context, action_objects + items_to_set, storage_permissions_dict
+        )
 
         # NOTE include_items=False to avoid snapshotting the database
         # Snapshotting is disabled to avoid mongo size limit and performance issues
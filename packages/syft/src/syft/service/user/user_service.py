@@ -3,7 +3,6 @@ from datetime import datetime
 from datetime import timedelta
 import secrets
 import string
-from typing import TypeVar
 from typing import cast
 
 # relative
@@ -57,26 +56,14 @@ from .user_roles import ServiceRole
 from .user_roles import ServiceRoleCapability
 from .user_stash import UserStash
 
-T = TypeVar("T")
 
-
-def _paginate(
-    list_objs: list[T], page_size: int | None = 0, page_index: int | None = 0
-) -> list[T]:
-    # If chunk size is defined, then split list into evenly sized chunks
+def _page_limit_offset(
+    page_size: int | None = 0, page_index: int | None = 0
+) -> tuple[int | None, int]:
+    # If chunk size is defined, only the rows of page `page_index` are queried
     if page_size:
-        _list_objs = [
-            list_objs[i : i + page_size] for i in range(0, len(list_objs), page_size)
-        ]
-
-        # Return the proper slice using chunk_index
-        if page_index is not None:
-            _list_objs = _list_objs[page_index]  # type: ignore
-        else:
-            _list_objs = _list_objs[0]  # type: ignore
-        return _list_objs  # type: ignore
-
-    return list_objs
+        return page_size, page_size * (page_index or 0)
+    return None, 0
 
 
 @serializable(canonical_name="UserService", version=1)
@@ -324,13 +311,15 @@ class UserService(AbstractService):
         page_size: int | None = 0,
         page_index: int | None = 0,
     ) -> list[UserView]:
+        limit, offset = _page_limit_offset(page_size, page_index)
         users = self.stash.get_all(
             context.credentials,
             order_by=order_by,
             sort_order=sort_order,
+            limit=limit,
+            offset=offset,
         ).unwrap()
-        users = [user.to(UserView) for user in users]
-        return _paginate(users, page_size, page_index)
+        return [user.to(UserView) for user in users]
 
     @service_method(
         path="user.get_index", name="get_index", roles=DATA_OWNER_ROLE_LEVEL
@@ -390,12 +379,15 @@ class UserService(AbstractService):
         if len(kwargs) == 0:
             raise SyftException(public_message="Invalid search parameters")
 
+        limit, offset = _page_limit_offset(page_size, page_index)
         users = self.stash.get_all(
-            credentials=context.credentials, filters=kwargs
+            credentials=context.credentials,
+            filters=kwargs,
+            limit=limit,
+            offset=offset,
         ).unwrap()
 
-        users = [user.to(UserView) for user in users] if users is not None else []
-        return _paginate(users, page_size, page_index)
+        return [user.to(UserView) for user in users] if users is not None else []
 
     @as_result(StashException, NotFoundException)
     def get_user_id_for_credentials(self, credentials: SyftVerifyKey) -> UID:
@@ -518,6 +510,7 @@ class UserService(AbstractService):
         user = self.stash.update(
             credentials=context.credentials, obj=user, has_permission=True
         ).unwrap()
+        self.stash.db.invalidate_role(user.verify_key)
 
         if user.role == ServiceRole.ADMIN:
             settings_stash = SettingsStash(store=self.stash.db)
@@ -564,9 +557,9 @@ class UserService(AbstractService):
             )
 
         # TODO: Remove notifications for the deleted user
-        return self.stash.delete_by_uid(
-            credentials=context.credentials, uid=uid
-        ).unwrap()
+        self.stash.delete_by_uid(credentials=context.credentials, uid=uid).unwrap()
+        self.stash.db.invalidate_role(user_to_delete.verify_key)
+        return uid
 
     def exchange_credentials(self, context: UnauthedServiceContext) -> SyftSuccess:
         """Verify user
@@ -89,3 +89,12 @@ class UserStash(ObjectStash[User]):
         except NotFoundException as exc:
             private_msg = f"User with verify key {verify_key} not found"
             raise NotFoundException.from_exception(exc, private_message=private_msg)
+
+    @as_result(StashException)
+    def get_all_by_verify_keys(
+        self, credentials: SyftVerifyKey, verify_keys: list[SyftVerifyKey]
+    ) -> list[User]:
+        return self.get_all(
+            credentials=credentials,
+            filters={"verify_key__in": verify_keys},
+        ).unwrap()
@@ -625,18 +625,18 @@ class SyftWorkerPoolService(AbstractService):
             public_message=f"Failed to get queue items mapped to WorkerPool: {worker_pool.name}"
         )
 
-        items_to_interrupt = (
+        items_to_interrupt = [
             item
             for item in queue_items
             if item.status in (Status.CREATED, Status.PROCESSING)
-        )
+        ]
 
         for item in items_to_interrupt:
             item.status = Status.INTERRUPTED
-            context.server.services.queue.stash.update(
-                credentials=context.credentials,
-                obj=item,
-            ).unwrap()
+        context.server.services.queue.stash.update_many(
+            credentials=context.credentials,
+            objs=items_to_interrupt,
+        ).unwrap()
 
         if IN_KUBERNETES:
             # Scale the workers to zero
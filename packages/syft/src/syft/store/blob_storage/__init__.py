@@ -43,7 +43,7 @@ Read/retrieve SyftObject from blob storage
 # stdlib
 from collections.abc import Callable
 from collections.abc import Generator
-from io import BytesIO
+from io import BufferedIOBase
 import logging
 from typing import Any
 
@@ -147,6 +147,28 @@ def syft_iter_content(
                 raise SyftException(public_message=f"Max retries reached - {e}")
 
 
+def read_response_into_buffer(
+    response: requests.Response, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> bytearray:
+    """Read a response body into one writeable buffer, so that arrays stored
+    out-of-band in the blob can be deserialized as views instead of copies."""
+    content_length = response.headers.get("Content-Length")
+    if content_length is None or "Content-Encoding" in response.headers:
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            buffer += chunk
+        return buffer
+
+    buffer = bytearray(int(content_length))
+    offset = 0
+    with memoryview(buffer) as view:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            view[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+    del buffer[offset:]
+    return buffer
+
+
 @serializable()
 class BlobRetrievalByURL(BlobRetrieval):
     __canonical_name__ = "BlobRetrievalByURL"
@@ -200,14 +222,13 @@ class BlobRetrievalByURL(BlobRetrieval):
             if is_blob_file and stream:
                 return syft_iter_content(blob_url, chunk_size)
 
-            response = requests.get(str(blob_url), stream=stream)  # nosec
-            resp_content = response.content
+            response = requests.get(str(blob_url), stream=True)  # nosec
             response.raise_for_status()
 
-            return (
-                resp_content
-                if is_blob_file
-                else deserialize(resp_content, from_bytes=True)
+            if is_blob_file:
+                return response.content
+            return deserialize(
+                read_response_into_buffer(response, chunk_size), from_bytes=True
             )
         except requests.RequestException as e:
             raise SyftException(public_message=f"Failed to retrieve with error: {e}")
@@ -221,7 +242,7 @@ class BlobDeposit(SyftObject):
     blob_storage_entry_id: UID
 
     @as_result(SyftException)
-    def write(self, data: BytesIO) -> SyftSuccess:
+    def write(self, data: BufferedIOBase) -> SyftSuccess:
         raise NotImplementedError
 
 
@@ -1,5 +1,5 @@
 # stdlib
-from io import BytesIO
+from io import BufferedIOBase
 from pathlib import Path
 from typing import Any
 
@@ -30,7 +30,7 @@ class OnDiskBlobDeposit(BlobDeposit):
     __version__ = SYFT_OBJECT_VERSION_1
 
     @as_result(SyftException)
-    def write(self, data: BytesIO) -> SyftSuccess:
+    def write(self, data: BufferedIOBase) -> SyftSuccess:
         # relative
         from ...service.service import from_api_or_context
 
@@ -1,6 +1,6 @@
 # stdlib
 from collections.abc import Generator
-from io import BytesIO
+from io import BufferedIOBase
 import logging
 import math
 from queue import Queue
@@ -64,7 +64,7 @@ class SeaweedFSBlobDeposit(BlobDeposit):
     proxy_server_uid: UID | None = None
 
     @as_result(SyftException)
-    def write(self, data: BytesIO) -> SyftSuccess:
+    def write(self, data: BufferedIOBase) -> SyftSuccess:
         # relative
         api = self.get_api_wrapped()
 
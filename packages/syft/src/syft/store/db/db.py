@@ -1,14 +1,23 @@
 # stdlib
 import logging
+import os
 from pathlib import Path
+import threading
+import time
+from typing import Any
 from typing import Generic
 from typing import TypeVar
+from urllib.parse import parse_qsl
 from urllib.parse import urlparse
+import weakref
 
 # third party
+from cachetools import TTLCache
 from pydantic import BaseModel
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry
+from sqlalchemy.pool import QueuePool
 
 # relative
 from ...serde.serializable import serializable
@@ -17,39 +26,126 @@ from ...types.uid import UID
 from ...util.telemetry import instrument_sqlalchemny
 from .schema import PostgresBase
 from .schema import SQLiteBase
+from .schema import migrate_tables
 
 logger = logging.getLogger(__name__)
 instrument_sqlalchemny()
 
+# seconds a resolved user role is reused, this bounds how long a role change made
+# by another process on the same database goes unnoticed
+ROLE_CACHE_TTL = 10
+ROLE_CACHE_SIZE = 4096
+
+
+class PoolMetrics:
+    """Time spent waiting for a connection from the pool."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, wait: float) -> None:
+        with self.lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def to_dict(self) -> dict[str, float]:
+        with self.lock:
+            return {
+                "checkouts": self.checkouts,
+                "total_wait": self.total_wait,
+                "mean_wait": self.total_wait / self.checkouts
+                if self.checkouts
+                else 0.0,
+                "max_wait": self.max_wait,
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that records in `metrics` how long checkouts wait for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.metrics.record_wait(time.perf_counter() - start)
+
 
 @serializable(canonical_name="DBConfig", version=1)
 class DBConfig(BaseModel):
+    # connection pool, see `sqlalchemy.create_engine`
+    pool_size: int = 5
+    # connections opened on top of `pool_size` under load
+    max_overflow: int = 10
+    # seconds to wait for a connection before giving up
+    pool_timeout: float = 30.0
+    # seconds after which a connection is replaced, -1 to keep connections
+    pool_recycle: int = -1
+    # test connections for liveness on checkout
+    pool_pre_ping: bool = False
+    # number of compiled statements cached by SQLAlchemy
+    query_cache_size: int = 500
+
     @property
     def connection_string(self) -> str:
         raise NotImplementedError("Subclasses must implement this method.")
 
+    def engine_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for `create_engine`."""
+        return {
+            "poolclass": MeteredQueuePool,
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+            "query_cache_size": self.query_cache_size,
+        }
+
     @classmethod
     def from_connection_string(cls, conn_str: str) -> "DBConfig":
         # relative
         from .postgres import PostgresDBConfig
         from .sqlite import SQLiteDBConfig
 
+        # settings can be passed as query parameters, e.g. "?pool_size=20"
         parsed = urlparse(conn_str)
-        if parsed.scheme == "postgresql":
+        options = dict(parse_qsl(parsed.query))
+        scheme, _, driver = parsed.scheme.partition("+")
+        if driver:
+            options["driver"] = driver
+        if scheme == "postgresql":
             return PostgresDBConfig(
                 host=parsed.hostname,
                 port=parsed.port,
                 user=parsed.username,
                 password=parsed.password,
                 database=parsed.path.lstrip("/"),
+                **_known_options(PostgresDBConfig, options),
             )
-        elif parsed.scheme == "sqlite":
+        elif scheme == "sqlite":
             path = Path(parsed.path)
-            return SQLiteDBConfig(path=path.parent, filename=path.name)
+            return SQLiteDBConfig(
+                path=path.parent,
+                filename=path.name,
+                **_known_options(SQLiteDBConfig, options),
+            )
         else:
             raise ValueError(f"Unsupported database scheme: {parsed.scheme}")
 
 
+def _known_options(config_type: type[DBConfig], options: dict[str, str]) -> dict:
+    return {k: v for k, v in options.items() if k in config_type.model_fields}
+
+
 ConfigT = TypeVar("ConfigT", bound=DBConfig)
 
 
@@ -65,21 +161,70 @@ class DBManager(Generic[ConfigT]):
         self.server_uid = server_uid
         self.engine = create_engine(
             config.connection_string,
+            **config.engine_kwargs(),
             # json_serializer=dumps,
             # json_deserializer=loads,
         )
         logger.info(f"Connecting to {config.connection_string}")
         self.sessionmaker = sessionmaker(bind=self.engine)
+        self.reset_role_cache()
+        _db_managers.add(self)
         self.update_settings()
         logger.info(f"Successfully connected to {config.connection_string}")
 
     def update_settings(self) -> None:
         pass
 
+    def pool_status(self) -> dict[str, Any]:
+        """Connections in use and waits for a connection, for monitoring."""
+        pool = self.engine.pool
+        status: dict[str, Any] = {"status": pool.status()}
+        if isinstance(pool, QueuePool):
+            status.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+            )
+        if isinstance(pool, MeteredQueuePool):
+            status.update(pool.metrics.to_dict())
+        return status
+
+    def reset_role_cache(self) -> None:
+        # verify key -> ServiceRole, filled by ObjectStash.get_role
+        self.role_cache: TTLCache = TTLCache(
+            maxsize=ROLE_CACHE_SIZE, ttl=ROLE_CACHE_TTL
+        )
+        self.role_cache_lock = threading.Lock()
+
+    def invalidate_role(self, verify_key: SyftVerifyKey | None = None) -> None:
+        """Drop the cached role of `verify_key`, or of all users if it is None."""
+        with self.role_cache_lock:
+            if verify_key is None:
+                self.role_cache.clear()
+            else:
+                self.role_cache.pop(verify_key, None)
+
     def init_tables(self, reset: bool = False) -> None:
         Base = SQLiteBase if self.engine.dialect.name == "sqlite" else PostgresBase
 
         with self.sessionmaker().begin() as _:
             if reset:
                 Base.metadata.drop_all(bind=self.engine)
+                self.invalidate_role()
+            else:
+                migrate_tables(self.engine, Base.metadata)
             Base.metadata.create_all(self.engine)
+
+
+# DB managers of this process, see `_reset_db_managers_after_fork`
+_db_managers: weakref.WeakSet[DBManager] = weakref.WeakSet()
+
+
+def _reset_db_managers_after_fork() -> None:
+    # another thread of the parent can hold the role cache lock while forking,
+    # a job process forked by a consumer would then block on its first API call
+    for db_manager in _db_managers:
+        db_manager.reset_role_cache()
+
+
+os.register_at_fork(after_in_child=_reset_db_managers_after_fork)
@@ -1,3 +1,7 @@
+# stdlib
+from typing import Any
+from typing import Literal
+
 # third party
 from sqlalchemy import URL
 
@@ -16,11 +20,17 @@ class PostgresDBConfig(DBConfig):
     user: str
     password: str
     database: str
+    # connections in a pool can be dropped by the server or a proxy at any time
+    pool_pre_ping: bool = True
+    # "psycopg" is psycopg 3, which can prepare statements on the server
+    driver: Literal["psycopg2", "psycopg"] = "psycopg2"
+    # executions of a query after which psycopg prepares it, None to never prepare
+    prepare_threshold: int | None = 5
 
     @property
     def connection_string(self) -> str:
         return URL.create(
-            "postgresql",
+            f"postgresql+{self.driver}",
             username=self.user,
             password=self.password,
             host=self.host,
@@ -28,6 +38,12 @@ class PostgresDBConfig(DBConfig):
             database=self.database,
         ).render_as_string(hide_password=False)
 
+    def engine_kwargs(self) -> dict[str, Any]:
+        kwargs = super().engine_kwargs()
+        if self.driver == "psycopg":
+            kwargs["connect_args"] = {"prepare_threshold": self.prepare_threshold}
+        return kwargs
+
 
 class PostgresDBManager(DBManager[PostgresDBConfig]):
     def update_settings(self) -> None:
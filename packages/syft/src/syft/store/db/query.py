@@ -26,13 +26,45 @@ from ...service.user.user_roles import ServiceRole
 from ...types.syft_object import SyftObject
 from ...types.uid import UID
 from .errors import StashDBException
+from .schema import ANY_VERIFY_KEY
 from .schema import PostgresBase
 from .schema import SQLiteBase
+from .schema import attr_column_name
+from .schema import get_permission_table
+from .schema import is_array_attr
+from .schema import permission_row
+
+
+def make_permissions_clause(
+    table: Table, permission: ActionObjectPermission
+) -> sa.sql.elements.ColumnElement:
+    """
+    Semi-join on the permission table of `table`, true for the objects on which the
+    user of `permission` holds it, directly or through the compound (ALL_) permission.
+    """
+    permission_table = get_permission_table(table)
+    row = permission_row(permission)
+    compound_permission = permission.permission.as_compound.name
+    granted = sa.select(permission_table.c.object_id).where(
+        sa.or_(
+            sa.and_(
+                permission_table.c.verify_key == row["verify_key"],
+                permission_table.c.permission == row["permission"],
+            ),
+            sa.and_(
+                permission_table.c.verify_key == ANY_VERIFY_KEY,
+                permission_table.c.permission == compound_permission,
+            ),
+        )
+    )
+    return table.c.id.in_(granted)
 
 
 class FilterOperator(enum.Enum):
     EQ = "eq"
     CONTAINS = "contains"
+    IN = "in"
+    ICONTAINS = "icontains"
 
 
 class Query(ABC):
@@ -110,6 +142,8 @@ class Query(ABC):
         example usage:
         Query(User).filter("name", "eq", "Alice")
         Query(User).filter("friends", "contains", "Bob")
+        Query(User).filter("name", "in", ["Alice", "Bob"])
+        Query(User).filter("name", "icontains", "ali")
 
         Args:
             field (str): Field to filter on
@@ -195,10 +229,35 @@ class Query(ABC):
             except ValueError:
                 raise ValueError(f"Filter operator {operator} not supported")
 
+        # searchable attributes are served by their indexed column
+        attr_column = table.c.get(attr_column_name(field))
+        if attr_column is not None and operator == FilterOperator.EQ:
+            return attr_column == serialize_json(value)
+        elif attr_column is not None and operator == FilterOperator.IN:
+            return attr_column.in_([serialize_json(v) for v in value])
+
         if operator == FilterOperator.EQ:
             return self._eq_filter(table, field, value)
         elif operator == FilterOperator.CONTAINS:
             return self._contains_filter(table, field, value)
+        elif operator == FilterOperator.IN:
+            return self._in_filter(table, field, value)
+        elif operator == FilterOperator.ICONTAINS:
+            return self._icontains_filter(table, field, value)
+
+    def _icontains_filter(
+        self,
+        table: Table,
+        field: str,
+        value: str,
+    ) -> sa.sql.elements.BinaryExpression:
+        """Case insensitive substring match on a string field, LIKE '%value%'."""
+        attr_column = table.c.get(attr_column_name(field))
+        if attr_column is not None:
+            column = attr_column
+        else:
+            column = table.c.fields[field].as_string()
+        return column.icontains(value, autoescape=True)
 
     def order_by(
         self,
@@ -264,15 +323,41 @@ class Query(ABC):
         self.stmt = self.stmt.offset(offset)
         return self
 
-    @abstractmethod
+    def count(self, session: Session) -> int:
+        """Count the rows matching the query, ignoring its order, limit and offset."""
+        subquery = self.stmt.order_by(None).limit(None).offset(None).subquery()
+        stmt = sa.select(func.count()).select_from(subquery)
+        try:
+            return session.execute(stmt).scalar_one()
+        except DatabaseError as e:
+            raise StashDBException.from_sqlalchemy_error(e) from e
+
     def _make_permissions_clause(
         self,
         permission: ActionObjectPermission,
+    ) -> sa.sql.elements.ColumnElement:
+        return make_permissions_clause(self.table, permission)
+
+    @abstractmethod
+    def _contains_filter(
+        self,
+        table: Table,
+        field: str,
+        value: Any,
     ) -> sa.sql.elements.BinaryExpression:
         pass
 
     @abstractmethod
-    def _contains_filter(
+    def _eq_filter(
+        self,
+        table: Table,
+        field: str,
+        value: Any,
+    ) -> sa.sql.elements.BinaryExpression:
+        pass
+
+    @abstractmethod
+    def _in_filter(
         self,
         table: Table,
         field: str,
@@ -290,21 +375,13 @@ class Query(ABC):
         elif column == "deleted_date" or column == "_deleted_at":
             return self.table.c._deleted_at
 
+        attr_column = self.table.c.get(attr_column_name(column))
+        if attr_column is not None:
+            return attr_column
         return self.table.c.fields[column]
 
 
 class SQLiteQuery(Query):
-    def _make_permissions_clause(
-        self,
-        permission: ActionObjectPermission,
-    ) -> sa.sql.elements.BinaryExpression:
-        permission_string = permission.permission_string
-        compound_permission_string = permission.compound_permission_string
-        return sa.or_(
-            self.table.c.permissions.contains(permission_string),
-            self.table.c.permissions.contains(compound_permission_string),
-        )
-
     def _get_table(self, object_type: type[SyftObject]) -> Table:
         cname = object_type.__canonical_name__
         if cname not in SQLiteBase.metadata.tables:
@@ -336,18 +413,23 @@ class SQLiteQuery(Query):
         json_value = serialize_json(value)
         return table.c.fields[field] == func.json_quote(json_value)
 
-
-class PostgresQuery(Query):
-    def _make_permissions_clause(
-        self, permission: ActionObjectPermission
+    def _in_filter(
+        self,
+        table: Table,
+        field: str,
+        value: Any,
     ) -> sa.sql.elements.BinaryExpression:
-        permission_string = [permission.permission_string]
-        compound_permission_string = [permission.compound_permission_string]
-        return sa.or_(
-            self.table.c.permissions.contains(permission_string),
-            self.table.c.permissions.contains(compound_permission_string),
-        )
+        if field == "id":
+            return table.c.id.in_([UID(v) for v in value])
+
+        if "." in field:
+            field = field.split(".")  # type: ignore
 
+        json_values = [func.json_quote(serialize_json(v)) for v in value]
+        return table.c.fields[field].in_(json_values)
+
+
+class PostgresQuery(Query):
     def _contains_filter(
         self,
         table: Table,
@@ -355,6 +437,10 @@ class PostgresQuery(Query):
         value: Any,
     ) -> sa.sql.elements.BinaryExpression:
         field_value = serialize_json(value)
+        if is_array_attr(self.object_type, field):
+            # JSONB containment, served by the GIN index on fields
+            return table.c.fields.contains({field: [field_value]})
+
         col = sa.cast(table.c.fields[field], sa.Text)
         val = sa.cast(field_value, sa.Text)
         return col.contains(val)
@@ -381,3 +467,18 @@ class PostgresQuery(Query):
         json_value = serialize_json(value)
         # NOTE: there might be a bug with casting everything to text
         return table.c.fields[field].astext == sa.cast(json_value, sa.Text)
+
+    def _in_filter(
+        self,
+        table: Table,
+        field: str,
+        value: Any,
+    ) -> sa.sql.elements.BinaryExpression:
+        if field == "id":
+            return table.c.id.in_([UID(v) for v in value])
+
+        if "." in field:
+            field = field.split(".")  # type: ignore
+
+        json_values = [sa.cast(serialize_json(v), sa.Text) for v in value]
+        return table.c.fields[field].astext.in_(json_values)
@@ -1,20 +1,37 @@
 # stdlib
-
-# stdlib
+from collections.abc import Iterable
+from enum import Enum
+from types import UnionType
+from typing import Any
+from typing import Union
+from typing import get_args
+from typing import get_origin
 import uuid
 
 # third party
+from pydantic import EmailStr
 import sqlalchemy as sa
 from sqlalchemy import Column
+from sqlalchemy import Computed
 from sqlalchemy import Dialect
+from sqlalchemy import Engine
+from sqlalchemy import Index
 from sqlalchemy import Table
 from sqlalchemy import TypeDecorator
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.schema import CreateColumn
 from sqlalchemy.types import JSON
 
 # relative
+from ...serde.json_serde import get_property_return_type
+from ...server.credentials import SyftSigningKey
+from ...server.credentials import SyftVerifyKey
+from ...service.action.action_permissions import COMPOUND_ACTION_PERMISSION
+from ...service.action.action_permissions import ActionObjectPermission
+from ...types.datetime import DateTime
 from ...types.syft_object import SyftObject
+from ...types.uid import LineageID
 from ...types.uid import UID
 
 
@@ -41,6 +58,91 @@ class UIDTypeDecorator(TypeDecorator):
             return UID(value)
 
 
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def get_attr_annotation(object_type: type[SyftObject], attr: str) -> Any:
+    """Annotation of a field or @property of `object_type`, without Optional."""
+    field_info = object_type.model_fields.get(attr)
+    if field_info is not None:
+        annotation = field_info.annotation
+    else:
+        annotation = get_property_return_type(object_type, attr)
+    return _unwrap_optional(annotation)
+
+
+def is_array_attr(object_type: type[SyftObject], attr: str) -> bool:
+    return get_origin(get_attr_annotation(object_type, attr)) in (list, set, tuple)
+
+
+def attr_column_name(attr: str) -> str:
+    return f"_attr_{attr}"
+
+
+def _attr_column_type(annotation: Any) -> type[sa.types.TypeEngine] | None:
+    """SQL type of the JSON value of `annotation`, None if it is not a scalar."""
+    if not isinstance(annotation, type):
+        return None
+    # enums are stored by name, bool is a subclass of int
+    if issubclass(annotation, Enum):
+        return sa.String
+    if issubclass(annotation, bool):
+        return sa.Boolean
+    if issubclass(annotation, int):
+        return sa.BigInteger
+    if issubclass(annotation, float | DateTime):
+        return sa.Float
+    if issubclass(
+        annotation, str | EmailStr | UID | LineageID | SyftVerifyKey | SyftSigningKey
+    ):
+        return sa.String
+    return None
+
+
+def _attr_column_expression(
+    attr: str, column_type: type[sa.types.TypeEngine], dialect_name: str
+) -> str:
+    if dialect_name == "sqlite":
+        return f"json_extract(fields, '$.{attr}')"
+
+    expression = f"(fields ->> '{attr}')"
+    if column_type is sa.Boolean:
+        return f"{expression}::boolean"
+    elif column_type is sa.BigInteger:
+        return f"{expression}::bigint"
+    elif column_type is sa.Float:
+        return f"{expression}::double precision"
+    return expression
+
+
+def _attr_columns(object_type: type[SyftObject], dialect_name: str) -> Iterable[Column]:
+    """
+    Indexed columns generated from the `fields` JSON, for the searchable and unique
+    attributes that hold a scalar.
+    """
+    attrs = set(getattr(object_type, "__attr_searchable__", []))
+    attrs |= set(getattr(object_type, "__attr_unique__", []))
+    attrs.discard("id")
+
+    for attr in sorted(attrs):
+        column_type = _attr_column_type(get_attr_annotation(object_type, attr))
+        if column_type is None:
+            continue
+        expression = _attr_column_expression(attr, column_type, dialect_name)
+        yield Column(
+            attr_column_name(attr),
+            column_type,
+            # SQLite can only add virtual columns to existing tables
+            Computed(expression, persisted=dialect_name != "sqlite"),
+            index=True,
+        )
+
+
 def create_table(
     object_type: type[SyftObject],
     dialect: Dialect,
@@ -49,6 +151,10 @@ def create_table(
 
     To create the table on the database, you must call `Base.metadata.create_all(engine)`.
 
+    Searchable and unique attributes get an indexed column generated from the
+    `fields` JSON, which `Query` filters on instead of the JSON. On postgres, `fields`
+    is JSONB with a GIN index for `contains` filters.
+
     Args:
         object_type (type[SyftObject]): The type of the object to create a table for.
         dialect (Dialect): The dialect of the database.
@@ -59,19 +165,17 @@ def create_table(
     table_name = object_type.__canonical_name__
     dialect_name = dialect.name
 
-    fields_type = JSON if dialect_name == "sqlite" else postgresql.JSON
-    permissions_type = JSON if dialect_name == "sqlite" else postgresql.JSONB
+    fields_type = JSON if dialect_name == "sqlite" else postgresql.JSONB
     storage_permissions_type = JSON if dialect_name == "sqlite" else postgresql.JSONB
 
     Base = SQLiteBase if dialect_name == "sqlite" else PostgresBase
 
     if table_name not in Base.metadata.tables:
-        Table(
+        table = Table(
             object_type.__canonical_name__,
             Base.metadata,
             Column("id", UIDTypeDecorator, primary_key=True, default=uuid.uuid4),
             Column("fields", fields_type, default={}),
-            Column("permissions", permissions_type, default=[]),
             Column(
                 "storage_permissions",
                 storage_permissions_type,
@@ -82,6 +186,144 @@ def create_table(
             ),
             Column("_updated_at", sa.DateTime, server_onupdate=sa.func.now()),
             Column("_deleted_at", sa.DateTime, index=True),
+            *_attr_columns(object_type, dialect_name),
         )
+        if dialect_name == "postgresql":
+            Index(f"ix_{table_name}_fields", table.c.fields, postgresql_using="gin")
+        create_permission_table(table)
 
     return Base.metadata.tables[table_name]
+
+
+# verify_key of permissions that are granted to everyone (ALL_READ, ...)
+ANY_VERIFY_KEY = "*"
+
+
+def permission_table_name(table_name: str) -> str:
+    return f"{table_name}_permissions"
+
+
+def create_permission_table(table: Table) -> Table:
+    """
+    Create the permission table of an object table, one row per
+    (object_id, permission, verify_key).
+
+    The primary key serves permission lookups by object, the
+    (verify_key, permission, object_id) index serves the permission filter of queries.
+    """
+    name = permission_table_name(table.name)
+    return Table(
+        name,
+        table.metadata,
+        Column(
+            "object_id",
+            UIDTypeDecorator,
+            sa.ForeignKey(table.c.id, ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        Column("permission", sa.String, primary_key=True),
+        Column("verify_key", sa.String, primary_key=True),
+        Index(
+            f"ix_{name}_verify_key_permission", "verify_key", "permission", "object_id"
+        ),
+    )
+
+
+def get_permission_table(table: Table) -> Table:
+    return table.metadata.tables[permission_table_name(table.name)]
+
+
+def permission_row(permission: ActionObjectPermission) -> dict[str, Any]:
+    if (
+        permission.permission in COMPOUND_ACTION_PERMISSION
+        or permission.credentials is None
+    ):
+        verify_key = ANY_VERIFY_KEY
+    else:
+        verify_key = str(permission.credentials.verify)
+    return {
+        "object_id": permission.uid.id,
+        "permission": permission.permission.name,
+        "verify_key": verify_key,
+    }
+
+
+def permission_row_from_string(uid: UID, permission_string: str) -> dict[str, Any]:
+    if "_" in permission_string and not permission_string.startswith("ALL_"):
+        verify_key, permission = permission_string.split("_", 1)
+    else:
+        verify_key, permission = ANY_VERIFY_KEY, permission_string
+    return {"object_id": uid, "permission": permission, "verify_key": verify_key}
+
+
+def permission_string_from_row(permission: str, verify_key: str) -> str:
+    if verify_key == ANY_VERIFY_KEY:
+        return permission
+    return f"{verify_key}_{permission}"
+
+
+def migrate_tables(engine: Engine, metadata: sa.MetaData) -> None:
+    """
+    Bring tables created by an earlier version of the schema up to date with `metadata`.
+
+    Missing columns are added, generated columns are backfilled by the database.
+    Missing indexes are created, and the postgres `fields` column is converted to JSONB.
+    Permission tables are created and filled from the JSON `permissions` column that
+    held the permissions before, the column itself is left in place.
+    """
+    inspector = sa.inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    with engine.begin() as connection:
+        for table in metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing_columns = {
+                column["name"]: column for column in inspector.get_columns(table.name)
+            }
+
+            if engine.dialect.name == "postgresql" and not isinstance(
+                existing_columns["fields"]["type"], postgresql.JSONB
+            ):
+                connection.execute(
+                    sa.text(
+                        f'ALTER TABLE "{table.name}" '
+                        "ALTER COLUMN fields TYPE JSONB USING fields::jsonb"
+                    )
+                )
+
+            for column in table.columns:
+                if column.name not in existing_columns:
+                    column_ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                    connection.execute(
+                        sa.text(f'ALTER TABLE "{table.name}" ADD COLUMN {column_ddl}')
+                    )
+
+            for index in table.indexes:
+                index.create(connection, checkfirst=True)
+
+            permission_table = table.metadata.tables.get(
+                permission_table_name(table.name)
+            )
+            if (
+                permission_table is not None
+                and permission_table.name not in existing_tables
+                and "permissions" in existing_columns
+            ):
+                permission_table.create(connection)
+                _backfill_permissions(connection, table, permission_table)
+
+
+def _backfill_permissions(
+    connection: sa.Connection, table: Table, permission_table: Table
+) -> None:
+    permissions_type = JSON if connection.dialect.name == "sqlite" else postgresql.JSONB
+    stmt = sa.select(
+        table.c.id, sa.column("permissions", permissions_type)
+    ).select_from(table)
+    rows = [
+        permission_row_from_string(uid, permission_string)
+        for uid, permission_strings in connection.execute(stmt)
+        for permission_string in set(permission_strings or [])
+    ]
+    if rows:
+        connection.execute(permission_table.insert(), rows)
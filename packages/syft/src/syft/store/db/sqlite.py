@@ -1,11 +1,13 @@
 # stdlib
 from pathlib import Path
 import tempfile
+from typing import Any
 import uuid
 
 # third party
 from pydantic import Field
-import sqlalchemy as sa
+from sqlalchemy import event
+from sqlalchemy.pool import SingletonThreadPool
 
 # relative
 from ...serde.serializable import serializable
@@ -20,6 +22,15 @@ from .db import DBManager
 class SQLiteDBConfig(DBConfig):
     filename: str = Field(default_factory=lambda: f"{uuid.uuid4()}.db")
     path: Path = Field(default_factory=lambda: Path(tempfile.gettempdir()))
+    # applied to every new connection
+    pragmas: dict[str, str | int] = Field(
+        default_factory=lambda: {
+            "journal_mode": "WAL",
+            "busy_timeout": 5000,
+            "temp_store": 2,
+            "synchronous": 1,
+        }
+    )
 
     @property
     def connection_string(self) -> str:
@@ -34,14 +45,28 @@ class SQLiteDBConfig(DBConfig):
         filepath = self.path / self.filename
         return f"sqlite:///{filepath.resolve()}"
 
+    def engine_kwargs(self) -> dict[str, Any]:
+        if self.path == Path("."):
+            # in-memory databases live in a single connection per thread
+            return {
+                "poolclass": SingletonThreadPool,
+                "query_cache_size": self.query_cache_size,
+            }
+        return super().engine_kwargs()
+
 
 class SQLiteDBManager(DBManager[SQLiteDBConfig]):
     def update_settings(self) -> None:
-        connection = self.engine.connect()
-        connection.execute(sa.text("PRAGMA journal_mode = WAL"))
-        connection.execute(sa.text("PRAGMA busy_timeout = 5000"))
-        connection.execute(sa.text("PRAGMA temp_store = 2"))
-        connection.execute(sa.text("PRAGMA synchronous = 1"))
+        # PRAGMAs are per connection, set them on every connection the pool opens
+        event.listen(self.engine, "connect", self._set_pragmas)
+
+    def _set_pragmas(self, dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self.config.pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
 
     @classmethod
     def random(
@@ -1,5 +1,9 @@
 # stdlib
+from collections import defaultdict
 from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Iterator
+from collections.abc import Sequence
 from functools import wraps
 import inspect
 from typing import Any
@@ -16,6 +20,8 @@ from sqlalchemy import Row
 from sqlalchemy import Table
 from sqlalchemy import func
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as postgres_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 from typing_extensions import Self
 from typing_extensions import TypeVar
@@ -45,15 +51,29 @@ from ..document_store_errors import StashException
 from ..document_store_errors import UniqueConstraintException
 from .db import DBManager
 from .query import Query
+from .query import make_permissions_clause
+from .schema import ANY_VERIFY_KEY
 from .schema import PostgresBase
 from .schema import SQLiteBase
 from .schema import create_table
+from .schema import get_permission_table
+from .schema import permission_row
+from .schema import permission_string_from_row
 from .sqlite import SQLiteDBManager
 
 StashT = TypeVar("StashT", bound=SyftObject)
 T = TypeVar("T")
 P = ParamSpec("P")
 
+# rows per statement in bulk operations, keeps the number of bound parameters
+# below the SQLite limit
+BULK_BATCH_SIZE = 500
+
+
+def _batched(items: Sequence[T], size: int = BULK_BATCH_SIZE) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
 
 def parse_filters(filter_dict: dict[str, Any] | None) -> list[tuple[str, str, Any]]:
     # NOTE using django style filters, e.g. {"age__gt": 18}
@@ -105,6 +125,7 @@ class ObjectStash(Generic[StashT]):
         self.db = store
         self.object_type = self.get_object_type()
         self.table = create_table(self.object_type, self.dialect)
+        self.permission_table = get_permission_table(self.table)
         self.sessionmaker: Callable[[], Session] = self.db.sessionmaker
 
     @property
@@ -212,6 +233,52 @@ class ObjectStash(Generic[StashT]):
             return res
         return True
 
+    def _get_unique_conflicts(
+        self, objs: Sequence[StashT], session: Session
+    ) -> set[UID]:
+        """
+        Uids of the objects in `objs` that share the value of a unique field with a
+        stored object, or with an earlier object in `objs`.
+        """
+        unique_fields = [field for field in self.unique_fields if field != "id"]
+        if not unique_fields:
+            return set()
+
+        field_values: dict[str, list[Any]] = defaultdict(list)
+        objs_values: list[list[tuple[str, Any]]] = []
+        for obj in objs:
+            obj_values = []
+            for field_name in unique_fields:
+                field_value = getattr(obj, field_name, None)
+                if not is_json_primitive(field_value):
+                    raise StashException(
+                        f"Cannot check uniqueness of non-primitive field {field_name}"
+                    )
+                if field_value is None:
+                    continue
+                field_values[field_name].append(field_value)
+                obj_values.append((field_name, serialize_json(field_value)))
+            objs_values.append(obj_values)
+
+        # (field name, serialized value) -> uid of the object holding the value
+        owners: dict[tuple[str, Any], UID] = {}
+        for field_name, values in field_values.items():
+            for batch in _batched(values):
+                query = self.query().filter(field_name, "in", batch)
+                for row in query.execute(session).all():
+                    value = row.fields.get(field_name)
+                    if isinstance(value, Hashable):
+                        owners.setdefault((field_name, value), row.id)
+
+        conflicts = set()
+        for obj, obj_values in zip(objs, objs_values):
+            if any(owners.get(key, obj.id) != obj.id for key in obj_values):
+                conflicts.add(obj.id)
+                continue
+            for key in obj_values:
+                owners.setdefault(key, obj.id)
+        return conflicts
+
     @with_session
     def exists(
         self, credentials: SyftVerifyKey, uid: UID, session: Session = None
@@ -239,6 +306,32 @@ class ObjectStash(Generic[StashT]):
             session=session,
         ).unwrap()
 
+    @as_result(SyftException, StashException)
+    @with_session
+    def get_by_uids(
+        self,
+        credentials: SyftVerifyKey,
+        uids: list[UID],
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> list[StashT]:
+        """
+        Get the objects with the given uids with `WHERE id IN (...)` queries.
+
+        Objects that do not exist or that the user has no permission for are left
+        out, the result follows the order of `uids`.
+        """
+        role = None if has_permission else self.get_role(credentials, session=session)
+
+        objs_by_uid: dict[UID, StashT] = {}
+        for batch in _batched(uids):
+            query = self.query().filter("id", "in", batch)
+            if role is not None:
+                query = query.with_permissions(credentials, role)
+            for row in query.execute(session).all():
+                objs_by_uid[row.id] = self.row_as_obj(row)
+        return [objs_by_uid[uid.id] for uid in uids if uid.id in objs_by_uid]
+
     def _get_field_filter(
         self,
         field_name: str,
@@ -286,9 +379,20 @@ class ObjectStash(Generic[StashT]):
     def get_role(
         self, credentials: SyftVerifyKey, session: Session = None
     ) -> ServiceRole:
+        """
+        Role of the user with `credentials`, GUEST if there is no such user.
+
+        Roles of existing users are cached per server for `ROLE_CACHE_TTL` seconds,
+        `UserService` invalidates the cached role when it updates or deletes a user.
+        """
         # relative
         from ...service.user.user import User
 
+        with self.db.role_cache_lock:
+            role = self.db.role_cache.get(credentials)
+        if role is not None:
+            return role
+
         Base = SQLiteBase if self._is_sqlite() else PostgresBase
 
         # TODO error handling
@@ -305,24 +409,19 @@ class ObjectStash(Generic[StashT]):
 
         user = query.execute(session).first()
         if user is None:
+            # not cached, the user can be created at any time
             return ServiceRole.GUEST
 
-        return self.row_as_obj(user).role
+        role = self.row_as_obj(user).role
+        with self.db.role_cache_lock:
+            self.db.role_cache[credentials] = role
+        return role
 
     def _get_permission_filter_from_permisson(
         self,
         permission: ActionObjectPermission,
-    ) -> sa.sql.elements.BinaryExpression:
-        permission_string = permission.permission_string
-        compound_permission_string = permission.compound_permission_string
-
-        if self.db.engine.dialect.name == "postgresql":
-            permission_string = [permission_string]  # type: ignore
-            compound_permission_string = [compound_permission_string]  # type: ignore
-        return sa.or_(
-            self.table.c.permissions.contains(permission_string),
-            self.table.c.permissions.contains(compound_permission_string),
-        )
+    ) -> sa.sql.elements.ColumnElement:
+        return make_permissions_clause(self.table, permission)
 
     @with_session
     def _apply_permission_filter(
@@ -355,6 +454,51 @@ class ObjectStash(Generic[StashT]):
         )
         return stmt
 
+    def _insert(self, table: Table | None = None) -> sa.Insert:
+        table = self.table if table is None else table
+        if self._is_sqlite():
+            return sqlite_insert(table)
+        return postgres_insert(table)
+
+    def _insert_permission_rows(
+        self, rows: list[dict[str, Any]], session: Session
+    ) -> None:
+        # duplicates within a statement or with existing rows are skipped
+        unique_rows = list(
+            {
+                (r["object_id"], r["permission"], r["verify_key"]): r for r in rows
+            }.values()
+        )
+        for batch in _batched(unique_rows):
+            stmt = self._insert(self.permission_table).on_conflict_do_nothing()
+            session.execute(stmt.values(list(batch)))
+
+    def _object_permission_rows(
+        self,
+        uid: UID,
+        credentials: SyftVerifyKey,
+        add_permissions: list[ActionObjectPermission] | None = None,
+    ) -> list[dict[str, Any]]:
+        permissions = self._ownership_permissions(uid, credentials)
+        permissions += add_permissions or []
+        return [{**permission_row(p), "object_id": uid} for p in permissions]
+
+    def _serialize_fields(self, obj: StashT) -> dict:
+        # values are validated by the compiled JSON encoder of the object type
+        try:
+            return serialize_json(obj)
+        except Exception as e:
+            raise StashException(
+                f"Error serializing object: {e}. Some fields are invalid."
+            )
+
+    def _raise_duplicate(self, obj: StashT) -> None:
+        unique_fields_str = ", ".join(self.unique_fields)
+        raise UniqueConstraintException(
+            public_message=f"Duplication Key Error for {obj}.\n"
+            f"The fields that should be unique are {unique_fields_str}."
+        )
+
     @as_result(SyftException, StashException)
     @with_session
     def set(
@@ -366,27 +510,24 @@ class ObjectStash(Generic[StashT]):
         ignore_duplicates: bool = False,
         session: Session = None,
         skip_check_type: bool = False,
+        returning: bool = False,
     ) -> StashT:
+        """
+        Insert `obj` into the stash and return it.
+
+        The object is written with a single INSERT, a conflicting id is detected by
+        the database (ON CONFLICT DO NOTHING). The in-memory object is returned,
+        pass `returning=True` to return the object as stored in the database instead.
+        """
         if not self.allow_any_type and not skip_check_type:
             self.check_type(obj, self.object_type).unwrap()
         uid = obj.id
 
-        # check if the object already exists
-        if self.exists(credentials, uid, session=session) or not self.is_unique(
-            obj, session=session
-        ):
+        # unique fields other than id are not constrained by the database
+        if not self.is_unique(obj, session=session):
             if ignore_duplicates:
                 return obj
-            unique_fields_str = ", ".join(self.unique_fields)
-            raise UniqueConstraintException(
-                public_message=f"Duplication Key Error for {obj}.\n"
-                f"The fields that should be unique are {unique_fields_str}."
-            )
-
-        permissions = self.get_ownership_permissions(uid, credentials)
-        if add_permissions is not None:
-            add_permission_strings = [p.permission_string for p in add_permissions]
-            permissions.extend(add_permission_strings)
+            self._raise_duplicate(obj)
 
         storage_permissions = []
         if add_storage_permission:
@@ -394,25 +535,32 @@ class ObjectStash(Generic[StashT]):
                 self.server_uid.no_dash,
             )
 
-        fields = serialize_json(obj)
-        try:
-            # check if the fields are deserializable
-            # TODO: Ideally, we want to make sure we don't serialize what we cannot deserialize
-            #       and remove this check.
-            deserialize_json(fields)
-        except Exception as e:
-            raise StashException(
-                f"Error serializing object: {e}. Some fields are invalid."
-            )
         # create the object with the permissions
-        stmt = self.table.insert().values(
-            id=uid,
-            fields=fields,
-            permissions=permissions,
-            storage_permissions=storage_permissions,
+        stmt = (
+            self._insert()
+            .values(
+                id=uid,
+                fields=self._serialize_fields(obj),
+                storage_permissions=storage_permissions,
+            )
+            .on_conflict_do_nothing(index_elements=["id"])
         )
-        session.execute(stmt)
-        return self.get_by_uid(credentials, uid, session=session).unwrap()
+        if returning:
+            row = session.execute(stmt.returning(self.table.c.fields)).first()
+            inserted = row is not None
+        else:
+            inserted = session.execute(stmt).rowcount > 0
+
+        if not inserted:
+            if ignore_duplicates:
+                return obj
+            self._raise_duplicate(obj)
+
+        self._insert_permission_rows(
+            self._object_permission_rows(uid, credentials, add_permissions),
+            session=session,
+        )
+        return self.row_as_obj(row) if returning else obj
 
     @as_result(ValidationError, AttributeError)
     def apply_partial_update(
@@ -447,8 +595,12 @@ class ObjectStash(Generic[StashT]):
         obj: StashT,
         has_permission: bool = False,
         session: Session = None,
+        returning: bool = False,
     ) -> StashT:
         """
+        Update `obj` in the stash and return it. Like `set`, the in-memory object is
+        returned unless `returning=True` is passed.
+
         NOTE: We cannot do partial updates on the database,
         because we are using computed fields that are not known to the DB:
         - serialize_json will add computed fields to the JSON stored in the database
@@ -478,20 +630,190 @@ class ObjectStash(Generic[StashT]):
             has_permission=has_permission,
             session=session,
         )
-        fields = serialize_json(obj)
-        try:
-            deserialize_json(fields)
-        except Exception as e:
-            raise StashException(
-                f"Error serializing object: {e}. Some fields are invalid."
-            )
-        stmt = stmt.values(fields=fields)
-        result = session.execute(stmt)
-        if result.rowcount == 0:
+        stmt = stmt.values(fields=self._serialize_fields(obj))
+        if returning:
+            row = session.execute(stmt.returning(self.table.c.fields)).first()
+            updated = row is not None
+        else:
+            updated = session.execute(stmt).rowcount > 0
+
+        if not updated:
             raise NotFoundException(
                 f"{self.object_type.__name__}: {obj.id} not found or no permission to update."
             )
-        return self.get_by_uid(credentials, obj.id, session=session).unwrap()
+        return self.row_as_obj(row) if returning else obj
+
+    @as_result(SyftException, StashException)
+    @with_session
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[StashT],
+        add_permissions: list[ActionObjectPermission] | None = None,
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+        session: Session = None,
+        skip_check_type: bool = False,
+    ) -> list[StashT]:
+        """
+        Insert `objs` with multi-row INSERTs, like `set`.
+
+        `add_permissions` are added to the object with the same uid. Returns the
+        inserted objects. With `ignore_duplicates`, objects that already exist or
+        collide on a unique field are skipped, otherwise nothing is inserted.
+        """
+        if not self.allow_any_type and not skip_check_type:
+            for obj in objs:
+                self.check_type(obj, self.object_type).unwrap()
+
+        conflicts = self._get_unique_conflicts(objs, session=session)
+        if conflicts and not ignore_duplicates:
+            self._raise_duplicate(next(obj for obj in objs if obj.id in conflicts))
+
+        extra_permissions: dict[UID, list[ActionObjectPermission]] = defaultdict(list)
+        for permission in add_permissions or []:
+            extra_permissions[permission.uid.id].append(permission)
+
+        storage_permissions = []
+        if add_storage_permission:
+            storage_permissions.append(self.server_uid.no_dash)
+
+        rows = [
+            {
+                "id": obj.id,
+                "fields": self._serialize_fields(obj),
+                "storage_permissions": storage_permissions,
+            }
+            for obj in objs
+            if obj.id not in conflicts
+        ]
+
+        inserted: set[UID] = set()
+        for batch in _batched(rows):
+            stmt = (
+                self._insert()
+                .values(list(batch))
+                .on_conflict_do_nothing(index_elements=["id"])
+                .returning(self.table.c.id)
+            )
+            inserted.update(session.execute(stmt).scalars())
+
+        created = []
+        permission_rows = []
+        for obj in objs:
+            if obj.id in inserted:
+                # a uid is inserted once, later objects with the same uid are duplicates
+                inserted.discard(obj.id)
+                created.append(obj)
+                permission_rows += self._object_permission_rows(
+                    obj.id, credentials, extra_permissions[obj.id]
+                )
+            elif not ignore_duplicates:
+                self._raise_duplicate(obj)
+
+        self._insert_permission_rows(permission_rows, session=session)
+        return created
+
+    @as_result(
+        StashException,
+        NotFoundException,
+        AttributeError,
+        ValidationError,
+        UniqueConstraintException,
+    )
+    @with_session
+    def update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[StashT],
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> list[StashT]:
+        """
+        Update `objs` with a single executemany UPDATE, like `update`.
+
+        Nothing is updated if one of the objects does not exist or cannot be written
+        by the user.
+        """
+        partial_uids = [
+            obj.id for obj in objs if issubclass(type(obj), PartialSyftObject)
+        ]
+        if partial_uids:
+            originals = {
+                original.id: original
+                for original in self.get_by_uids(
+                    credentials, partial_uids, session=session
+                ).unwrap()
+            }
+            updated_objs = []
+            for obj in objs:
+                if issubclass(type(obj), PartialSyftObject):
+                    if obj.id not in originals:
+                        raise NotFoundException(
+                            f"{self.object_type.__name__}: {obj.id} not found"
+                        )
+                    obj = self.apply_partial_update(
+                        original_obj=originals[obj.id], update_obj=obj
+                    ).unwrap()
+                updated_objs.append(obj)
+            objs = updated_objs
+
+        if self._get_unique_conflicts(objs, session=session):
+            raise UniqueConstraintException(
+                f"Some fields are not unique for {self.object_type.__name__} and unique fields {self.unique_fields}"
+            )
+
+        writable_uids: set[UID] = set()
+        for batch in _batched([obj.id for obj in objs]):
+            stmt = select(self.table.c.id).where(self.table.c.id.in_(batch))
+            stmt = self._apply_permission_filter(
+                stmt,
+                credentials=credentials,
+                permission=ActionPermission.WRITE,
+                has_permission=has_permission,
+                session=session,
+            )
+            writable_uids.update(session.execute(stmt).scalars())
+
+        for obj in objs:
+            if obj.id not in writable_uids:
+                raise NotFoundException(
+                    f"{self.object_type.__name__}: {obj.id} not found or no permission to update."
+                )
+
+        self._update_column_by_uids(
+            "fields",
+            {obj.id: self._serialize_fields(obj) for obj in objs},
+            session=session,
+        )
+        return objs
+
+    def _get_column_by_uids(
+        self, column: str, uids: Sequence[UID], session: Session
+    ) -> dict[UID, Any]:
+        values = {}
+        for batch in _batched(uids):
+            stmt = select(self.table.c.id, self.table.c[column]).where(
+                self.table.c.id.in_(batch)
+            )
+            values.update({row[0]: row[1] for row in session.execute(stmt)})
+        return values
+
+    def _update_column_by_uids(
+        self, column: str, values: dict[UID, Any], session: Session
+    ) -> None:
+        """Set `column` of every row in `values` with one executemany UPDATE."""
+        if not values:
+            return
+        stmt = (
+            self.table.update()
+            .where(self.table.c.id == sa.bindparam("row_id"))
+            .values({column: sa.bindparam("row_value")})
+        )
+        session.execute(
+            stmt,
+            [{"row_id": uid, "row_value": value} for uid, value in values.items()],
+        )
 
     @as_result(StashException, NotFoundException)
     @with_session
@@ -515,6 +837,12 @@ class ObjectStash(Generic[StashT]):
             raise NotFoundException(
                 f"{self.object_type.__name__}: {uid} not found or no permission to delete."
             )
+        # cascades on postgres, SQLite does not enforce foreign keys
+        session.execute(
+            self.permission_table.delete().where(
+                self.permission_table.c.object_id == uid
+            )
+        )
         return uid
 
     @as_result(StashException)
@@ -616,17 +944,57 @@ class ObjectStash(Generic[StashT]):
         result = query.execute(session).all()
         return [self.row_as_obj(row) for row in result]
 
+    @as_result(StashException)
+    @with_session
+    def count(
+        self,
+        credentials: SyftVerifyKey,
+        filters: dict[str, Any] | None = None,
+        has_permission: bool = False,
+        session: Session = None,
+    ) -> int:
+        """
+        Count the objects that `get_all` would return for the same filters, with a
+        single COUNT query.
+        """
+        query = self.query()
+
+        if not has_permission:
+            role = self.get_role(credentials, session=session)
+            query = query.with_permissions(credentials, role)
+
+        for field_name, operator, field_value in parse_filters(filters):
+            query = query.filter(field_name, operator, field_value)
+
+        return query.count(session)
+
     # PERMISSIONS
+    def _ownership_permissions(
+        self, uid: UID, credentials: SyftVerifyKey
+    ) -> list[ActionObjectPermission]:
+        return [
+            ActionObjectOWNER(uid=uid, credentials=credentials),
+            ActionObjectWRITE(uid=uid, credentials=credentials),
+            ActionObjectREAD(uid=uid, credentials=credentials),
+            ActionObjectEXECUTE(uid=uid, credentials=credentials),
+        ]
+
     def get_ownership_permissions(
         self, uid: UID, credentials: SyftVerifyKey
     ) -> list[str]:
         return [
-            ActionObjectOWNER(uid=uid, credentials=credentials).permission_string,
-            ActionObjectWRITE(uid=uid, credentials=credentials).permission_string,
-            ActionObjectREAD(uid=uid, credentials=credentials).permission_string,
-            ActionObjectEXECUTE(uid=uid, credentials=credentials).permission_string,
+            permission.permission_string
+            for permission in self._ownership_permissions(uid, credentials)
         ]
 
+    @with_session
+    def _get_existing_uids(self, uids: list[UID], session: Session = None) -> Set[UID]:  # noqa: UP006
+        existing: set[UID] = set()
+        for batch in _batched(uids):
+            stmt = select(self.table.c.id).where(self.table.c.id.in_(batch))
+            existing.update(session.execute(stmt).scalars())
+        return existing
+
     @as_result(NotFoundException)
     @with_session
     def add_permission(
@@ -635,20 +1003,9 @@ class ObjectStash(Generic[StashT]):
         session: Session = None,
         ignore_missing: bool = False,
     ) -> None:
-        try:
-            existing_permissions = self._get_permissions_for_uid(
-                permission.uid, session=session
-            ).unwrap()
-        except NotFoundException:
-            if ignore_missing:
-                return None
-            raise
-
-        existing_permissions.add(permission.permission_string)
-
-        stmt = self.table.update().where(self.table.c.id == permission.uid)
-        stmt = stmt.values(permissions=list(existing_permissions))
-        session.execute(stmt)
+        self.add_permissions(
+            [permission], ignore_missing=ignore_missing, session=session
+        ).unwrap()
         return None
 
     @as_result(NotFoundException)
@@ -659,28 +1016,30 @@ class ObjectStash(Generic[StashT]):
         ignore_missing: bool = False,
         session: Session = None,
     ) -> None:
-        for permission in permissions:
-            self.add_permission(
-                permission, session=session, ignore_missing=ignore_missing
-            ).unwrap()
+        uids = list({permission.uid.id for permission in permissions})
+        existing_uids = self._get_existing_uids(uids, session=session)
+        if not ignore_missing:
+            for uid in uids:
+                if uid not in existing_uids:
+                    raise NotFoundException(f"No permissions found for uid: {uid}")
+
+        rows = [
+            permission_row(permission)
+            for permission in permissions
+            if permission.uid.id in existing_uids
+        ]
+        self._insert_permission_rows(rows, session=session)
         return None
 
     @with_session
     def remove_permission(
         self, permission: ActionObjectPermission, session: Session = None
     ) -> None:
-        # TODO not threadsafe
-        try:
-            permissions = self._get_permissions_for_uid(permission.uid).unwrap()
-            permissions.remove(permission.permission_string)
-        except (NotFoundException, KeyError):
-            # TODO add error handling to permissions
-            return None
-
-        stmt = (
-            self.table.update()
-            .where(self.table.c.id == permission.uid)
-            .values(permissions=list(permissions))
+        row = permission_row(permission)
+        stmt = self.permission_table.delete().where(
+            self.permission_table.c.object_id == row["object_id"],
+            self.permission_table.c.permission == row["permission"],
+            self.permission_table.c.verify_key == row["verify_key"],
         )
         session.execute(stmt)
         return None
@@ -700,39 +1059,61 @@ class ObjectStash(Generic[StashT]):
     def has_permissions(
         self, permissions: list[ActionObjectPermission], session: Session = None
     ) -> bool:
-        # TODO: we should use a permissions table to check all permissions at once
+        """True if every permission is granted, directly or through ALL_ permissions."""
+        if any(permission.uid is None for permission in permissions):
+            return False
 
-        permission_filters = [
-            sa.and_(
-                self._get_field_filter("id", p.uid),
-                self._get_permission_filter_from_permisson(permission=p),
-            )
-            for p in permissions
-        ]
-
-        stmt = self.table.select().where(
-            sa.and_(
-                *permission_filters,
-            ),
-        )
-        result = session.execute(stmt).first()
-        return result is not None
+        uids = list({permission.uid.id for permission in permissions})
+        granted: set[tuple[UID, str, str]] = set()
+        for batch in _batched(uids):
+            stmt = select(
+                self.permission_table.c.object_id,
+                self.permission_table.c.permission,
+                self.permission_table.c.verify_key,
+            ).where(self.permission_table.c.object_id.in_(batch))
+            granted.update(tuple(row) for row in session.execute(stmt))
+
+        def is_granted(permission: ActionObjectPermission) -> bool:
+            row = permission_row(permission)
+            compound = permission.permission.as_compound.name
+            return (
+                row["object_id"],
+                row["permission"],
+                row["verify_key"],
+            ) in granted or (
+                row["object_id"],
+                compound,
+                ANY_VERIFY_KEY,
+            ) in granted
+
+        return all(is_granted(permission) for permission in permissions)
 
     @as_result(StashException)
     @with_session
     def _get_permissions_for_uid(self, uid: UID, session: Session = None) -> Set[str]:  # noqa: UP006
-        stmt = select(self.table.c.permissions).where(self.table.c.id == uid)
-        result = session.execute(stmt).scalar_one_or_none()
-        if result is None:
+        stmt = select(
+            self.permission_table.c.permission, self.permission_table.c.verify_key
+        ).where(self.permission_table.c.object_id == uid)
+        rows = session.execute(stmt).all()
+        if not rows and not self._get_existing_uids([uid], session=session):
             raise NotFoundException(f"No permissions found for uid: {uid}")
-        return set(result)
+        return {permission_string_from_row(*row) for row in rows}
 
     @as_result(StashException)
     @with_session
     def get_all_permissions(self, session: Session = None) -> dict[UID, Set[str]]:  # noqa: UP006
-        stmt = select(self.table.c.id, self.table.c.permissions)
-        results = session.execute(stmt).all()
-        return {UID(row.id): set(row.permissions) for row in results}
+        permissions: dict[UID, Set[str]] = {  # noqa: UP006
+            uid: set() for uid in session.execute(select(self.table.c.id)).scalars()
+        }
+        stmt = select(
+            self.permission_table.c.object_id,
+            self.permission_table.c.permission,
+            self.permission_table.c.verify_key,
+        )
+        for uid, permission, verify_key in session.execute(stmt):
+            if uid in permissions:
+                permissions[uid].add(permission_string_from_row(permission, verify_key))
+        return permissions
 
     # STORAGE PERMISSIONS
     @with_session
@@ -786,11 +1167,25 @@ class ObjectStash(Generic[StashT]):
         session: Session = None,
         ignore_missing: bool = False,
     ) -> None:
+        new_permissions: dict[UID, set[UID]] = defaultdict(set)
         for permission in permissions:
-            self.add_storage_permission(
-                permission, session=session, ignore_missing=ignore_missing
-            ).unwrap()
+            new_permissions[permission.uid.id].add(permission.server_uid)
 
+        existing_permissions = self._get_column_by_uids(
+            "storage_permissions", list(new_permissions), session=session
+        )
+        updated_permissions = {}
+        for uid, server_uids in new_permissions.items():
+            if existing_permissions.get(uid) is None:
+                if ignore_missing:
+                    continue
+                raise NotFoundException(f"No storage permissions found for uid: {uid}")
+            server_uids = server_uids | {UID(u) for u in existing_permissions[uid]}
+            updated_permissions[uid] = [str(u) for u in server_uids]
+
+        self._update_column_by_uids(
+            "storage_permissions", updated_permissions, session=session
+        )
         return None
 
     @as_result(NotFoundException)
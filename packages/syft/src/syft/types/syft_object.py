@@ -12,7 +12,6 @@ from datetime import timedelta
 from datetime import timezone
 from functools import cache
 from functools import total_ordering
-from hashlib import sha256
 import inspect
 from inspect import Signature
 import logging
@@ -40,8 +39,9 @@ from typeguard import check_type
 from typing_extensions import Self
 
 # relative
+from ..serde.hashing import content_hash
+from ..serde.hashing import invalidate_content_hash
 from ..serde.serializable import serializable
-from ..serde.serialize import _serialize as serialize
 from ..server.credentials import SyftVerifyKey
 from ..util.autoreload import autoreload_enabled
 from ..util.markdown import as_markdown_python_code
@@ -119,14 +119,18 @@ def _get_optional_inner_type(x: Any) -> Any:
 
 class SyftHashableObject:
     __hash_exclude_attrs__: list = []
+    # cache the content hash per instance, invalidated by __setattr__
+    __cache_content_hash__: ClassVar[bool] = True
 
     def __hash__(self) -> int:
         return int.from_bytes(self.__sha256__(), byteorder="big")
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        invalidate_content_hash(self)
+
     def __sha256__(self) -> bytes:
-        self.__hash_exclude_attrs__.extend(DYNAMIC_SYFT_ATTRIBUTES)
-        _bytes = serialize(self, to_bytes=True, for_hashing=True)
-        return sha256(_bytes).digest()
+        return content_hash(self)
 
     def hash(self) -> str:
         return self.__sha256__().hex()
@@ -142,6 +146,11 @@ class SyftBaseObject(pydantic.BaseModel, SyftHashableObject):
     syft_server_location: UID | None = Field(default=None, exclude=True)
     syft_client_verify_key: SyftVerifyKey | None = Field(default=None, exclude=True)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # pydantic.BaseModel.__setattr__ doesn't call SyftHashableObject's
+        super().__setattr__(name, value)
+        invalidate_content_hash(self)
+
     def _set_obj_location_(self, server_uid: UID, credentials: SyftVerifyKey) -> None:
         self.syft_server_location = server_uid
         self.syft_client_verify_key = credentials
@@ -818,6 +827,9 @@ def attach_attribute_to_syft_object(result: Any, attr_dict: dict[str, Any]) -> N
         iterator = (result.err(),)
     elif isinstance(result, Mapping):
         iterator = result.values()
+    elif isinstance(result, str | bytes | bytearray):
+        # sequences, but never contain syft objects
+        return
     elif isinstance(result, Sequence):
         iterator = result
     else:
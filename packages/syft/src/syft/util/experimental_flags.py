@@ -20,6 +20,12 @@ class ExperimentalFlags:
     def __init__(self) -> None:
         self._APACHE_ARROW_TENSOR_SERDE = True
         self._APACHE_ARROW_COMPRESSION = ApacheArrowCompression.ZSTD
+        self._INLINE_NESTED_SERDE = str_to_bool(
+            os.getenv(
+                "SYFT_INLINE_NESTED_SERDE",
+                "False",
+            )
+        )
         self._CAN_REGISTER = str_to_bool(
             os.getenv(
                 "ENABLE_SIGNUP",
@@ -47,6 +53,17 @@ class ExperimentalFlags:
     def APACHE_ARROW_COMPRESSION(self, value: ApacheArrowCompression) -> None:
         self._APACHE_ARROW_COMPRESSION = value
 
+    @property
+    def INLINE_NESTED_SERDE(self) -> bool:
+        """Encode nested recursive objects as in-place capnp structs instead of
+        per-field byte blobs. Readers understand both layouts, but peers older
+        than this flag can only read the blob layout, so it is off by default."""
+        return self._INLINE_NESTED_SERDE
+
+    @INLINE_NESTED_SERDE.setter
+    def INLINE_NESTED_SERDE(self, value: bool) -> None:
+        self._INLINE_NESTED_SERDE = value
+
     @property
     def USE_NEW_SERVICE(self) -> bool:
         return str_to_bool(os.getenv("USE_NEW_SERVICE", "False"))
@@ -3,11 +3,24 @@ from collections.abc import Callable
 
 # third party
 import numpy as np
+import pytest
 
 # syft absolute
 import syft as sy
+from syft.client.api import APISessionRegistry
+from syft.client.api import SessionSyftAPICall
+from syft.client.api import SignedSyftAPICall
+from syft.client.api import SyftAPICall
+from syft.client.client import read_api_cache
+from syft.client.client import write_api_cache
+from syft.serde.deserialize import _deserialize
+from syft.serde.serialize import _serialize
+from syft.server.credentials import SyftSigningKey
+from syft.service.code.utils import compile_source
+from syft.service.context import AuthedServiceContext
 from syft.service.response import SyftError
 from syft.service.user.user_roles import ServiceRole
+from syft.types.errors import SyftException
 
 
 def test_api_cache_invalidation(worker):
@@ -70,3 +83,137 @@ def test_api_cache_invalidation_login(root_verify_key, worker):
     guest_client = guest_client.login(email="a@b.org", password="aaa")
 
     assert guest_client.upload_dataset(dataset)
+
+
+@sy.api_endpoint_method()
+def query_function(context, query_str: str) -> str:
+    return query_str
+
+
+def test_api_schema_etag(worker, root_verify_key):
+    protocol = worker.current_protocol
+    etag, content = worker.get_api_schema(root_verify_key, protocol)
+
+    # the schema is served from the cache while nothing changed
+    assert worker.get_api_schema(root_verify_key, protocol) == (etag, content)
+    api = _deserialize(content, from_bytes=True)
+    assert (
+        api.endpoints.keys()
+        == worker.get_api(root_verify_key, protocol).endpoints.keys()
+    )
+
+    # other roles get another schema
+    guest_verify_key = SyftSigningKey.generate().verify_key
+    guest_etag, _ = worker.get_api_schema(guest_verify_key, protocol)
+    assert guest_etag != etag
+
+    # a new custom endpoint changes the schema
+    new_endpoint = sy.TwinAPIEndpoint(
+        path="test.query",
+        private_function=query_function,
+        mock_function=query_function,
+    )
+    assert worker.root_client.api.services.api.add(endpoint=new_endpoint)
+    new_etag, new_content = worker.get_api_schema(root_verify_key, protocol)
+    assert new_etag != etag
+    assert "test.query" in _deserialize(new_content, from_bytes=True).endpoints
+
+
+def test_api_disk_cache(tmp_path):
+    path = tmp_path / "api"
+    assert read_api_cache(path) is None
+
+    write_api_cache(path, '"abc"', b"\n\x00content")
+    assert read_api_cache(path) == ('"abc"', b"\n\x00content")
+
+
+def test_api_session(worker):
+    root_client = worker.root_client
+    api = root_client.api
+    verify_key = api.signing_key.verify_key
+
+    api.start_session()
+    session = APISessionRegistry.session_for(api.server_uid, verify_key)
+    assert session is not None
+
+    call = SyftAPICall(server_uid=worker.id, path="user.get_all", args=[], kwargs={})
+    session_call = api._sign_call(call)
+    assert isinstance(session_call, SessionSyftAPICall)
+    later_call = api._sign_call(call)
+
+    # calls can arrive out of order, but only once
+    assert worker.handle_api_call_with_unsigned_result(later_call)
+    assert worker.handle_api_call_with_unsigned_result(session_call)
+    with pytest.raises(SyftException):
+        worker.handle_api_call_with_unsigned_result(session_call)
+
+    # the mac covers the call and the token is bound to the user
+    tampered_call = api._sign_call(call)
+    tampered_call.serialized_message = _serialize(
+        SyftAPICall(server_uid=worker.id, path="user.delete", args=[], kwargs={}),
+        to_bytes=True,
+    )
+    other_user_call = api._sign_call(call)
+    other_user_call.credentials = SyftSigningKey.generate().verify_key
+    for invalid_call in [tampered_call, other_user_call]:
+        with pytest.raises(SyftException):
+            worker.handle_api_call_with_unsigned_result(invalid_call)
+
+    assert len(root_client.users.get_all()) > 0
+
+    # expired sessions are renewed
+    session.renew_at = 0
+    root_client.users.get_all()
+    renewed_session = APISessionRegistry.session_for(api.server_uid, verify_key)
+    assert renewed_session.token != session.token
+
+    api.end_session()
+    assert isinstance(api._sign_call(call), SignedSyftAPICall)
+
+
+def test_api_session_disabled(worker):
+    worker.api_sessions.ttl = 0
+    with pytest.raises(SyftException):
+        worker.root_client.api.start_session()
+
+
+def shout(query_str: str) -> str:
+    return query_str.upper()
+
+
+@sy.api_endpoint_method(helper_functions=[shout])
+def shout_function(context, query_str: str) -> str:
+    return context.code.shout(query_str)
+
+
+def test_api_endpoint_code_cache(worker):
+    root_client = worker.root_client
+    new_endpoint = sy.TwinAPIEndpoint(
+        path="test.shout",
+        description="Test",
+        private_function=shout_function,
+        mock_function=query_function,
+    )
+    root_client.api.services.api.add(endpoint=new_endpoint)
+
+    context = AuthedServiceContext(
+        server=worker, credentials=root_client.verify_key, role=ServiceRole.ADMIN
+    )
+
+    def call(query_str: str) -> str:
+        result = worker.services.api.call(context, "test.shout", query_str=query_str)
+        return result.syft_action_data
+
+    assert call(query_str="a") == "A"
+
+    # the endpoint and its helper functions are compiled once
+    misses = compile_source.cache_info().misses
+    assert call(query_str="b") == "B"
+    assert compile_source.cache_info().misses == misses
+
+    # updated code is compiled again
+    root_client.api.services.api.update(
+        endpoint_path="test.shout", private_function=query_function
+    )
+    assert call(query_str="c") == "c"
+    assert compile_source.cache_info().misses > misses
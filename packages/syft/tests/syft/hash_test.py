@@ -56,3 +56,33 @@ def test_nested_hashing():
     )
 
     assert obj1.hash() == obj2.hash()
+
+
+def test_hash_exclude_attrs_are_not_mutated():
+    exclude_attrs = list(MockObject.__hash_exclude_attrs__)
+    base_exclude_attrs = list(SyftHashableObject.__hash_exclude_attrs__)
+    obj = MockObject(key="key", value="value")
+    for _ in range(3):
+        obj.hash()
+
+    assert MockObject.__hash_exclude_attrs__ == exclude_attrs
+    assert SyftHashableObject.__hash_exclude_attrs__ == base_exclude_attrs
+
+
+def test_hash_is_invalidated_on_setattr():
+    obj = MockWrapper(id="id", data=MockObject(key="key", value="value"))
+    first_hash = obj.hash()
+    assert obj.hash() == first_hash
+
+    obj.id = "other_id"
+    assert obj.hash() != first_hash
+    obj.id = "id"
+    assert obj.hash() == first_hash
+
+    # changes to nested objects invalidate the cached hash of the parent
+    obj.data.value = "other_value"
+    assert obj.hash() != first_hash
+    assert (
+        obj.hash()
+        == MockWrapper(id="id", data=MockObject(key="key", value="other_value")).hash()
+    )
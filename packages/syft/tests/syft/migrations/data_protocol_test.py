@@ -0,0 +1,48 @@
+# syft absolute
+import syft as sy
+from syft.protocol.data_protocol import get_data_protocol
+from syft.protocol.data_protocol import migrate_args_and_kwargs
+from syft.service.settings.settings import ServerSettingsUpdate
+from syft.service.settings.settings import ServerSettingsUpdateV1
+from syft.types.uid import UID
+
+
+@sy.api_endpoint_method()
+def query_function(context, query_str: str) -> str:
+    return query_str
+
+
+def test_migration_chain() -> None:
+    data_protocol = get_data_protocol()
+    migration_chain = data_protocol.get_migration_chain(ServerSettingsUpdate, 1)
+    assert data_protocol.get_migration_chain(ServerSettingsUpdate, 1) is migration_chain
+
+    # migrates through all the versions in between
+    settings_update = ServerSettingsUpdate(id=UID(), name="abc")
+    migrated = migration_chain(settings_update)
+    assert isinstance(migrated, ServerSettingsUpdateV1)
+    assert migrated.name == "abc"
+
+
+def test_migrate_args_and_kwargs_to_protocol() -> None:
+    data_protocol = get_data_protocol()
+    endpoint = sy.TwinAPIEndpoint(
+        path="test.query",
+        description="Test",
+        private_function=query_function,
+        mock_function=query_function,
+    )
+    assert endpoint.__version__ == 2
+
+    args, kwargs = migrate_args_and_kwargs(
+        (endpoint,), {"endpoints": [endpoint], "n": 1}, to_protocol=1
+    )
+    assert args[0].__version__ == 1
+    assert kwargs["endpoints"][0].__version__ == 1
+    assert kwargs["n"] == 1
+    assert args[0].path == "test.query"
+
+    # the state of the protocol is kept
+    object_versions = data_protocol.get_latest_object_versions(1)
+    assert data_protocol.get_latest_object_versions("1") is object_versions
+    assert object_versions["CreateTwinAPIEndpoint"] == 1
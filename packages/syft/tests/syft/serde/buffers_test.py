@@ -0,0 +1,64 @@
+# stdlib
+import io
+
+# third party
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# syft absolute
+import syft as sy
+from syft.serde.buffers import is_framed
+from syft.serde.buffers import serialize_framed
+
+
+def test_out_of_band_buffers():
+    data = {
+        "array": np.arange(24, dtype=np.float32).reshape(2, 3, 4)[:, ::2],
+        "df": pd.DataFrame({"a": range(10), "b": [str(i) for i in range(10)]}),
+        "table": pa.table({"x": [1, 2, 3]}),
+        "strings": np.array(["a", "bb"]),
+    }
+
+    buffers = []
+    blob = sy.serialize(data, to_bytes=True, buffer_callback=buffers.append)
+    assert buffers
+
+    result = sy.deserialize(blob, from_bytes=True, buffers=buffers)
+    assert (result["array"] == data["array"]).all()
+    assert result["df"].equals(data["df"])
+    assert result["table"].equals(data["table"])
+    assert (result["strings"] == data["strings"]).all()
+
+
+def test_framed_blob_roundtrip():
+    array = np.arange(1000, dtype=np.int64)
+    stream = serialize_framed({"array": array, "name": "a"})
+
+    chunks = []
+    while chunk := stream.read(100):
+        chunks.append(chunk)
+    blob = b"".join(chunks)
+    assert len(blob) == stream.size
+    assert is_framed(blob)
+    assert not is_framed(sy.serialize(array, to_bytes=True))
+
+    # read-only source, the array is copied to stay writeable
+    result = sy.deserialize(blob, from_bytes=True)
+    assert (result["array"] == array).all()
+    assert result["array"].flags.writeable
+
+    # writeable source, the array is a view on it
+    buffer = bytearray(blob)
+    result = sy.deserialize(buffer, from_bytes=True)
+    assert (result["array"] == array).all()
+    assert np.shares_memory(result["array"], np.frombuffer(buffer, dtype=np.uint8))
+
+
+def test_framed_blob_from_file():
+    array = np.arange(1000, dtype=np.int64)
+    stream = serialize_framed({"array": array})
+
+    result = sy.deserialize(from_file=io.BytesIO(stream.read()))
+    assert (result["array"] == array).all()
+    assert result["array"].flags.writeable
@@ -0,0 +1,46 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+from syft.serde.json_serde import _ENCODERS
+from syft.serde.json_serde import deserialize_json
+from syft.serde.json_serde import serialize_json
+from syft.service.user.user import User
+from syft.service.user.user_roles import ServiceRole
+from syft.types.uid import UID
+
+
+def test_json_roundtrip_syft_object():
+    user = User(
+        id=UID(), email="info@openmined.org", name="test", role=ServiceRole.ADMIN
+    )
+    result = serialize_json(user)
+
+    assert result["email"] == "info@openmined.org"
+    assert result["role"] == "ADMIN"
+    assert result["id"] == user.id.no_dash
+    assert deserialize_json(result) == user
+
+    # the codec is compiled once per annotation
+    assert (User, True) in _ENCODERS
+    assert serialize_json(user) == result
+
+
+def test_json_roundtrip_annotations():
+    uids = [UID(), UID()]
+    assert deserialize_json(serialize_json(uids, list[UID]), list[UID]) == uids
+    assert serialize_json(None, int | None) is None
+    assert deserialize_json(serialize_json(3, int | None), int | None) == 3
+
+    # ambiguous annotations are serialized to bytes
+    value = [1, "a"]
+    serialized = serialize_json(value, list[int | str])
+    assert isinstance(serialized, str)
+    assert deserialize_json(serialized, list[int | str]) == value
+
+
+def test_json_validation():
+    with pytest.raises(TypeError):
+        serialize_json(np.int64(1), int)
+    assert serialize_json(np.int64(1), int, validate=False) == 1
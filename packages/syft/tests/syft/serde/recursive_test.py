@@ -0,0 +1,123 @@
+# stdlib
+import io
+import socket
+
+# third party
+import numpy as np
+import pandas as pd
+
+# syft absolute
+import syft as sy
+from syft.serde.arrow import numpy_deserialize
+from syft.serde.arrow import numpy_serialize
+from syft.serde.arrow import numpy_serialize_v1
+from syft.serde.recursive import _can_model_construct
+from syft.serde.recursive import combine_bytes
+from syft.serde.third_party import deserialize_dataframe
+from syft.serde.third_party import serialize_dataframe
+from syft.service.settings.settings import ServerSettings
+from syft.service.user.user import User
+from syft.types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+from syft.types.syft_object_registry import SyftObjectRegistry
+
+
+def _split(data: bytes, chunk_size: int) -> list[bytes]:
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+def test_combine_bytes_single_chunk_is_not_copied():
+    chunk = b"x" * 100
+    assert combine_bytes([]) == b""
+    assert combine_bytes([chunk]) is chunk
+
+
+def test_combine_bytes_multiple_chunks():
+    data = bytes(range(256)) * 10
+    combined = combine_bytes(_split(data, 300))
+    assert isinstance(combined, bytearray)
+    assert combined == data
+
+
+def test_deserialize_reassembled_chunks():
+    array = np.arange(1000, dtype=np.float64)
+    df = pd.DataFrame({"a": range(100), "b": [str(i) for i in range(100)]})
+
+    array_blob = combine_bytes(_split(numpy_serialize(array), 1000))
+    assert (numpy_deserialize(array_blob) == array).all()
+
+    df_blob = combine_bytes(_split(serialize_dataframe(df), 1000))
+    assert deserialize_dataframe(df_blob).equals(df)
+
+    blob = combine_bytes(_split(sy.serialize(b"abc" * 1000, to_bytes=True), 1000))
+    deser = sy.deserialize(blob, from_bytes=True)
+    assert isinstance(deser, bytes)
+    assert deser == b"abc" * 1000
+
+
+def test_string_array_serde():
+    array = np.array([["a", "bb", ""], ["héllo", "日本", "c"]])
+
+    blob = sy.serialize(array, to_bytes=True)
+    result = sy.deserialize(blob, from_bytes=True)
+    assert result.shape == array.shape
+    assert (result == array).all()
+
+    # arrays written with the version 1 codec are still readable
+    result = numpy_deserialize(numpy_serialize_v1(array))
+    assert (result == array).all()
+
+
+def test_serialize_to_file():
+    obj = {"array": np.arange(100), "text": "x" * 10_000, "items": list(range(100))}
+
+    with io.BytesIO() as fp:
+        sy.serialize(obj, to_file=fp)
+        sy.serialize(obj, to_file=fp)
+        assert fp.getvalue() == sy.serialize(obj, to_bytes=True) * 2
+
+        fp.seek(0)
+        for _ in range(2):
+            result = sy.deserialize(from_file=fp)
+            assert (result["array"] == obj["array"]).all()
+            assert result["text"] == obj["text"]
+            assert result["items"] == obj["items"]
+
+
+def test_deserialize_from_socket():
+    obj = {"array": np.arange(100), "text": "x" * 10_000}
+    left, right = socket.socketpair()
+    with left, right, left.makefile("wb") as writer, right.makefile("rb") as reader:
+        sy.serialize(obj, to_file=writer)
+        writer.flush()
+        result = sy.deserialize(from_file=reader)
+    assert (result["array"] == obj["array"]).all()
+    assert result["text"] == obj["text"]
+
+
+def test_serde_plan_fields():
+    serde_plan = SyftObjectRegistry.get_serde_properties(
+        User.__canonical_name__, User.__version__
+    )[10]
+    user = User(email="info@openmined.org", name="test")
+
+    assert serde_plan.fields == tuple(sorted(serde_plan.fields))
+    assert serde_plan.encode_fields(user, for_hashing=False) is serde_plan.fields
+    hash_fields = serde_plan.encode_fields(user, for_hashing=True)
+    assert hash_fields is serde_plan.encode_fields(user, for_hashing=True)
+    assert not set(hash_fields) & set(DYNAMIC_SYFT_ATTRIBUTES)
+
+
+def test_trusted_deserialization():
+    users = [User(email=f"user{i}@openmined.org", name=str(i)) for i in range(10)]
+    blob = sy.serialize(users, to_bytes=True)
+
+    validated = sy.deserialize(blob, from_bytes=True)
+    trusted = sy.deserialize(blob, from_bytes=True, trusted=True)
+    assert trusted == validated == users
+    for a, b in zip(trusted, validated):
+        assert a.__dict__ == b.__dict__
+        assert a.model_fields_set == b.model_fields_set
+
+    assert _can_model_construct(User, tuple(User.model_fields))
+    # classes with their own validators are always constructed with validation
+    assert not _can_model_construct(ServerSettings, tuple(ServerSettings.model_fields))
@@ -8,6 +8,7 @@ from pydantic import BaseModel
 # syft absolute
 import syft as sy
 from syft.serde.serializable import serializable
+from syft.util.experimental_flags import flags
 
 
 def get_fqn_for_class(cls):
@@ -350,3 +351,52 @@ def test_pydantic_derived_only():
     assert (data.uid, data.value, data.flag) != (de.uid, de.value, de.flag)
     assert (de.uid, de.value, de.flag) == (None, None, None)
     assert (data.source, data.target) == (de.source, de.target)
+
+
+# ------------------------------ Inline nested serde ------------------------------
+
+
+@serializable(
+    canonical_name="PydNested",
+    version=1,
+)
+class PydNested(BaseModel):
+    """Serialize: name, base, child"""
+
+    name: str
+    base: PydBase | None = None
+    child: "PydNested | None" = None
+
+
+def _nested_chain(depth: int) -> PydNested:
+    node = None
+    for i in range(depth):
+        node = PydNested(
+            name=f"node_{i}", base=PydBase(uid=str(i), value=i), child=node
+        )
+    return node
+
+
+def test_inline_nested_roundtrip(monkeypatch):
+    data = _nested_chain(depth=100)
+
+    monkeypatch.setattr(flags, "_INLINE_NESTED_SERDE", False)
+    legacy = sy.serialize(data, to_bytes=True)
+    monkeypatch.setattr(flags, "_INLINE_NESTED_SERDE", True)
+    inline = sy.serialize(data, to_bytes=True)
+
+    assert legacy != inline
+    # readers understand both layouts regardless of the flag
+    assert sy.deserialize(inline, from_bytes=True) == data
+    assert sy.deserialize(legacy, from_bytes=True) == data
+
+
+def test_inline_nested_not_used_for_hashing(monkeypatch):
+    data = _nested_chain(depth=3)
+
+    monkeypatch.setattr(flags, "_INLINE_NESTED_SERDE", False)
+    legacy = sy.serialize(data, to_bytes=True, for_hashing=True)
+    monkeypatch.setattr(flags, "_INLINE_NESTED_SERDE", True)
+    inline = sy.serialize(data, to_bytes=True, for_hashing=True)
+
+    assert legacy == inline
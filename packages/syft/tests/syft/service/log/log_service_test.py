@@ -0,0 +1,80 @@
+# stdlib
+from secrets import token_hex
+from time import sleep
+
+# syft absolute
+import syft as sy
+from syft.service.context import AuthedServiceContext
+from syft.service.log import log_stash
+from syft.service.log.log_service import LogBuffer
+from syft.types.uid import UID
+
+
+def get_auth_ctx(worker):
+    return AuthedServiceContext(
+        server=worker, credentials=worker.signing_key.verify_key
+    )
+
+
+def test_log_append_chunks(worker, monkeypatch) -> None:
+    # read the tail in several batches
+    monkeypatch.setattr(log_stash, "LOG_TAIL_BATCH_SIZE", 2)
+    context = get_auth_ctx(worker)
+    service = worker.services.log
+    log_id = UID()
+    service.add(context, log_id, UID(), stdout="first line\n")
+
+    for i in range(5):
+        service.append(context, log_id, new_str=f"line {i}\n")
+    service.append(context, log_id, new_err="error\n")
+
+    log = service.get(context, log_id)
+    assert log.stdout == "first line\n" + "".join(f"line {i}\n" for i in range(5))
+    assert log.stderr == "error\n"
+    assert service.get_stdout(context, log_id, tail=2) == "line 3\nline 4\n"
+    assert service.get_stdout(context, log_id, tail=10) == log.stdout
+
+    # appending does not rewrite the stored log
+    stored = service.stash.get_by_uid(context.credentials, log_id).unwrap()
+    assert stored.stdout == "first line\n"
+
+    service.restart(context, log_id)
+    log = service.get(context, log_id)
+    assert log.stdout == ""
+    assert log.stderr == ""
+
+
+def test_log_buffer(worker) -> None:
+    context = get_auth_ctx(worker)
+    service = worker.services.log
+    log_id = UID()
+    service.add(context, log_id, UID())
+
+    buffer = LogBuffer(context, log_id, flush_size=10, flush_interval=60)
+    buffer.write("abc\n")
+    assert service.get_stdout(context, log_id) == ""
+
+    # flushed once the buffer is full, and when the job is done
+    buffer.write("defgh\n")
+    assert service.get_stdout(context, log_id) == "abc\ndefgh\n"
+    buffer.write("ijk\n")
+    buffer.flush()
+    assert service.get_stdout(context, log_id) == "abc\ndefgh\nijk\n"
+
+
+def test_log_buffer_flush_interval(tmp_path) -> None:
+    # the timer flushes from another thread, which needs a database shared between
+    # connections
+    worker = sy.Worker.named(
+        name=token_hex(8), db_url=f"sqlite:///{tmp_path / 'syft.db'}"
+    )
+    context = get_auth_ctx(worker)
+    service = worker.services.log
+    log_id = UID()
+    service.add(context, log_id, UID())
+
+    buffer = LogBuffer(context, log_id, flush_interval=0.1)
+    buffer.write("abc\n")
+    sleep(1)
+    assert service.get_stdout(context, log_id) == "abc\n"
+    worker.cleanup()
@@ -146,3 +146,29 @@ def test_action_store_test_dataset_get(stash: ActionObjectStash) -> None:
     stash.delete_by_uid(client_key, data_uid)
     res = stash.get(data_uid, client_key)
     assert res.is_err()
+
+
+@pytest.mark.parametrize(
+    "stash",
+    [
+        pytest.lazy_fixture("action_object_stash"),
+    ],
+)
+def test_action_store_get_unresolved_ids(stash: ActionObjectStash) -> None:
+    root_key = stash.root_verify_key
+    resolved_uid = add_test_object(stash, root_key)
+
+    unresolved = ActionObject.empty()
+    unresolved.syft_resolved = False
+    stash.set_or_update(
+        uid=unresolved.id, credentials=root_key, syft_object=unresolved
+    ).unwrap()
+
+    uids = [resolved_uid, unresolved.id, UID()]
+    assert stash.get_unresolved_ids(root_key, uids=uids).unwrap() == {unresolved.id.id}
+
+    unresolved.syft_resolved = True
+    stash.set_or_update(
+        uid=unresolved.id, credentials=root_key, syft_object=unresolved
+    ).unwrap()
+    assert stash.get_unresolved_ids(root_key, uids=uids).unwrap() == set()
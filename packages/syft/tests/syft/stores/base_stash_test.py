@@ -1,6 +1,7 @@
 # stdlib
 from collections.abc import Callable
 from collections.abc import Container
+import json
 import random
 import threading
 from typing import Any
@@ -9,12 +10,15 @@ from typing import TypeVar
 # third party
 from faker import Faker
 import pytest
+import sqlalchemy as sa
 from typing_extensions import ParamSpec
 
 # syft absolute
 from syft.serde.serializable import serializable
 from syft.server.credentials import SyftSigningKey
 from syft.server.credentials import SyftVerifyKey
+from syft.service.action.action_permissions import ActionObjectPermission
+from syft.service.action.action_permissions import ActionPermission
 from syft.service.queue.queue_stash import Status
 from syft.service.request.request_service import RequestService
 from syft.store.db.sqlite import SQLiteDBConfig
@@ -122,6 +126,32 @@ def test_basestash_set(
     assert result == mock_object
 
 
+def test_basestash_set_returning(
+    root_verify_key, base_stash: MockStash, mock_object: MockObject
+) -> None:
+    result = base_stash.set(root_verify_key, mock_object).unwrap()
+    assert result is mock_object
+
+    other = MockObject(**{**mock_object.to_dict(), "id": UID(), "name": "other"})
+    result = base_stash.set(root_verify_key, other, returning=True).unwrap()
+    assert result is not other
+    assert result == other
+
+
+def test_basestash_set_ignore_duplicates(
+    root_verify_key, base_stash: MockStash, mock_object: MockObject
+) -> None:
+    base_stash.set(root_verify_key, mock_object).unwrap()
+
+    duplicate = mock_object.copy()
+    duplicate.desc = "changed"
+    result = base_stash.set(root_verify_key, duplicate, ignore_duplicates=True)
+    assert result.unwrap() is duplicate
+
+    stored = base_stash.get_by_uid(root_verify_key, mock_object.id).unwrap()
+    assert stored.desc == mock_object.desc
+
+
 def test_basestash_set_duplicate(
     root_verify_key, base_stash: MockStash, faker: Faker
 ) -> None:
@@ -191,6 +221,11 @@ def test_basestash_update(
     retrieved = result.ok()
     assert retrieved == updated_obj
 
+    updated_obj.name = faker.name()
+    retrieved = base_stash.update(root_verify_key, updated_obj, returning=True).unwrap()
+    assert retrieved is not updated_obj
+    assert retrieved == updated_obj
+
 
 def test_basestash_upsert(
     root_verify_key, base_stash: MockStash, mock_object: MockObject, faker: Faker
@@ -246,6 +281,132 @@ def test_basestash_set_get_all(
     assert stored_objects_values == mock_objects_values
 
 
+def test_basestash_set_many(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject], faker
+) -> None:
+    created = base_stash.set_many(root_verify_key, mock_objects).unwrap()
+    assert created == mock_objects
+
+    uids = [obj.id for obj in reversed(mock_objects)] + [UID()]
+    stored_objects = base_stash.get_by_uids(root_verify_key, uids).unwrap()
+    assert stored_objects == list(reversed(mock_objects))
+
+    # duplicate uid and duplicate unique name
+    duplicates = [
+        MockObject(**{**mock_objects[0].to_dict(), "name": faker.name()}),
+        MockObject(**object_kwargs(faker, name=mock_objects[1].name)),
+    ]
+    new_object = MockObject(**object_kwargs(faker))
+    for duplicate in duplicates:
+        with pytest.raises(StashException):
+            base_stash.set_many(root_verify_key, [new_object, duplicate]).unwrap()
+    assert len(base_stash) == len(mock_objects)
+
+    created = base_stash.set_many(
+        root_verify_key, [new_object, *duplicates], ignore_duplicates=True
+    ).unwrap()
+    assert created == [new_object]
+    assert len(base_stash) == len(mock_objects) + 1
+
+
+def test_basestash_update_many(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject], faker
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects).unwrap()
+
+    for obj in mock_objects:
+        obj.desc = random_sentence(faker)
+    base_stash.update_many(root_verify_key, mock_objects).unwrap()
+
+    stored_objects = base_stash.get_by_uids(
+        root_verify_key, [obj.id for obj in mock_objects]
+    ).unwrap()
+    assert [obj.desc for obj in stored_objects] == [obj.desc for obj in mock_objects]
+
+    missing = MockObject(**object_kwargs(faker))
+    result = base_stash.update_many(root_verify_key, [mock_objects[0], missing])
+    assert isinstance(result.err(), NotFoundException)
+
+    mock_objects[0].name = mock_objects[1].name
+    result = base_stash.update_many(root_verify_key, mock_objects[:1])
+    assert result.is_err()
+
+
+def test_basestash_add_permissions(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects).unwrap()
+    guest_verify_key = SyftSigningKey.generate().verify_key
+    readable = mock_objects[:5]
+
+    base_stash.add_permissions(
+        [
+            ActionObjectPermission(
+                uid=obj.id,
+                credentials=guest_verify_key,
+                permission=ActionPermission.READ,
+            )
+            for obj in readable
+        ]
+    ).unwrap()
+
+    stored_objects = base_stash.get_by_uids(
+        guest_verify_key, [obj.id for obj in mock_objects]
+    ).unwrap()
+    assert stored_objects == readable
+
+    missing_permission = ActionObjectPermission(
+        uid=UID(), credentials=guest_verify_key, permission=ActionPermission.READ
+    )
+    assert base_stash.add_permissions([missing_permission]).is_err()
+    base_stash.add_permissions([missing_permission], ignore_missing=True).unwrap()
+
+
+def test_basestash_permission_table(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects).unwrap()
+    guest_verify_key = SyftSigningKey.generate().verify_key
+
+    def read(obj: MockObject) -> ActionObjectPermission:
+        return ActionObjectPermission(
+            uid=obj.id, credentials=guest_verify_key, permission=ActionPermission.READ
+        )
+
+    public = ActionObjectPermission(
+        uid=mock_objects[0].id, permission=ActionPermission.ALL_READ
+    )
+    base_stash.add_permission(public).unwrap()
+    base_stash.add_permission(read(mock_objects[1])).unwrap()
+    base_stash.add_permission(read(mock_objects[1])).unwrap()
+
+    assert base_stash.has_permissions([read(obj) for obj in mock_objects[:2]])
+    assert not base_stash.has_permissions([read(obj) for obj in mock_objects[:3]])
+    readable = base_stash.get_all(guest_verify_key).unwrap()
+    assert {obj.id for obj in readable} == {obj.id for obj in mock_objects[:2]}
+    assert base_stash._get_permissions_for_uid(mock_objects[0].id).unwrap() == set(
+        base_stash.get_ownership_permissions(mock_objects[0].id, root_verify_key)
+        + ["ALL_READ"]
+    )
+
+    base_stash.remove_permission(read(mock_objects[1]))
+    assert not base_stash.has_permission(read(mock_objects[1]))
+    assert base_stash.get_all(guest_verify_key).unwrap() == mock_objects[:1]
+
+    base_stash.delete_by_uid(root_verify_key, mock_objects[0].id).unwrap()
+    all_permissions = base_stash.get_all_permissions().unwrap()
+    assert mock_objects[0].id not in all_permissions
+    assert all_permissions[mock_objects[1].id] == set(
+        base_stash.get_ownership_permissions(mock_objects[1].id, root_verify_key)
+    )
+    with base_stash.sessionmaker() as session:
+        permission_table = base_stash.permission_table
+        stmt = sa.select(sa.func.count()).where(
+            permission_table.c.object_id == mock_objects[0].id
+        )
+        assert session.execute(stmt).scalar() == 0
+
+
 def test_basestash_get_by_uid(
     root_verify_key, base_stash: MockStash, mock_object: MockObject
 ) -> None:
@@ -437,6 +598,91 @@ def test_basestash_query_all_kwargs_multiple_params(
     assert objects[0] == obj
 
 
+def test_basestash_count(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    base_stash.set_many(root_verify_key, mock_objects).unwrap()
+
+    assert base_stash.count(root_verify_key).unwrap() == len(mock_objects)
+
+    importance = mock_objects[0].importance
+    n_same = sum(1 for obj in mock_objects if obj.importance == importance)
+    count = base_stash.count(
+        root_verify_key, filters={"importance": importance}
+    ).unwrap()
+    assert count == n_same
+
+    # other users only count the objects they can read
+    other_verify_key = SyftSigningKey.generate().verify_key
+    assert base_stash.count(other_verify_key).unwrap() == 0
+
+    # pages of get_all cover all objects exactly once
+    page_size = 3
+    pages = [
+        base_stash.get_all(
+            root_verify_key, order_by="name", limit=page_size, offset=offset
+        ).unwrap()
+        for offset in range(0, len(mock_objects), page_size)
+    ]
+    assert all(len(page) <= page_size for page in pages)
+    assert [obj.id for page in pages for obj in page] == [
+        obj.id for obj in sorted(mock_objects, key=lambda obj: obj.name)
+    ]
+
+
+def test_basestash_query_icontains(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    mock_objects[0].name = "Dataset 100% Match_1"
+    mock_objects[1].name = "another dataset"
+    base_stash.set_many(root_verify_key, mock_objects).unwrap()
+
+    objects = base_stash.get_all(
+        root_verify_key, filters={"name__icontains": "DATASET"}
+    ).unwrap()
+    assert {obj.id for obj in objects} == {mock_objects[0].id, mock_objects[1].id}
+
+    # LIKE wildcards in the search term are matched literally
+    objects = base_stash.get_all(
+        root_verify_key, filters={"name__icontains": "100% match_"}
+    ).unwrap()
+    assert [obj.id for obj in objects] == [mock_objects[0].id]
+
+    objects = base_stash.get_all(
+        root_verify_key, filters={"name__icontains": "%"}
+    ).unwrap()
+    assert [obj.id for obj in objects] == [mock_objects[0].id]
+
+    # fields without a generated column are searched in the json document
+    count = base_stash.count(
+        root_verify_key, filters={"desc__icontains": mock_objects[2].desc.upper()}
+    ).unwrap()
+    assert count >= 1
+
+
+def test_basestash_query_linked_obj_in(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    for obj in mock_objects:
+        obj.linked_obj = LinkedObject(
+            object_type=MockObject,
+            object_uid=UID(),
+            id=UID(),
+            server_uid=UID(),
+            service_type=RequestService,
+        )
+    base_stash.set_many(root_verify_key, mock_objects).unwrap()
+
+    expected = mock_objects[:3]
+    objects = base_stash.get_all(
+        root_verify_key,
+        filters={
+            "linked_obj.object_uid__in": [obj.linked_obj.object_uid for obj in expected]
+        },
+    ).unwrap()
+    assert {obj.id for obj in objects} == {obj.id for obj in expected}
+
+
 def test_stash_thread_support(
     root_verify_key, base_stash: MockStash, mock_object: MockObject
 ) -> None:
@@ -447,3 +693,95 @@ def test_stash_thread_support(
 
     result = base_stash.get_by_uid(root_verify_key, mock_object.id).unwrap()
     assert result == mock_object
+
+
+def test_basestash_attr_columns(
+    root_verify_key, base_stash: MockStash, mock_objects: list[MockObject]
+) -> None:
+    columns = base_stash.table.c
+    assert "_attr_name" in columns and "_attr_importance" in columns
+    # non-scalar attributes stay in the JSON
+    assert "_attr_linked_obj" not in columns
+
+    base_stash.set_many(root_verify_key, mock_objects).unwrap()
+    obj = mock_objects[3]
+    stmt = base_stash.query().filter("name", "eq", obj.name).stmt
+    with base_stash.db.engine.connect() as connection:
+        plan = connection.execute(
+            sa.text(
+                f"EXPLAIN QUERY PLAN {stmt.compile(compile_kwargs={'literal_binds': True})}"
+            )
+        ).all()
+    assert "ix_base_stash_mock_object_type__attr_name" in str(plan)
+
+
+def test_basestash_migrate_attr_columns(
+    root_verify_key, mock_objects: list[MockObject], tmp_path
+) -> None:
+    config = SQLiteDBConfig(path=tmp_path)
+    db_manager = SQLiteDBManager(config, UID(), root_verify_key)
+    stash = MockStash(store=db_manager)
+    db_manager.init_tables()
+    stash.set_many(root_verify_key, mock_objects).unwrap()
+
+    # drop the generated columns, like a table created by an older schema
+    with db_manager.engine.begin() as connection:
+        for column in stash.table.c:
+            if column.name.startswith("_attr_"):
+                connection.execute(
+                    sa.text(f'DROP INDEX "ix_{stash.table.name}_{column.name}"')
+                )
+                connection.execute(
+                    sa.text(
+                        f'ALTER TABLE "{stash.table.name}" DROP COLUMN {column.name}'
+                    )
+                )
+
+    db_manager = SQLiteDBManager(config, UID(), root_verify_key)
+    db_manager.init_tables()
+    stash = MockStash(store=db_manager)
+
+    obj = mock_objects[3]
+    assert stash.get_one(root_verify_key, filters={"name": obj.name}).unwrap() == obj
+    assert stash.is_unique(mock_objects[4])
+
+
+def test_basestash_migrate_permissions(
+    root_verify_key, mock_objects: list[MockObject], tmp_path
+) -> None:
+    config = SQLiteDBConfig(path=tmp_path)
+    db_manager = SQLiteDBManager(config, UID(), root_verify_key)
+    stash = MockStash(store=db_manager)
+    db_manager.init_tables()
+    stash.set_many(root_verify_key, mock_objects).unwrap()
+    public = ActionObjectPermission(
+        uid=mock_objects[0].id, permission=ActionPermission.ALL_READ
+    )
+    stash.add_permission(public).unwrap()
+    permissions = stash.get_all_permissions().unwrap()
+
+    # move the permissions to a JSON column, like a table created by an older schema
+    with db_manager.engine.begin() as connection:
+        connection.execute(
+            sa.text(f'ALTER TABLE "{stash.table.name}" ADD COLUMN permissions JSON')
+        )
+        for uid, permission_strings in permissions.items():
+            connection.execute(
+                sa.text(
+                    f'UPDATE "{stash.table.name}" SET permissions = :permissions '
+                    "WHERE id = :id"
+                ),
+                {
+                    "permissions": json.dumps(list(permission_strings)),
+                    "id": uid.no_dash,
+                },
+            )
+        connection.execute(sa.text(f'DROP TABLE "{stash.permission_table.name}"'))
+
+    db_manager = SQLiteDBManager(config, UID(), root_verify_key)
+    db_manager.init_tables()
+    stash = MockStash(store=db_manager)
+
+    assert stash.get_all_permissions().unwrap() == permissions
+    guest_verify_key = SyftSigningKey.generate().verify_key
+    assert stash.get_all(guest_verify_key).unwrap() == mock_objects[:1]
@@ -7,6 +7,7 @@ import pytest
 # syft absolute
 from syft.service.queue.queue_stash import QueueItem
 from syft.service.queue.queue_stash import QueueStash
+from syft.service.queue.queue_stash import Status
 from syft.service.worker.worker_pool import WorkerPool
 from syft.service.worker.worker_pool_service import SyftWorkerPoolService
 from syft.store.linked_obj import LinkedObject
@@ -284,3 +285,35 @@ def test_queue_delete_threading(queue_stash: QueueStash):
         assert all(res.is_ok() for res in results), "Error occurred during execution"
 
     assert len(queue_stash) == 0
+
+
+def test_queue_claim_threading(queue_stash: QueueStash):
+    root_verify_key = queue_stash.db.root_verify_key
+    config = queue_stash.db.config
+    server_uid = queue_stash.db.server_uid
+    obj = mock_queue_object()
+    queue_stash.set(root_verify_key, obj).unwrap()
+
+    def claim_in_new_thread(_):
+        queue_stash = QueueStash.random(
+            root_verify_key=root_verify_key,
+            config=config,
+            server_uid=server_uid,
+        )
+        item = queue_stash.get_by_uid(root_verify_key, uid=obj.id).unwrap()
+        return queue_stash.claim(root_verify_key, item)
+
+    total_repeats = 10
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(claim_in_new_thread, range(total_repeats)))
+
+    assert all(res.is_ok() for res in results), "Error occurred during execution"
+    # only one producer can claim a queue item
+    assert sum(res.unwrap() for res in results) == 1
+
+    item = queue_stash.get_by_uid(root_verify_key, uid=obj.id).unwrap()
+    assert item.status == Status.PROCESSING
+    assert queue_stash.get_by_status(root_verify_key, Status.CREATED).unwrap() == []
+    assert queue_stash.get_by_status(
+        root_verify_key, Status.PROCESSING, uids=[obj.id]
+    ).unwrap() == [item]
@@ -219,3 +219,25 @@ def test_userstash_update(
     updated_user = result.ok()
     assert isinstance(updated_user, User)
     assert user == updated_user
+
+
+def test_userstash_get_role_cache(
+    root_datasite_client, user_stash: UserStash, guest_user: User
+) -> None:
+    root_verify_key = root_datasite_client.credentials.verify_key
+    guest_user.role = ServiceRole.DATA_SCIENTIST
+    user = add_mock_user(root_datasite_client, user_stash, guest_user)
+    assert user_stash.get_role(user.verify_key) == ServiceRole.DATA_SCIENTIST
+
+    # the cached role is used until it is invalidated
+    user.role = ServiceRole.DATA_OWNER
+    user_stash.update(root_verify_key, obj=user).unwrap()
+    assert user_stash.get_role(user.verify_key) == ServiceRole.DATA_SCIENTIST
+
+    user_stash.db.invalidate_role(user.verify_key)
+    assert user_stash.get_role(user.verify_key) == ServiceRole.DATA_OWNER
+
+    # unknown users are not cached
+    unknown_verify_key = SyftSigningKey.generate().verify_key
+    assert user_stash.get_role(unknown_verify_key) == ServiceRole.GUEST
+    assert unknown_verify_key not in user_stash.db.role_cache
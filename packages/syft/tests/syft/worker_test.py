@@ -368,3 +368,24 @@ def test_worker_handle_api_response(
         assert isinstance(result, QueueItem)
     else:
         assert not isinstance(result, SyftError)
+
+
+def test_worker_handle_api_calls(worker: Worker) -> None:
+    root_client = worker.root_client
+    api_calls = [
+        SyftAPICall(server_uid=worker.id, path=path, args=[], kwargs={}, blocking=True)
+        for path in ["user.get_all", "dataset.get_all"]
+    ]
+    signed_api_calls = [call.sign(root_client.credentials) for call in api_calls]
+
+    # an altered request fails without failing the calls after it
+    signed_api_calls[0].serialized_message += b"hacked"
+    signed_results = worker.handle_api_calls(signed_api_calls)
+    assert all(isinstance(result, SignedSyftAPICall) for result in signed_results)
+    assert isinstance(signed_results[0].message.data, SyftError)
+    assert not isinstance(signed_results[1].message.data, SyftError)
+
+    # the api makes the calls in one batch, results are in the order of the calls
+    users, datasets = root_client.api.make_calls(api_calls)
+    assert len(users.value) == 1
+    assert len(datasets.value) == 0
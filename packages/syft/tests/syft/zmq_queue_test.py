@@ -16,10 +16,14 @@ from syft.service.queue.queue import QueueManager
 from syft.service.queue.zmq_client import ZMQClient
 from syft.service.queue.zmq_client import ZMQClientConfig
 from syft.service.queue.zmq_client import ZMQQueueConfig
+from syft.service.queue.zmq_common import QueuePriority
+from syft.service.queue.zmq_common import ZMQCommand
 from syft.service.queue.zmq_consumer import ZMQConsumer
 from syft.service.queue.zmq_producer import ZMQProducer
 from syft.service.response import SyftSuccess
 from syft.types.errors import SyftException
+from syft.types.uid import LineageID
+from syft.types.uid import UID
 from syft.util.util import get_queue_address
 from syft.util.util import get_random_available_port
 
@@ -150,6 +154,70 @@ def consumer(producer):
     del consumer
 
 
+def test_zmq_producer_dependency_index(producer) -> None:
+    item_a, item_b = UID(), UID()
+    obj_1, obj_2 = UID(), UID()
+
+    producer.block(item_a, {obj_1})
+    producer.block(item_b, {obj_1, obj_2})
+
+    # only the items that wait on a resolved object are woken
+    assert producer.unblock({obj_2}) == {item_b}
+    assert producer._blocked == {item_a: {obj_1}}
+    assert dict(producer._dependents) == {obj_1: {item_a}}
+
+    producer.block(item_b, {obj_1})
+    producer.unblock_items({item_a})
+    assert producer.unblock({obj_1}) == {item_b}
+    assert not producer._blocked
+    assert not producer._dependents
+
+    # resolved notifications are picked up by the queue thread
+    producer.notify_resolved(LineageID(obj_1))
+    assert producer._resolved == {obj_1}
+    assert producer._notified.is_set()
+
+
+def test_zmq_producer_prefetch_dispatch(producer) -> None:
+    sent = []
+    producer.send_to_worker = lambda worker, command, msg=None: sent.append(
+        (worker.address, msg)
+    )
+    service_name = token_hex(8)
+
+    # two workers with a credit window of two requests each
+    for address in (b"w1", b"w2"):
+        producer.process_worker(
+            address,
+            ZMQCommand.W_READY,
+            [service_name.encode(), str(UID()).encode(), b"2"],
+        )
+    service = producer.services[service_name]
+    for msg in (b"n1", b"n2", b"n3", b"n4", b"n5"):
+        service.push(msg)
+    service.push(b"h1", QueuePriority.HIGH)
+
+    # high priority first, workers take turns and stop when out of credit
+    producer.dispatch(service, None)
+    assert sent == [(b"w1", b"h1"), (b"w2", b"n1"), (b"w1", b"n2"), (b"w2", b"n3")]
+    assert not producer.waiting
+    assert not service.waiting
+
+    # a reply frees one credit of the worker
+    sent.clear()
+    producer.process_worker(b"w2", ZMQCommand.W_REPLY, [])
+    assert sent == [(b"w2", b"n4")]
+
+    # the prefetched requests of a deleted worker are dispatched again
+    sent.clear()
+    worker = producer.require_worker(b"w2")
+    producer.delete_worker(worker, False)
+    assert not worker.in_flight
+    producer.process_worker(b"w1", ZMQCommand.W_REPLY, [])
+    producer.process_worker(b"w1", ZMQCommand.W_REPLY, [])
+    assert sent == [(b"w1", b"n4"), (b"w1", b"n5")]
+
+
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
 @pytest.mark.skipif(sys.platform == "win32", reason="does not run on windows")
 def test_zmq_pub_sub(faker: Faker, producer, consumer):